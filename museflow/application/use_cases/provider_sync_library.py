@@ -1,20 +1,27 @@
+import asyncio
 import logging
+from collections import Counter
+from collections.abc import AsyncIterator
 from collections.abc import Awaitable
 from collections.abc import Callable
 from dataclasses import dataclass
 from dataclasses import field
-from dataclasses import replace
 from typing import Any
 
+from museflow.domain.entities.music import Playlist
+from museflow.domain.entities.music import Track
 from museflow.domain.entities.user import User
 from museflow.domain.ports.providers.library import ProviderLibraryPort
 from museflow.domain.ports.repositories.music import ArtistRepository
+from museflow.domain.ports.repositories.music import PlaylistSnapshotRepository
 from museflow.domain.ports.repositories.music import TrackRepository
 
 logger = logging.getLogger(__name__)
 
+type ProgressCallback = Callable[[str, int], None]
 
-@dataclass(frozen=True, kw_only=True)
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SyncReport:
     """Reports the outcome of a library synchronization operation.
 
@@ -38,7 +45,7 @@ class SyncReport:
         return len(self.errors) > 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SyncConfig:
     """Configuration for a library synchronization operation.
 
@@ -62,27 +69,37 @@ class SyncConfig:
 
     def has_purge(self) -> bool:
         return any(
-            [
+            (
                 self.purge_all,
                 self.purge_artist_top,
                 self.purge_track_top,
                 self.purge_track_saved,
                 self.purge_track_playlist,
-            ],
+            ),
         )
 
     def has_sync(self) -> bool:
         return any(
-            [
+            (
                 self.sync_all,
                 self.sync_artist_top,
                 self.sync_track_top,
                 self.sync_track_saved,
                 self.sync_track_playlist,
-            ]
+            )
         )
 
 
+@dataclass(frozen=True, kw_only=True)
+class _SyncStage[T]:
+    report_field_created: str
+    report_field_updated: str
+    entity_name: str
+    fetch_func: Callable[[], AsyncIterator[list[T]]]
+    upsert_func: Callable[[list[T]], Awaitable[tuple[list[Any], int]]]
+    complete_func: Callable[[], Awaitable[None]] | None = None
+
+
 class ProviderSyncLibraryUseCase:
     """Synchronizes a user's music library with a music provider.
 
@@ -97,23 +114,39 @@ class ProviderSyncLibraryUseCase:
         provider_library: ProviderLibraryPort,
         artist_repository: ArtistRepository,
         track_repository: TrackRepository,
+        playlist_snapshot_repository: PlaylistSnapshotRepository,
     ) -> None:
         self._provider_library = provider_library
         self._artist_repository = artist_repository
         self._track_repository = track_repository
+        self._playlist_snapshot_repository = playlist_snapshot_repository
 
     async def execute(
         self,
         user: User,
         config: SyncConfig,
+        progress_callback: ProgressCallback | None = None,
     ) -> SyncReport:
-        report = SyncReport()
+        """Runs the synchronization.
+
+        Args:
+            user: The user whose library is synchronized.
+            config: What to purge and synchronize.
+            progress_callback: Called with the stage name and the number of items after each fetched page.
+
+        Returns:
+            The report of the synchronization.
+        """
+        # Accumulate the report's counters and errors, and only build the (frozen) report at the end.
+        counters: Counter[str] = Counter()
+        errors: list[str] = []
 
         # First of all, purge items if required.
         if config.has_purge():
             if config.purge_all or config.purge_artist_top:
-                report = await self._purge_entity(
-                    report=report,
+                await self._purge_entity(
+                    counters=counters,
+                    errors=errors,
                     report_field_purge="purge_artist",
                     user=user,
                     entity_name="artists",
@@ -121,150 +154,268 @@ class ProviderSyncLibraryUseCase:
                 )
 
             if config.purge_all or config.purge_track_top or config.purge_track_saved or config.purge_track_playlist:
-                report = await self._purge_entity(
-                    report=report,
+                await self._purge_entity(
+                    counters=counters,
+                    errors=errors,
                     report_field_purge="purge_track",
                     user=user,
                     entity_name="tracks",
-                    purge_callback=lambda: self._track_repository.purge(
-                        user_id=user.id,
-                        is_top=config.purge_track_top and not config.purge_all,
-                        is_saved=config.purge_track_saved and not config.purge_all,
-                        is_playlist=config.purge_track_playlist and not config.purge_all,
-                    ),
+                    purge_callback=lambda: self._purge_tracks(user, config),
                 )
 
-            if report.has_errors:
-                return report
+            if errors:
+                return SyncReport(**counters, errors=errors)
+
+        stages: list[_SyncStage[Any]] = []
 
         # Then fetch and upsert top artists.
         if config.sync_all or config.sync_artist_top:
-            report = await self._sync_entity(
-                report=report,
-                report_field_created="artist_created",
-                report_field_updated="artist_updated",
-                user=user,
-                entity_name="top artists",
-                fetch_func=lambda: self._provider_library.get_top_artists(
-                    page_size=config.page_size,
-                    time_range=config.time_range,
-                ),
-                upsert_func=lambda items: self._artist_repository.bulk_upsert(
-                    artists=items,
-                    batch_size=config.batch_size,
-                ),
+            stages.append(
+                _SyncStage(
+                    report_field_created="artist_created",
+                    report_field_updated="artist_updated",
+                    entity_name="top artists",
+                    fetch_func=lambda: self._provider_library.iter_top_artists(
+                        page_size=config.page_size,
+                        time_range=config.time_range,
+                    ),
+                    upsert_func=lambda items: self._artist_repository.bulk_upsert(
+                        artists=items,
+                        batch_size=config.batch_size,
+                    ),
+                )
             )
 
         # Then fetch and upsert top tracks.
         if config.sync_all or config.sync_track_top:
-            report = await self._sync_entity(
-                report=report,
-                report_field_created="track_created",
-                report_field_updated="track_updated",
-                user=user,
-                entity_name="top tracks",
-                fetch_func=lambda: self._provider_library.get_top_tracks(
-                    page_size=config.page_size,
-                    time_range=config.time_range,
-                ),
-                upsert_func=lambda items: self._track_repository.bulk_upsert(
-                    tracks=items,
-                    batch_size=config.batch_size,
-                ),
+            stages.append(
+                _SyncStage(
+                    report_field_created="track_created",
+                    report_field_updated="track_updated",
+                    entity_name="top tracks",
+                    fetch_func=lambda: self._provider_library.iter_top_tracks(
+                        page_size=config.page_size,
+                        time_range=config.time_range,
+                    ),
+                    upsert_func=lambda items: self._track_repository.bulk_upsert(
+                        tracks=items,
+                        batch_size=config.batch_size,
+                    ),
+                )
             )
 
         # Then fetch and upsert saved tracks.
         if config.sync_all or config.sync_track_saved:
-            report = await self._sync_entity(
-                report=report,
-                report_field_created="track_created",
-                report_field_updated="track_updated",
-                user=user,
-                entity_name="saved tracks",
-                fetch_func=lambda: self._provider_library.get_saved_tracks(
-                    page_size=config.page_size,
-                ),
-                upsert_func=lambda items: self._track_repository.bulk_upsert(
-                    tracks=items,
-                    batch_size=config.batch_size,
-                ),
+            stages.append(
+                _SyncStage(
+                    report_field_created="track_created",
+                    report_field_updated="track_updated",
+                    entity_name="saved tracks",
+                    fetch_func=lambda: self._provider_library.iter_saved_tracks(
+                        page_size=config.page_size,
+                    ),
+                    upsert_func=lambda items: self._track_repository.bulk_upsert(
+                        tracks=items,
+                        batch_size=config.batch_size,
+                    ),
+                )
             )
 
         # Then fetch and upsert playlist tracks.
         if config.sync_all or config.sync_track_playlist:
-            report = await self._sync_entity(
-                report=report,
-                report_field_created="track_created",
-                report_field_updated="track_updated",
-                user=user,
-                entity_name="playlist tracks",
-                fetch_func=lambda: self._provider_library.get_playlist_tracks(
-                    page_size=config.page_size,
-                ),
-                upsert_func=lambda items: self._track_repository.bulk_upsert(
-                    tracks=items,
-                    batch_size=config.batch_size,
-                ),
+            # Read snapshots before fetching concurrently, because repositories share the same database session.
+            snapshot_ids = await self._get_playlist_snapshot_ids(user)
+            playlists: list[Playlist] = []
+            skipped_playlists: list[Playlist] = []
+
+            stages.append(
+                _SyncStage(
+                    report_field_created="track_created",
+                    report_field_updated="track_updated",
+                    entity_name="playlist tracks",
+                    fetch_func=lambda: self._iter_playlist_tracks(
+                        user, config, snapshot_ids, playlists, skipped_playlists
+                    ),
+                    upsert_func=lambda items: self._track_repository.bulk_upsert(
+                        tracks=items,
+                        batch_size=config.batch_size,
+                    ),
+                    complete_func=lambda: self._replace_playlist_snapshots(user, playlists, skipped_playlists),
+                )
             )
 
-        return report
+        # Endpoints are independent, so fetch them all concurrently while streaming their items into
+        # upserts. However, upserts are done one stage after another: repositories share the same
+        # database session, and later stages must keep overriding items of the previous ones.
+        async with asyncio.TaskGroup() as tg:
+            streams = []
+            for stage in stages:
+                queue: asyncio.Queue[list[Any] | Exception | None] = asyncio.Queue(
+                    maxsize=config.batch_size // config.page_size + 1,
+                )
+                streams.append((stage, queue, tg.create_task(self._fetch_entity(user, stage, queue))))
+
+            for stage, queue, task in streams:
+                is_synced = await self._sync_entity(
+                    counters, errors, user, stage, queue, config.batch_size, progress_callback
+                )
+                # Stop fetching if upserting failed (no-op otherwise).
+                task.cancel()
+
+                if stage.complete_func is not None and is_synced:
+                    await self._complete_entity(user, stage)
+
+        return SyncReport(**counters, errors=errors)
 
     async def _purge_entity(
         self,
-        report: SyncReport,
+        counters: Counter[str],
+        errors: list[str],
         report_field_purge: str,
         user: User,
         entity_name: str,
         purge_callback: Callable[[], Awaitable[int]],
-    ) -> SyncReport:
+    ) -> None:
         logger.info(f"About purging {entity_name} for user {user.id}...")
 
         try:
             count = await purge_callback()
         except Exception:
             logger.exception(f"An error occurred while purging {entity_name} for user {user.id}")
-            report = replace(report, errors=report.errors + [f"An error occurred while purging your {entity_name}."])
+            errors.append(f"An error occurred while purging your {entity_name}.")
         else:
             logger.info(f"Successfully purged {count} {entity_name} for user {user.id}")
-            report_updates: dict[str, Any] = {report_field_purge: count}
-            report = replace(report, **report_updates)
+            counters[report_field_purge] = count
+
+    async def _purge_tracks(self, user: User, config: SyncConfig) -> int:
+        count = await self._track_repository.purge(
+            user_id=user.id,
+            is_top=config.purge_track_top and not config.purge_all,
+            is_saved=config.purge_track_saved and not config.purge_all,
+            is_playlist=config.purge_track_playlist and not config.purge_all,
+        )
+        # Purged tracks may belong to playlists, so they must be fetched again on the next sync.
+        await self._playlist_snapshot_repository.purge(user_id=user.id)
+        return count
 
-        return report
+    async def _get_playlist_snapshot_ids(self, user: User) -> dict[str, str]:
+        try:
+            return await self._playlist_snapshot_repository.get_snapshot_ids(user_id=user.id)
+        except Exception:
+            # Not a big deal, we would just fetch the tracks of all playlists.
+            logger.exception(f"An error occurred while retrieving playlist snapshots for user {user.id}")
+            return {}
 
-    async def _sync_entity[T](
+    async def _iter_playlist_tracks(
         self,
-        report: SyncReport,
-        report_field_created: str,
-        report_field_updated: str,
         user: User,
-        entity_name: str,
-        fetch_func: Callable[[], Awaitable[list[T]]],
-        upsert_func: Callable[[list[T]], Awaitable[tuple[list[Any], int]]],
-    ) -> SyncReport:
-        logger.info(f"About synchronizing {entity_name} for user {user.id}...")
+        config: SyncConfig,
+        snapshot_ids: dict[str, str],
+        playlists: list[Playlist],
+        skipped_playlists: list[Playlist],
+    ) -> AsyncIterator[list[Track]]:
+        playlists.extend(await self._provider_library.get_playlists(page_size=config.page_size))
+
+        # Playlists with an unchanged snapshot have their tracks already saved, so skip them.
+        changed_playlists = [
+            playlist
+            for playlist in playlists
+            if playlist.snapshot_id is None or snapshot_ids.get(playlist.provider_id) != playlist.snapshot_id
+        ]
+        logger.info(f"Skip {len(playlists) - len(changed_playlists)} unchanged playlists for user {user.id}")
+
+        async for tracks in self._provider_library.iter_playlist_tracks(
+            page_size=config.page_size,
+            playlists=changed_playlists,
+            skipped_playlists=skipped_playlists,
+        ):
+            yield tracks
+
+    async def _replace_playlist_snapshots(
+        self,
+        user: User,
+        playlists: list[Playlist],
+        skipped_playlists: list[Playlist],
+    ) -> None:
+        # Don't save the snapshot of skipped playlists, otherwise their tracks would never be fetched again.
+        skipped_ids = {playlist.provider_id for playlist in skipped_playlists}
+        await self._playlist_snapshot_repository.replace(
+            user_id=user.id,
+            playlists=[playlist for playlist in playlists if playlist.provider_id not in skipped_ids],
+        )
+
+    async def _complete_entity[T](self, user: User, stage: _SyncStage[T]) -> None:
+        assert stage.complete_func is not None
 
-        # Fetch step
         try:
-            items = await fetch_func()
+            await stage.complete_func()
         except Exception:
-            logger.exception(f"An error occurred while fetching {entity_name} for user {user.id}")
-            report = replace(report, errors=report.errors + [f"An error occurred while fetching {entity_name}."])
-            return report
-        else:
-            logger.info(f"Fetched {len(items)} {entity_name} for user {user.id}")
+            # Not a big deal neither, items would just be fetched again on the next sync.
+            logger.exception(f"An error occurred while completing {stage.entity_name} for user {user.id}")
+
+    async def _fetch_entity[T](
+        self,
+        user: User,
+        stage: _SyncStage[T],
+        queue: asyncio.Queue[list[T] | Exception | None],
+    ) -> None:
+        logger.info(f"About synchronizing {stage.entity_name} for user {user.id}...")
 
-        # Upsert step
         try:
-            ids, created = await upsert_func(items)
-        except Exception:
-            logger.exception(f"An error occurred while upserting {entity_name} for user {user.id}")
-            report = replace(report, errors=report.errors + [f"An error occurred while saving {entity_name}."])
-            return report
+            async for chunk in stage.fetch_func():
+                await queue.put(chunk)
+        except Exception as e:
+            logger.exception(f"An error occurred while fetching {stage.entity_name} for user {user.id}")
+            await queue.put(e)
         else:
-            logger.info(f"Upserted {len(ids)} {entity_name} for user {user.id}")
+            await queue.put(None)
 
-        report_updates: dict[str, Any] = {
-            report_field_created: getattr(report, report_field_created) + created,
-            report_field_updated: getattr(report, report_field_updated) + (len(ids) - created),
-        }
-        return replace(report, **report_updates)
+    async def _sync_entity[T](
+        self,
+        counters: Counter[str],
+        errors: list[str],
+        user: User,
+        stage: _SyncStage[T],
+        queue: asyncio.Queue[list[T] | Exception | None],
+        batch_size: int,
+        progress_callback: ProgressCallback | None,
+    ) -> bool:
+        items: list[T] = []
+        fetched_count = 0
+        is_exhausted = False
+
+        while not is_exhausted:
+            # Fetch step (streamed by `_fetch_entity`)
+            chunk = await queue.get()
+            if isinstance(chunk, Exception):
+                errors.append(f"An error occurred while fetching {stage.entity_name}.")
+                return False
+
+            if chunk is None:
+                is_exhausted = True
+            else:
+                items.extend(chunk)
+                fetched_count += len(chunk)
+                if progress_callback is not None:
+                    progress_callback(stage.entity_name, len(chunk))
+
+            # Wait for a full batch to upsert, except for the remaining items.
+            if not items or (not is_exhausted and len(items) < batch_size):
+                continue
+
+            # Upsert step
+            try:
+                ids, created = await stage.upsert_func(items)
+            except Exception:
+                logger.exception(f"An error occurred while upserting {stage.entity_name} for user {user.id}")
+                errors.append(f"An error occurred while saving {stage.entity_name}.")
+                return False
+            else:
+                logger.info(f"Upserted {len(ids)} {stage.entity_name} for user {user.id}")
+
+            counters[stage.report_field_created] += created
+            counters[stage.report_field_updated] += len(ids) - created
+            items = []
+
+        logger.info(f"Fetched {fetched_count} {stage.entity_name} for user {user.id}")
+        return True
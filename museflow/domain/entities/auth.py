@@ -1,8 +1,7 @@
+import time
 import uuid
 from dataclasses import dataclass
-from datetime import UTC
 from datetime import datetime
-from datetime import timedelta
 
 from museflow.domain.types import MusicProvider
 
@@ -55,4 +54,5 @@ class OAuthProviderUserToken:
         Returns:
             True if the token is expired or will expire within the buffer, False otherwise.
         """
-        return datetime.now(UTC) >= self.token_expires_at - timedelta(seconds=buffer_seconds)
+        # Compare plain epoch floats rather than building aware datetimes and timedeltas on each check.
+        return time.time() + buffer_seconds >= self.token_expires_at.timestamp()
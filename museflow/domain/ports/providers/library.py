@@ -1,5 +1,6 @@
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 
 from museflow.domain.entities.music import Artist
 from museflow.domain.entities.music import Playlist
@@ -77,6 +78,60 @@ class ProviderLibraryPort(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_playlists(self, page_size: int, max_pages: int | None = None) -> list[Playlist]:
+        """Retrieves the user's playlists from the music provider, without their tracks.
+
+        Args:
+            page_size: The maximum number of playlists to retrieve per page.
+            max_pages: The maximum number of playlists pages to retrieve.
+
+        Returns:
+            A list of `Playlist` entities.
+        """
+        ...
+
+    @abstractmethod
+    def iter_top_artists(
+        self,
+        page_size: int,
+        max_pages: int | None = None,
+        time_range: str | None = None,
+    ) -> AsyncIterator[list[Artist]]:
+        """Same as `get_top_artists`, but yields artists page by page instead of buffering them all."""
+        ...
+
+    @abstractmethod
+    def iter_top_tracks(
+        self,
+        page_size: int,
+        max_pages: int | None = None,
+        time_range: str | None = None,
+    ) -> AsyncIterator[list[Track]]:
+        """Same as `get_top_tracks`, but yields tracks page by page instead of buffering them all."""
+        ...
+
+    @abstractmethod
+    def iter_saved_tracks(self, page_size: int, max_pages: int | None = None) -> AsyncIterator[list[Track]]:
+        """Same as `get_saved_tracks`, but yields tracks page by page instead of buffering them all."""
+        ...
+
+    @abstractmethod
+    def iter_playlist_tracks(
+        self,
+        page_size: int,
+        max_pages: int | None = None,
+        playlists: list[Playlist] | None = None,
+        skipped_playlists: list[Playlist] | None = None,
+    ) -> AsyncIterator[list[Track]]:
+        """Same as `get_playlist_tracks`, but yields tracks by chunks instead of buffering them all.
+
+        Tracks shared by several playlists are only yielded once. If `playlists` is
+        given, only the tracks of these playlists are fetched. Playlists whose tracks
+        can't be fetched are skipped, and appended to `skipped_playlists` if given.
+        """
+        ...
+
     @abstractmethod
     async def search_tracks(
         self,
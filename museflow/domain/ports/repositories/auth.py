@@ -37,12 +37,18 @@ class OAuthProviderStateRepository(ABC):
         ...
 
     @abstractmethod
-    async def get(self, user_id: uuid.UUID, provider: MusicProvider) -> OAuthProviderState | None:
+    async def get(
+        self,
+        user_id: uuid.UUID,
+        provider: MusicProvider,
+        refresh: bool = False,
+    ) -> OAuthProviderState | None:
         """Retrieves the current OAuth state for a user and provider.
 
         Args:
             user_id: The user's ID.
             provider: The music provider.
+            refresh: Whether to reload the state from the storage, to see changes made by another process.
 
         Returns:
             The `OAuthProviderState` entity if one exists, otherwise None.
@@ -3,6 +3,7 @@ from abc import ABC
 from abc import abstractmethod
 
 from museflow.domain.entities.music import Artist
+from museflow.domain.entities.music import Playlist
 from museflow.domain.entities.music import Track
 from museflow.domain.types import SortOrder
 from museflow.domain.types import TrackOrderBy
@@ -133,3 +134,41 @@ class TrackRepository(ABC):
             The number of deleted tracks.
         """
         ...
+
+
+class PlaylistSnapshotRepository(ABC):
+    """A repository for managing the last synchronized snapshots of `Playlist` entities."""
+
+    @abstractmethod
+    async def get_snapshot_ids(self, user_id: uuid.UUID) -> dict[str, str]:
+        """Retrieves the snapshot IDs of the playlists last synchronized for a specific user.
+
+        Args:
+            user_id: The ID of the user whose playlist snapshots are to be retrieved.
+
+        Returns:
+            A mapping of the playlists provider IDs to their snapshot IDs.
+        """
+        ...
+
+    @abstractmethod
+    async def replace(self, user_id: uuid.UUID, playlists: list[Playlist]) -> None:
+        """Replaces all the playlist snapshots of a user by the ones of the given playlists.
+
+        Args:
+            user_id: The ID of the user whose playlist snapshots are to be replaced.
+            playlists: A list of `Playlist` entities to store the snapshot of.
+        """
+        ...
+
+    @abstractmethod
+    async def purge(self, user_id: uuid.UUID) -> int:
+        """Deletes all playlist snapshots associated with a specific user.
+
+        Args:
+            user_id: The ID of the user whose playlist snapshots are to be deleted.
+
+        Returns:
+            The number of deleted playlist snapshots.
+        """
+        ...
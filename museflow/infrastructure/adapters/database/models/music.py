@@ -97,3 +97,28 @@ class Track(MusicItemMixin, Base):
             top_position=self.top_position,
             artists=[TrackArtist(provider_id=artist["provider_id"], name=artist["name"]) for artist in self.artists],
         )
+
+
+class PlaylistSnapshot(UUIDIdMixin, DatetimeTrackMixin, Base, kw_only=True):
+    """SQLAlchemy model for storing the last synchronized snapshot of a user's playlist.
+
+    The provider changes the snapshot ID of a playlist whenever it is modified, which
+    allows to skip fetching the tracks of unchanged playlists.
+    """
+
+    __tablename__ = "museflow_playlist_snapshot"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("museflow_user.id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+    )
+
+    snapshot_id: Mapped[str] = mapped_column(String(512), nullable=False)
+
+    provider: Mapped[MusicProvider] = mapped_column(Enum(MusicProvider), nullable=False, sort_order=990)
+    provider_id: Mapped[str] = mapped_column(String(512), nullable=False, sort_order=991)
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "provider_id", name="uq_museflow_playlist_snapshot_user_provider_id"),
+    )
@@ -0,0 +1,38 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any
+from typing import Final
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+CHANNEL_AUTH_STATE_CONSUMED: Final[str] = "museflow_auth_state_consumed"
+
+
+@asynccontextmanager
+async def listen(session: AsyncSession, channel: str) -> AsyncGenerator[asyncio.Queue[str]]:
+    """Subscribes to a Postgres `NOTIFY` channel and yields a queue of the payloads received.
+
+    A dedicated connection is used, because notifications are only delivered to a
+    connection between transactions, which may not be the case of the session one.
+    """
+    bind = session.bind
+    engine = bind.engine if isinstance(bind, AsyncConnection) else bind
+    assert engine is not None, "The session must be bound to listen to notifications."
+
+    queue: asyncio.Queue[str] = asyncio.Queue()
+
+    def _on_notification(connection: Any, pid: int, channel: str, payload: str) -> None:
+        queue.put_nowait(payload)
+
+    async with engine.connect() as conn:
+        raw_conn = await conn.get_raw_connection()
+        driver_conn = raw_conn.driver_connection
+        assert driver_conn is not None
+
+        await driver_conn.add_listener(channel, _on_notification)
+        try:
+            yield queue
+        finally:
+            await driver_conn.remove_listener(channel, _on_notification)
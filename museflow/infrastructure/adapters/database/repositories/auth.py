@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Any
 
 from sqlalchemy import delete
+from sqlalchemy import func
 from sqlalchemy import select
 from sqlalchemy import text
 from sqlalchemy import update
@@ -19,6 +20,7 @@ from museflow.domain.schemas.auth import OAuthProviderUserTokenUpdate
 from museflow.domain.types import MusicProvider
 from museflow.infrastructure.adapters.database.models import AuthProviderState as AuthProviderStateModel
 from museflow.infrastructure.adapters.database.models import AuthProviderToken as AuthProviderTokenModel
+from museflow.infrastructure.adapters.database.notifications import CHANNEL_AUTH_STATE_CONSUMED
 
 
 class OAuthProviderStateSQLRepository(OAuthProviderStateRepository):
@@ -53,11 +55,19 @@ class OAuthProviderStateSQLRepository(OAuthProviderStateRepository):
 
         return auth_state_db.to_entity(), created
 
-    async def get(self, user_id: uuid.UUID, provider: MusicProvider) -> OAuthProviderState | None:
+    async def get(
+        self,
+        user_id: uuid.UUID,
+        provider: MusicProvider,
+        refresh: bool = False,
+    ) -> OAuthProviderState | None:
         stmt = select(AuthProviderStateModel).where(
             AuthProviderStateModel.user_id == user_id,
             AuthProviderStateModel.provider == provider,
         )
+        if refresh:
+            # Only overwrite the row loaded, instead of expiring the whole identity map.
+            stmt = stmt.execution_options(populate_existing=True)
         result = await self.session.execute(stmt)
         auth_state_db = result.scalar_one_or_none()
 
@@ -71,6 +81,8 @@ class OAuthProviderStateSQLRepository(OAuthProviderStateRepository):
         if auth_state_db is not None:
             stmt_delete = delete(AuthProviderStateModel).where(AuthProviderStateModel.id == auth_state_db.id)
             await self.session.execute(stmt_delete)
+            # Wake up listeners (i.e: the CLI waiting for the user to connect) once committed.
+            await self.session.execute(select(func.pg_notify(CHANNEL_AUTH_STATE_CONSUMED, str(auth_state_db.user_id))))
             await self.session.commit()
 
         return auth_state_db.to_entity() if auth_state_db else None
@@ -3,6 +3,7 @@ import uuid
 from typing import Any
 
 from sqlalchemy import ColumnElement
+from sqlalchemy import Delete
 from sqlalchemy import and_
 from sqlalchemy import delete
 from sqlalchemy import func
@@ -14,13 +15,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from museflow.domain.entities.music import Artist
 from museflow.domain.entities.music import BaseMediaItem
+from museflow.domain.entities.music import Playlist
 from museflow.domain.entities.music import Track
 from museflow.domain.ports.repositories.music import ArtistRepository
+from museflow.domain.ports.repositories.music import PlaylistSnapshotRepository
 from museflow.domain.ports.repositories.music import TrackRepository
 from museflow.domain.types import SortOrder
 from museflow.domain.types import TrackOrderBy
 from museflow.infrastructure.adapters.database.models import Artist as ArtistModel
 from museflow.infrastructure.adapters.database.models import MusicItemMixin
+from museflow.infrastructure.adapters.database.models import PlaylistSnapshot as PlaylistSnapshotModel
 from museflow.infrastructure.adapters.database.models import Track as TrackModel
 
 
@@ -43,7 +47,7 @@ class ArtistSQLRepository(ArtistRepository):
             stmt = stmt.limit(limit)
 
         results = await self.session.execute(stmt)
-        return [artist_db.to_entity() for artist_db in results.scalars().all()]
+        return [artist_db.to_entity() for artist_db in results.scalars()]
 
     async def bulk_upsert(self, artists: list[Artist], batch_size: int) -> tuple[list[uuid.UUID], int]:
         return await bulk_item_upsert(
@@ -97,7 +101,7 @@ class TrackSQLRepository(TrackRepository):
             stmt = stmt.limit(limit)
 
         results = await self.session.execute(stmt)
-        return [tracks_db.to_entity() for tracks_db in results.scalars().all()]
+        return [tracks_db.to_entity() for tracks_db in results.scalars()]
 
     async def get_by_ids(self, user_id: uuid.UUID, track_ids: list[uuid.UUID]) -> list[Track]:
         stmt = select(TrackModel).where(
@@ -105,7 +109,7 @@ class TrackSQLRepository(TrackRepository):
             TrackModel.id.in_(track_ids),
         )
         results = await self.session.execute(stmt)
-        return [tracks_db.to_entity() for tracks_db in results.scalars().all()]
+        return [tracks_db.to_entity() for tracks_db in results.scalars()]
 
     async def bulk_upsert(self, tracks: list[Track], batch_size: int) -> tuple[list[uuid.UUID], int]:
         return await bulk_item_upsert(
@@ -140,6 +144,47 @@ class TrackSQLRepository(TrackRepository):
         return int(result.rowcount)  # type: ignore
 
 
+class PlaylistSnapshotSQLRepository(PlaylistSnapshotRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_snapshot_ids(self, user_id: uuid.UUID) -> dict[str, str]:
+        stmt = select(PlaylistSnapshotModel.provider_id, PlaylistSnapshotModel.snapshot_id).where(
+            PlaylistSnapshotModel.user_id == user_id
+        )
+        results = await self.session.execute(stmt)
+        return {provider_id: snapshot_id for provider_id, snapshot_id in results.all()}
+
+    async def replace(self, user_id: uuid.UUID, playlists: list[Playlist]) -> None:
+        # Also drop the snapshots of the playlists which no longer exist, within the same transaction.
+        await self.session.execute(self._get_purge_stmt(user_id))
+
+        snapshots = [
+            {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "provider": playlist.provider,
+                "provider_id": playlist.provider_id,
+                "snapshot_id": playlist.snapshot_id,
+            }
+            for playlist in playlists
+            if playlist.snapshot_id is not None
+        ]
+        if snapshots:
+            await self.session.execute(pg_insert(PlaylistSnapshotModel).values(snapshots).on_conflict_do_nothing())
+
+        await self.session.commit()
+
+    async def purge(self, user_id: uuid.UUID) -> int:
+        result = await self.session.execute(self._get_purge_stmt(user_id))
+        await self.session.commit()
+        return int(result.rowcount)  # type: ignore
+
+    @staticmethod
+    def _get_purge_stmt(user_id: uuid.UUID) -> Delete:
+        return delete(PlaylistSnapshotModel).where(PlaylistSnapshotModel.user_id == user_id)
+
+
 async def bulk_item_upsert[ItemModel: MusicItemMixin, ItemEntity: BaseMediaItem](
     session: AsyncSession,
     sql_model: type[ItemModel],
@@ -152,16 +197,21 @@ async def bulk_item_upsert[ItemModel: MusicItemMixin, ItemEntity: BaseMediaItem]
     index_elements: list[str] = ["user_id", "provider_id"]
     index_excluded: list[str] = ["id"] + index_elements
 
-    items_dicts: list[dict[str, Any]] = [dataclasses.asdict(item) for item in items]
+    # Resolve the entity fields once, not for every single item.
+    field_names: list[str] = [f.name for f in dataclasses.fields(items[0])] if items else []
+    update_keys: list[str] = [name for name in field_names if name not in index_excluded]
 
-    total: int = len(items_dicts)
+    total: int = len(items)
     for offset in range(0, total, batch_size):
-        items_chunk = items_dicts[offset : offset + batch_size]
+        # Build rows per batch, so that only `batch_size` dicts are alive at once.
+        items_chunk: list[dict[str, Any]] = [
+            _to_row(item, field_names) for item in items[offset : offset + batch_size]
+        ]
 
         stmt = pg_insert(sql_model).values(items_chunk)
         upsert_stmt = stmt.on_conflict_do_update(
             index_elements=index_elements,
-            set_={key: getattr(stmt.excluded, key) for key in items_chunk[0] if key not in index_excluded},
+            set_={key: getattr(stmt.excluded, key) for key in update_keys},
         ).returning(
             sql_model.id,
             text("(xmax = 0) AS was_created"),
@@ -176,3 +226,17 @@ async def bulk_item_upsert[ItemModel: MusicItemMixin, ItemEntity: BaseMediaItem]
     await session.commit()
 
     return item_ids, created_count
+
+
+def _to_row(item: BaseMediaItem, field_names: list[str]) -> dict[str, Any]:
+    # A shallow copy is enough (and way cheaper than `dataclasses.asdict()` which deep copies everything),
+    # except for nested dataclasses which must be converted for JSON columns.
+    return {name: _to_column_value(getattr(item, name)) for name in field_names}
+
+
+def _to_column_value(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, list) and value and dataclasses.is_dataclass(value[0]):
+        return [dataclasses.asdict(v) for v in value]
+    return value
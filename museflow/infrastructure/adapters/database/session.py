@@ -10,7 +10,10 @@ from museflow.infrastructure.config.settings.database import database_settings
 
 assert database_settings.URI is not None, "Did you forgot to export DATABASE_ env vars?"
 
-async_engine: AsyncEngine = create_async_engine(url=str(database_settings.URI))
+async_engine: AsyncEngine = create_async_engine(
+    url=str(database_settings.URI),
+    connect_args={"prepared_statement_cache_size": database_settings.PREPARED_STATEMENT_CACHE_SIZE},
+)
 async_session_factory: async_sessionmaker = async_sessionmaker(
     bind=async_engine,
     # Prevent attributes from being expired after commit/transaction for async DB.
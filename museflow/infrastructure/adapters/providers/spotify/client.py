@@ -1,5 +1,6 @@
-import asyncio
 import base64
+import contextlib
+import importlib.util
 import logging
 from typing import Any
 from urllib.parse import urlencode
@@ -9,11 +10,13 @@ from httpx import codes
 
 from pydantic import HttpUrl
 
-from tenacity import TryAgain
+from pydantic_core import from_json
+from tenacity import RetryCallState
 from tenacity import retry
 from tenacity import retry_if_exception
 from tenacity import stop_after_attempt
 from tenacity import wait_exponential
+from tenacity import wait_random
 
 from museflow.domain.ports.providers.client import ProviderOAuthClientPort
 from museflow.domain.schemas.auth import OAuthProviderTokenPayload
@@ -26,18 +29,38 @@ from museflow.infrastructure.config.settings.spotify import spotify_settings
 logger = logging.getLogger(__name__)
 
 
+_TOO_MANY_REQUESTS = int(codes.TOO_MANY_REQUESTS)
+
+
 def _is_retryable_error(exception: BaseException) -> bool:
+    # Most retry decisions are about HTTP errors, so check them first.
+    if isinstance(exception, httpx.HTTPStatusError):  # Retry 429 and 5xx only
+        status_code = exception.response.status_code
+        return status_code == _TOO_MANY_REQUESTS or status_code >= 500
+
     if isinstance(exception, SpotifyTokenExpiredError):
         return False  # Let the Session handler deal with this!
 
-    if isinstance(exception, httpx.HTTPStatusError):  # Retry 429 and 5xx only
-        return exception.response.status_code == codes.TOO_MANY_REQUESTS or exception.response.status_code >= 500
+    # Retry network error
+    return isinstance(exception, httpx.RequestError)
+
+
+# 2 + 4 + 8 + 16 = 30 seconds, with a jitter to not retry concurrent requests all at once.
+_WAIT_MAX = 30
+_wait_backoff = wait_exponential(multiplier=1, min=2, max=_WAIT_MAX) + wait_random(0, 0.5)
 
-    # Retry network error OR manual retry signal (used for 429 with header)
-    if isinstance(exception, (httpx.RequestError, TryAgain)):
-        return True  # Tenacity may handle the TryAgain internally, but we keep it here for safety
 
-    return False
+def _wait_retry_after(retry_state: RetryCallState) -> float:
+    exception = retry_state.outcome.exception() if retry_state.outcome else None
+
+    # Sleep as long as Spotify asked us to (429 and some 5xx), instead of guessing with the backoff.
+    if isinstance(exception, httpx.HTTPStatusError):
+        retry_after = exception.response.headers.get("Retry-After", "")
+        # Above the backoff cap, don't let a single request block for minutes: fall back to the backoff.
+        if retry_after.isdigit() and int(retry_after) < _WAIT_MAX:
+            return int(retry_after) + 1
+
+    return _wait_backoff(retry_state)
 
 
 class SpotifyOAuthClientAdapter(ProviderOAuthClientPort):
@@ -58,28 +81,55 @@ class SpotifyOAuthClientAdapter(ProviderOAuthClientPort):
         verify_ssl: bool = True,
         timeout: float = 30.0,
         token_buffer_seconds: int = 300,
+        max_connections: int = 50,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
     ) -> None:
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
 
+        # Credentials never change, so encode them once for all token requests.
+        credentials = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+        self._basic_auth_header = f"Basic {credentials}"
+
         self._base_url = base_url or HttpUrl("https://api.spotify.com/v1")
         self._auth_endpoint = auth_endpoint or HttpUrl("https://accounts.spotify.com/authorize")
         self._token_endpoint = token_endpoint or HttpUrl("https://accounts.spotify.com/api/token")
 
+        # URLs never change, so serialize them once rather than on every request.
+        self._redirect_uri_str = str(redirect_uri)
+        self._token_endpoint_str = str(self._token_endpoint)
+        self._base_url_str = str(self._base_url).rstrip("/")
+
+        # Only the state changes between authorization URLs.
+        auth_params = {
+            "client_id": client_id,
+            "response_type": "code",
+            "redirect_uri": self._redirect_uri_str,
+            "scope": SpotifyScope.required_scopes(),
+        }
+        self._authorization_url_prefix = f"{self._auth_endpoint}?{urlencode(auth_params)}"
+
         self.token_buffer_seconds = token_buffer_seconds
 
+        # HTTP/2 multiplexes concurrent requests over a single connection, but requires an optional package.
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 is enabled but the `h2` package is missing (httpx[http2]), fallback to HTTP/1.1")
+            http2 = False
+
         self._client: httpx.AsyncClient = httpx.AsyncClient(
             verify=verify_ssl,
             timeout=timeout,
             follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
         )
 
-    def _get_basic_auth_header(self) -> str:
-        credentials = f"{self.client_id}:{self.client_secret}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-        return f"Basic {encoded}"
-
     @property
     def base_url(self) -> HttpUrl:
         return self._base_url
@@ -89,27 +139,19 @@ class SpotifyOAuthClientAdapter(ProviderOAuthClientPort):
         return self._token_endpoint
 
     def get_authorization_url(self, state: str) -> HttpUrl:
-        params = {
-            "client_id": self.client_id,
-            "response_type": "code",
-            "redirect_uri": str(self.redirect_uri),
-            "scope": SpotifyScope.required_scopes(),
-            "state": state,
-        }
-
-        return HttpUrl(f"{self._auth_endpoint}?{urlencode(params)}")
+        return HttpUrl(f"{self._authorization_url_prefix}&{urlencode({'state': state})}")
 
     async def exchange_code_for_token(self, code: str) -> OAuthProviderTokenPayload:
         response = await self._client.post(
-            url=str(self.token_endpoint),
+            url=self._token_endpoint_str,
             headers={
-                "Authorization": self._get_basic_auth_header(),
+                "Authorization": self._basic_auth_header,
                 "Content-Type": "application/x-www-form-urlencoded",
             },
             data={
                 "grant_type": "authorization_code",
                 "code": code,
-                "redirect_uri": str(self.redirect_uri),
+                "redirect_uri": self._redirect_uri_str,
             },
         )
         if response.is_error:
@@ -118,19 +160,19 @@ class SpotifyOAuthClientAdapter(ProviderOAuthClientPort):
                 extra={
                     "status_code": response.status_code,
                     "response_text": response.text,
-                    "redirect_uri": str(self.redirect_uri),
+                    "redirect_uri": self._redirect_uri_str,
                 },
             )
 
         response.raise_for_status()
 
-        return to_domain_token_payload(SpotifyToken(**response.json()))
+        return to_domain_token_payload(SpotifyToken.model_validate_json(response.content))
 
     async def refresh_access_token(self, refresh_token: str) -> OAuthProviderTokenPayload:
         response = await self._client.post(
-            url=str(self.token_endpoint),
+            url=self._token_endpoint_str,
             headers={
-                "Authorization": self._get_basic_auth_header(),
+                "Authorization": self._basic_auth_header,
                 "Content-Type": "application/x-www-form-urlencoded",
             },
             data={
@@ -146,11 +188,11 @@ class SpotifyOAuthClientAdapter(ProviderOAuthClientPort):
 
         response.raise_for_status()
 
-        return to_domain_token_payload(SpotifyToken(**response.json()), refresh_token)
+        return to_domain_token_payload(SpotifyToken.model_validate_json(response.content), refresh_token)
 
     @retry(
         retry=retry_if_exception(_is_retryable_error),
-        wait=wait_exponential(multiplier=1, min=2, max=60),  # 2 + 4 + 8 + 16 + 32 = 62 seconds
+        wait=_wait_retry_after,
         stop=stop_after_attempt(spotify_settings.HTTP_MAX_RETRIES),
         reraise=True,
     )
@@ -165,12 +207,12 @@ class SpotifyOAuthClientAdapter(ProviderOAuthClientPort):
         """Makes an authenticated API call to the Spotify API.
 
         This method includes retry logic for transient errors and rate limiting.
-        It specifically handles the `Retry-After` header from Spotify for 429 responses.
+        It specifically honors the `Retry-After` header returned by Spotify before retrying.
         """
         try:
             response = await self._client.request(
                 method=method.upper(),
-                url=f"{str(self.base_url).rstrip('/')}{endpoint}",
+                url=f"{self._base_url_str}{endpoint}",
                 headers={
                     "Authorization": f"{token_payload.token_type} {token_payload.access_token}",
                     "Content-Type": "application/json",
@@ -185,31 +227,32 @@ class SpotifyOAuthClientAdapter(ProviderOAuthClientPort):
             if e.response.status_code == codes.UNAUTHORIZED:
                 raise SpotifyTokenExpiredError() from e
 
-            # Special handling for 429 with Retry-After header returned by Spotify
-            if e.response.status_code == codes.TOO_MANY_REQUESTS:
-                retry_after = e.response.headers.get("Retry-After")
-                if retry_after:
-                    wait_seconds = int(retry_after) + 1
-                    await asyncio.sleep(wait_seconds)
-                    # Because we slept as Spotify asked us, we must raise a
-                    # TryAgain to prevent Tenacity to sleep again for nothing.
-                    raise TryAgain() from e
-
-            logger.exception(
-                "Spotify API Error",
-                extra={
-                    "status_code": e.response.status_code,
-                    "method": method,
-                    "endpoint": endpoint,
-                    "response_text": e.response.text,
-                },
-            )
+            extra = {
+                "status_code": e.response.status_code,
+                "method": method,
+                "endpoint": endpoint,
+                "response_text": e.response.text,
+            }
+            # Rate limits and server errors are expected and retried, so don't flood the logs with tracebacks.
+            if _is_retryable_error(e):
+                logger.warning("Spotify API Error, retrying", extra=extra)
+            else:
+                logger.exception("Spotify API Error", extra=extra)
             raise e
 
         if response.status_code == codes.NO_CONTENT:
             return {}
 
-        return response.json()
+        # Pydantic's JSON parser is way faster than the standard library one for large pages.
+        return from_json(response.content)
+
+    async def warm_up(self) -> None:
+        """Opens a pooled connection to the API upfront, so that the first real call skips the TCP+TLS handshake.
+
+        The response itself doesn't matter (no token is sent), and neither does a failure.
+        """
+        with contextlib.suppress(httpx.HTTPError):
+            await self._client.head(self._base_url_str)
 
     async def close(self) -> None:
         await self._client.aclose()
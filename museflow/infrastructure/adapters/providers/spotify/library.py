@@ -1,9 +1,16 @@
 import asyncio
+import itertools
 import logging
+from collections.abc import AsyncIterator
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
 
+import httpx
+from httpx import codes
+
 from pydantic import ValidationError
 
 from museflow import __project_name__
@@ -17,18 +24,23 @@ from museflow.domain.exceptions import ProviderPageValidationError
 from museflow.domain.ports.providers.library import ProviderLibraryPort
 from museflow.domain.ports.repositories.auth import OAuthProviderTokenRepository
 from museflow.infrastructure.adapters.providers.spotify.client import SpotifyOAuthClientAdapter
+from museflow.infrastructure.adapters.providers.spotify.limiter import AdaptiveLimiter
 from museflow.infrastructure.adapters.providers.spotify.mappers import to_domain_artist
 from museflow.infrastructure.adapters.providers.spotify.mappers import to_domain_playlist
 from museflow.infrastructure.adapters.providers.spotify.mappers import to_domain_track
 from museflow.infrastructure.adapters.providers.spotify.queries import SpotifySearchTrackQuery
-from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyArtist
+from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyArtistPage
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyItem
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyPage
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyPlaylist
+from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyPlaylistPage
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyPlaylistTrack
+from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyPlaylistTrackPage
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifySavedTrack
-from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyTrack
+from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifySavedTrackPage
+from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyTrackPage
 from museflow.infrastructure.adapters.providers.spotify.session import SpotifyOAuthSessionClient
+from museflow.infrastructure.adapters.providers.spotify.types import PLAYLIST_ITEMS_FIELDS
 from museflow.infrastructure.adapters.providers.spotify.types import LocalUnsupported
 from museflow.infrastructure.adapters.providers.spotify.types import SpotifyTimeRange
 from museflow.infrastructure.config.settings.app import app_settings
@@ -87,6 +99,10 @@ class SpotifyLibraryAdapter(ProviderLibraryPort):
         self.session_client = session_client
         self.max_concurrency = max_concurrency
 
+        # Shared by all requests of the adapter (i.e: sync stages, playlists, pages), to respect the API budget globally.
+        # It shrinks when we get rate limited, and grows back once requests succeed again.
+        self._limiter = AdaptiveLimiter(max_concurrency)
+
     # -------------------------------------------------------------------------
     # Public API
     # -------------------------------------------------------------------------
@@ -97,73 +113,120 @@ class SpotifyLibraryAdapter(ProviderLibraryPort):
         max_pages: int | None = None,
         time_range: SpotifyTimeRange | str | None = "long_term",
     ) -> list[Artist]:
-        return await self._fetch_pages(
+        return await self._collect(self.iter_top_artists(page_size, max_pages, time_range))
+
+    async def get_top_tracks(
+        self,
+        page_size: int = 50,
+        max_pages: int | None = None,
+        time_range: SpotifyTimeRange | str | None = "long_term",
+    ) -> list[Track]:
+        return await self._collect(self.iter_top_tracks(page_size, max_pages, time_range))
+
+    async def get_saved_tracks(self, page_size: int = 50, max_pages: int | None = None) -> list[Track]:
+        return await self._collect(self.iter_saved_tracks(page_size, max_pages))
+
+    async def get_playlist_tracks(self, page_size: int = 50, max_pages: int | None = None) -> list[Track]:
+        return await self._collect(self.iter_playlist_tracks(page_size, max_pages))
+
+    async def iter_top_artists(
+        self,
+        page_size: int = 50,
+        max_pages: int | None = None,
+        time_range: SpotifyTimeRange | str | None = "long_term",
+    ) -> AsyncIterator[list[Artist]]:
+        async for artists in self._iter_pages(
             endpoint="/me/top/artists",
-            page_model=SpotifyPage[SpotifyArtist],
+            page_model=SpotifyArtistPage,
             page_processor=self._extract_top_artists,
             params={"time_range": time_range},
             page_size=page_size,
             max_pages=max_pages,
             prefix_log="[TopArtists]",
-        )
+        ):
+            yield artists
 
-    async def get_top_tracks(
+    async def iter_top_tracks(
         self,
         page_size: int = 50,
         max_pages: int | None = None,
         time_range: SpotifyTimeRange | str | None = "long_term",
-    ) -> list[Track]:
-        return await self._fetch_pages(
+    ) -> AsyncIterator[list[Track]]:
+        async for tracks in self._iter_pages(
             endpoint="/me/top/tracks",
-            page_model=SpotifyPage[SpotifyTrack],
+            page_model=SpotifyTrackPage,
             page_processor=self._extract_top_tracks,
             params={"time_range": time_range},
             page_size=page_size,
             max_pages=max_pages,
             prefix_log="[TopTracks]",
-        )
+        ):
+            yield tracks
 
-    async def get_saved_tracks(self, page_size: int = 50, max_pages: int | None = None) -> list[Track]:
-        return await self._fetch_pages(
+    async def iter_saved_tracks(self, page_size: int = 50, max_pages: int | None = None) -> AsyncIterator[list[Track]]:
+        async for tracks in self._iter_pages(
             endpoint="/me/tracks",
-            page_model=SpotifyPage[SpotifySavedTrack],
+            page_model=SpotifySavedTrackPage,
             page_processor=self._extract_saved_tracks,
             page_size=page_size,
             max_pages=max_pages,
             prefix_log="[SavedTracks]",
-        )
-
-    async def get_playlist_tracks(self, page_size: int = 50, max_pages: int | None = None) -> list[Track]:
-        """Retrieves tracks from all of the user's playlists.
+        ):
+            yield tracks
 
-        This method first fetches all playlists and then fetches the tracks for
-        each playlist concurrently, respecting the `max_concurrency` limit.
-        """
-        playlists = await self._fetch_pages(
+    async def get_playlists(self, page_size: int = 50, max_pages: int | None = None) -> list[Playlist]:
+        spotify_playlists = await self._fetch_pages(
             endpoint="/me/playlists",
-            page_model=SpotifyPage[SpotifyPlaylist],
+            page_model=SpotifyPlaylistPage,
             page_processor=self._extract_playlists,
             page_size=page_size,
             max_pages=max_pages,
             prefix_log="[Playlists]",
         )
-        logger.info(f"Found {len(playlists)} playlists. Fetching tracks...")
+        return [to_domain_playlist(playlist, user_id=self.user.id, tracks=[]) for playlist in spotify_playlists]
 
-        # Use a Semaphore to limit concurrent playlist fetching to avoid rate limits and overwhelming resources.
-        semaphore = asyncio.Semaphore(self.max_concurrency)
-
-        async def _fetch_with_semaphore(playlist: SpotifyPlaylist) -> list[Track]:
-            async with semaphore:
-                return await self._fetch_playlist_tracks(playlist, page_size, max_pages)
+    async def iter_playlist_tracks(
+        self,
+        page_size: int = 50,
+        max_pages: int | None = None,
+        playlists: list[Playlist] | None = None,
+        skipped_playlists: list[Playlist] | None = None,
+    ) -> AsyncIterator[list[Track]]:
+        """Yields tracks from the user's playlists.
+
+        This method first fetches all playlists (unless given) and then fetches the
+        tracks of `max_concurrency` playlists at a time concurrently. Tracks already
+        yielded by a previous playlist are skipped. Playlists with invalid pages are
+        skipped too, and appended to `skipped_playlists` if given.
+        """
+        if playlists is None:
+            playlists = await self.get_playlists(page_size=page_size, max_pages=max_pages)
+        logger.info(f"Found {len(playlists)} playlists. Fetching tracks...")
 
-        # Fetch in parallel all playlist's tracks with a semaphore.
-        async with asyncio.TaskGroup() as tg:
-            tasks = [tg.create_task(_fetch_with_semaphore(playlist)) for playlist in playlists]
+        # Remember yielded tracks to remove duplicates due to multiple playlists with the same tracks.
+        seen: set[str] = set()
 
-        # Gather all tracks first.
-        tracks = [track for task in tasks for track in task.result()]
-        # Then remove duplicates due to multiple playlists with the same tracks.
-        return list({track.provider_id: track for track in tracks}.values())
+        for playlists_window in itertools.batched(playlists, self.max_concurrency, strict=False):
+            # Fetch in parallel the playlist's tracks of the window (requests are bounded by the adapter's limiter).
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(self._fetch_playlist_tracks(playlist, page_size, max_pages, skipped_playlists))
+                        for playlist in playlists_window
+                    ]
+            except* Exception as eg:
+                # Raise the first failure as is, instead of an ExceptionGroup.
+                exc = eg.exceptions[0]
+                raise exc from exc.__cause__
+
+            tracks: list[Track] = []
+            for task in tasks:
+                for track in task.result():
+                    if track.provider_id not in seen:
+                        seen.add(track.provider_id)
+                        tracks.append(track)
+
+            yield tracks
 
     async def search_tracks(
         self,
@@ -187,7 +250,7 @@ class SpotifyLibraryAdapter(ProviderLibraryPort):
 
         return await self._fetch_pages(
             endpoint="/search",
-            page_model=SpotifyPage[SpotifyTrack],
+            page_model=SpotifyTrackPage,
             page_processor=self._extract_search_tracks,
             page_size=page_size,
             max_pages=max_pages,
@@ -221,7 +284,7 @@ class SpotifyLibraryAdapter(ProviderLibraryPort):
                 "uris": [f"spotify:track:{track.provider_id}" for track in tracks],
             },
         )
-        spotify_playlist.snapshot_id = data["snapshot_id"]
+        spotify_playlist = spotify_playlist.model_copy(update={"snapshot_id": data["snapshot_id"]})
 
         return to_domain_playlist(spotify_playlist, user_id=self.user.id, tracks=tracks)
 
@@ -231,19 +294,20 @@ class SpotifyLibraryAdapter(ProviderLibraryPort):
 
     async def _fetch_playlist_tracks(
         self,
-        playlist: SpotifyPlaylist,
+        playlist: Playlist,
         page_size: int,
         max_pages: int | None = None,
+        skipped_playlists: list[Playlist] | None = None,
     ) -> list[Track]:
         tracks: list[Track] = []
 
         try:
             tracks = await self._fetch_pages(
-                endpoint=f"/playlists/{playlist.id}/items",
-                page_model=SpotifyPage[SpotifyPlaylistTrack],
+                endpoint=f"/playlists/{playlist.provider_id}/items",
+                page_model=SpotifyPlaylistTrackPage,
                 page_processor=self._extract_playlist_tracks,
                 params={
-                    "fields": "total,limit,offset,items(item(id,name,href,popularity,is_local,artists(id,name)))",
+                    "fields": PLAYLIST_ITEMS_FIELDS,
                     "additional_types": "track",
                 },
                 page_size=page_size,
@@ -254,6 +318,8 @@ class SpotifyLibraryAdapter(ProviderLibraryPort):
             # Some playlist pages can return invalid data, like missing ID's due to local files.
             # Anyway, we don't want to break the entire loop of playlists so we catch it here.
             logger.error(f"Skip playlist {playlist.name.strip()} with error: {e}")
+            if skipped_playlists is not None:
+                skipped_playlists.append(playlist)
 
         return tracks
 
@@ -264,7 +330,7 @@ class SpotifyLibraryAdapter(ProviderLibraryPort):
         self,
         endpoint: str,
         page_model: type[SpotifyPage[SpotifyItemType]],
-        page_processor: Callable[[SpotifyPage[SpotifyItemType], int], list[MediaItemType]],
+        page_processor: Callable[[SpotifyPage[SpotifyItemType], int], Iterable[MediaItemType]],
         method: str = "GET",
         params: dict[str, Any] | None = None,
         offset: int = 0,
@@ -274,50 +340,112 @@ class SpotifyLibraryAdapter(ProviderLibraryPort):
         response_key: str | None = None,
     ) -> list[MediaItemType]:
         """
-        Generic method to fetch paginated resources from Spotify.
-        Iterates through pages until all items are retrieved or the page_size is reached.
+        Generic method to fetch all the items of paginated resources from Spotify.
+        See `_iter_pages` for details.
         """
-        items: list[MediaItemType] = []
-        pages_count = 0
+        return await self._collect(
+            self._iter_pages(
+                endpoint=endpoint,
+                page_model=page_model,
+                page_processor=page_processor,
+                method=method,
+                params=params,
+                offset=offset,
+                page_size=page_size,
+                max_pages=max_pages,
+                prefix_log=prefix_log,
+                response_key=response_key,
+            )
+        )
 
+    async def _iter_pages[
+        SpotifyItemType: SpotifyItem | SpotifySavedTrack | SpotifyPlaylistTrack,
+        MediaItemType: BaseMediaItem | SpotifyPlaylist,
+    ](
+        self,
+        endpoint: str,
+        page_model: type[SpotifyPage[SpotifyItemType]],
+        page_processor: Callable[[SpotifyPage[SpotifyItemType], int], Iterable[MediaItemType]],
+        method: str = "GET",
+        params: dict[str, Any] | None = None,
+        offset: int = 0,
+        page_size: int = 50,
+        max_pages: int | None = None,
+        prefix_log: str = "",
+        response_key: str | None = None,
+    ) -> AsyncIterator[list[MediaItemType]]:
+        """
+        Generic method to iterate over paginated resources from Spotify, yielding the items of each page.
+
+        The first page is fetched alone to discover the total number of items.
+        Remaining pages are then requested concurrently by windows of `max_concurrency`
+        pages, and yielded in offset order.
+        """
         logger.info(f"{prefix_log} Start fetching endpoint: {endpoint}")
-        while True:
-            if max_pages is not None and max_pages <= pages_count:
-                break
+        if max_pages is not None and max_pages <= 0:
+            return
 
+        async def _request_page(page_offset: int) -> dict[str, Any]:
             data = await self._execute_request(
                 method=method,
                 endpoint=endpoint,
                 params={
-                    "offset": offset,
+                    "offset": page_offset,
                     "limit": page_size,
                     **(params or {}),
                 },
             )
-
             if response_key and response_key in data:
                 data = data[response_key]
+            return data
 
+        def _validate_page(data: dict[str, Any], page_offset: int) -> SpotifyPage[SpotifyItemType]:
             try:
-                page = page_model.model_validate(data)
+                return page_model.model_validate(data)
             except ValidationError as e:
-                has_local_files = any([error["type"] == LocalUnsupported for error in e.errors()])
+                has_local_files = any(error["type"] == LocalUnsupported for error in e.errors())
                 exc_msg = "Unsupported local files" if has_local_files else str(e)
 
                 raise ProviderPageValidationError(
-                    msg=f"{prefix_log} - Page validation error on {endpoint} (offset: {offset}): {exc_msg}",
+                    msg=f"{prefix_log} - Page validation error on {endpoint} (offset: {page_offset}): {exc_msg}",
                     code="unsupported_local_files" if has_local_files else None,
                 ) from e
 
-            items += page_processor(page, offset)
-            pages_count += 1
+        page = _validate_page(await _request_page(offset), offset)
+        items: list[MediaItemType] = list(page_processor(page, offset))
+        yield items
 
-            logger.info(f"{prefix_log} ... processed {offset + page_size}/{page.total} ...")
-            if len(items) >= page.total or len(page.items) < page_size:
-                break
+        logger.info(f"{prefix_log} ... processed {offset + page_size}/{page.total} ...")
+        if len(items) >= page.total or len(page.items) < page_size:
+            return
 
-            offset += page_size
+        # Now that the total is known, request the remaining pages concurrently.
+        offsets = list(range(offset + page_size, page.total, page_size))
+        if max_pages is not None:
+            offsets = offsets[: max_pages - 1]
 
+        for offsets_window in itertools.batched(offsets, self.max_concurrency, strict=False):
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(_request_page(page_offset)) for page_offset in offsets_window]
+            except* Exception as eg:
+                # Raise the first failure as is, like the first page, instead of an ExceptionGroup.
+                exc = eg.exceptions[0]
+                raise exc from exc.__cause__
+
+            for page_offset, task in zip(offsets_window, tasks, strict=True):
+                page = _validate_page(task.result(), page_offset)
+                yield list(page_processor(page, page_offset))
+
+                logger.info(f"{prefix_log} ... processed {page_offset + page_size}/{page.total} ...")
+                if len(page.items) < page_size:
+                    return
+
+    @staticmethod
+    async def _collect[T](chunks: AsyncIterator[list[T]]) -> list[T]:
+        items: list[T] = []
+        async for chunk in chunks:
+            items.extend(chunk)
         return items
 
     async def _execute_request(
@@ -327,37 +455,52 @@ class SpotifyLibraryAdapter(ProviderLibraryPort):
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        return await self.session_client.execute(
-            method=method,
-            endpoint=endpoint,
-            params=params,
-            json_data=json_data,
-        )
+        async with self._limiter:
+            try:
+                data = await self.session_client.execute(
+                    method=method,
+                    endpoint=endpoint,
+                    params=params,
+                    json_data=json_data,
+                )
+            except httpx.HTTPStatusError as e:
+                # Back off when Spotify is overloaded, whether it rate limits us or fails.
+                if e.response.status_code == codes.TOO_MANY_REQUESTS or e.response.status_code >= 500:
+                    await self._limiter.shrink()
+                raise
+
+        await self._limiter.grow()
+        return data
 
     # -------------------------------------------------------------------------
     # Extractors
     # -------------------------------------------------------------------------
 
-    def _extract_playlists(self, page: SpotifyPage[SpotifyPlaylist], *_: Any) -> list[SpotifyPlaylist]:
-        return list(page.items)
+    def _extract_playlists(self, page: SpotifyPlaylistPage, *_: Any) -> Iterator[SpotifyPlaylist]:
+        return iter(page.items)
 
-    def _extract_top_artists(self, page: SpotifyPage[SpotifyArtist], offset: int) -> list[Artist]:
-        return [
-            to_domain_artist(item, user_id=self.user.id, is_top=True, position=offset + i + 1)
-            for i, item in enumerate(page.items)
-        ]
+    def _extract_top_artists(self, page: SpotifyArtistPage, offset: int) -> Iterator[Artist]:
+        user_id = self.user.id
+        return (
+            to_domain_artist(item, user_id=user_id, is_top=True, position=position)
+            for position, item in enumerate(page.items, start=offset + 1)
+        )
 
-    def _extract_top_tracks(self, page: SpotifyPage[SpotifyTrack], offset: int) -> list[Track]:
-        return [
-            to_domain_track(item, user_id=self.user.id, is_top=True, position=offset + i + 1)
-            for i, item in enumerate(page.items)
-        ]
+    def _extract_top_tracks(self, page: SpotifyTrackPage, offset: int) -> Iterator[Track]:
+        user_id = self.user.id
+        return (
+            to_domain_track(item, user_id=user_id, is_top=True, position=position)
+            for position, item in enumerate(page.items, start=offset + 1)
+        )
 
-    def _extract_saved_tracks(self, page: SpotifyPage[SpotifySavedTrack], *_: Any) -> list[Track]:
-        return [to_domain_track(item.track, user_id=self.user.id, is_saved=True) for item in page.items]
+    def _extract_saved_tracks(self, page: SpotifySavedTrackPage, *_: Any) -> Iterator[Track]:
+        user_id = self.user.id
+        return (to_domain_track(item.track, user_id=user_id, is_saved=True) for item in page.items)
 
-    def _extract_playlist_tracks(self, page: SpotifyPage[SpotifyPlaylistTrack], *_: Any) -> list[Track]:
-        return [to_domain_track(item.item, user_id=self.user.id) for item in page.items if item.item]
+    def _extract_playlist_tracks(self, page: SpotifyPlaylistTrackPage, *_: Any) -> Iterator[Track]:
+        user_id = self.user.id
+        return (to_domain_track(item.item, user_id=user_id) for item in page.items if item.item)
 
-    def _extract_search_tracks(self, page: SpotifyPage[SpotifyTrack], *_: Any) -> list[Track]:
-        return [to_domain_track(item, user_id=self.user.id) for item in page.items if item]
+    def _extract_search_tracks(self, page: SpotifyTrackPage, *_: Any) -> Iterator[Track]:
+        user_id = self.user.id
+        return (to_domain_track(item, user_id=user_id) for item in page.items if item)
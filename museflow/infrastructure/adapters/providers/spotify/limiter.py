@@ -0,0 +1,69 @@
+import asyncio
+from types import TracebackType
+
+
+class AdaptiveLimiter:
+    """A concurrency limiter whose capacity can be resized at runtime.
+
+    It behaves like an `asyncio.Semaphore` but relies on an `asyncio.Condition`
+    so that the maximum concurrency can shrink when the provider rate limits us,
+    and grow back once requests succeed again.
+
+    Like TCP congestion control (AIMD), the limit is halved on failure and only
+    increased by one once a full window of `limit` requests succeeded in a row.
+    """
+
+    def __init__(self, max_concurrency: int, min_concurrency: int = 1) -> None:
+        if min_concurrency < 1 or max_concurrency < min_concurrency:
+            raise ValueError("Expected 1 <= min_concurrency <= max_concurrency.")
+
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self.active = 0
+
+        self._successes = 0
+
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self.active -= 1
+            self._cond.notify(1)
+
+    async def shrink(self) -> None:
+        """Halves the current limit, without going below `min_concurrency`."""
+        async with self._cond:
+            self.limit = max(self.min_concurrency, self.limit // 2)
+            self._successes = 0
+
+    async def grow(self) -> None:
+        """Records a success, and increments the current limit once a full window succeeded.
+
+        The limit never goes above `max_concurrency`.
+        """
+        async with self._cond:
+            if self.limit >= self.max_concurrency:
+                return
+
+            self._successes += 1
+            if self._successes >= self.limit:
+                self._successes = 0
+                self.limit += 1
+                self._cond.notify(1)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.release()
@@ -1,4 +1,5 @@
 import uuid
+from functools import lru_cache
 
 from slugify import slugify
 
@@ -14,6 +15,12 @@ from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyTo
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyTrack
 
 
+@lru_cache(maxsize=4096)
+def _slugify(name: str) -> str:
+    # Slugify is the most expensive step of the mapping and names often repeat (artists, remixes, etc).
+    return slugify(name)
+
+
 def to_domain_token_payload(
     spotify_token: SpotifyToken, existing_refresh_token: str | None = None
 ) -> OAuthProviderTokenPayload:
@@ -45,7 +52,7 @@ def to_domain_artist(
     return Artist(
         user_id=user_id,
         name=spotify_artist.name,
-        slug=slugify(spotify_artist.name),
+        slug=_slugify(spotify_artist.name),
         popularity=spotify_artist.popularity,
         is_saved=is_saved,
         is_top=is_top,
@@ -67,7 +74,7 @@ def to_domain_track(
     return Track(
         user_id=user_id,
         name=spotify_track.name,
-        slug=slugify(spotify_track.name),
+        slug=_slugify(spotify_track.name),
         popularity=spotify_track.popularity,
         is_saved=is_saved,
         is_top=is_top,
@@ -82,7 +89,7 @@ def to_domain_playlist(spotify_playlist: SpotifyPlaylist, user_id: uuid.UUID, tr
     return Playlist(
         user_id=user_id,
         name=spotify_playlist.name,
-        slug=slugify(spotify_playlist.name),
+        slug=_slugify(spotify_playlist.name),
         provider=MusicProvider.SPOTIFY,
         provider_id=spotify_playlist.id,
         snapshot_id=spotify_playlist.snapshot_id,
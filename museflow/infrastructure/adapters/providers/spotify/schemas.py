@@ -1,4 +1,3 @@
-from collections.abc import Sequence
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
@@ -7,6 +6,7 @@ from typing import Any
 
 from pydantic import AwareDatetime
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import HttpUrl
 from pydantic import NonNegativeInt
@@ -29,12 +29,20 @@ class SpotifyToken(BaseModel):
         return datetime.now(UTC) + timedelta(seconds=self.expires_in)
 
 
+# Response items are parsed by thousands during a sync and never mutated afterwards.
+_ITEM_CONFIG = ConfigDict(frozen=True, revalidate_instances="never")
+
+
 class SpotifyTrackArtist(BaseModel):
+    model_config = _ITEM_CONFIG
+
     id: str
     name: str
 
 
 class SpotifyItem(BaseModel):
+    model_config = _ITEM_CONFIG
+
     id: str = Field(..., max_length=512)
     name: str = Field(..., max_length=255)
     href: HttpUrl
@@ -68,11 +76,15 @@ class SpotifyTrack(SpotifyItem):
 
 
 class SpotifySavedTrack(BaseModel):
+    model_config = _ITEM_CONFIG
+
     added_at: AwareDatetime | None = None
     track: SpotifyTrack
 
 
 class SpotifyPlaylistTrack(BaseModel):
+    model_config = _ITEM_CONFIG
+
     item: SpotifyTrack
 
 
@@ -83,7 +95,15 @@ class SpotifyPage[T: SpotifyItem | SpotifySavedTrack | SpotifyPlaylistTrack](Bas
     along with pagination metadata such as total count, limit, and offset.
     """
 
-    items: Sequence[T]
+    items: list[T]
     total: Annotated[int, Field(ge=0)]
     limit: Annotated[int, Field(ge=0)]
     offset: Annotated[int, Field(ge=0)]
+
+
+# Parametrize generic pages once for all, so that their validator is built and looked up only once.
+SpotifyArtistPage = SpotifyPage[SpotifyArtist]
+SpotifyTrackPage = SpotifyPage[SpotifyTrack]
+SpotifySavedTrackPage = SpotifyPage[SpotifySavedTrack]
+SpotifyPlaylistPage = SpotifyPage[SpotifyPlaylist]
+SpotifyPlaylistTrackPage = SpotifyPage[SpotifyPlaylistTrack]
@@ -1,5 +1,8 @@
 import asyncio
+import time
+import uuid
 from typing import Any
+from typing import ClassVar
 
 from museflow.domain.entities.auth import OAuthProviderUserToken
 from museflow.domain.entities.user import User
@@ -19,10 +22,12 @@ class SpotifyOAuthSessionClient:
     This client handles the complexities of the user's session lifecycle, including:
     - Proactive token refresh: Refreshes the token if it's close to expiring.
     - Reactive token refresh: Refreshes the token upon receiving a 401 Unauthorized error.
-    - Thread-safe updates: Uses a lock to prevent race conditions when multiple
-      coroutines try to refresh the token simultaneously.
+    - Concurrency-safe updates: In-flight refreshes are shared process-wide per user,
+      so only one refresh request is sent even across multiple sessions.
     """
 
+    _refresh_inflight: ClassVar[dict[uuid.UUID, asyncio.Task[OAuthProviderUserToken]]] = {}
+
     def __init__(
         self,
         user: User,
@@ -32,12 +37,22 @@ class SpotifyOAuthSessionClient:
         token_buffer_seconds: int = spotify_settings.TOKEN_BUFFER_SECONDS,
     ):
         self.user = user
+        self.token_buffer_seconds = token_buffer_seconds
         self.auth_token = auth_token
         self.auth_token_repository = auth_token_repository
         self.client = client
-        self.token_buffer_seconds = token_buffer_seconds
 
-        self._refresh_lock = asyncio.Lock()
+    @property
+    def auth_token(self) -> OAuthProviderUserToken:
+        return self._auth_token
+
+    @auth_token.setter
+    def auth_token(self, auth_token: OAuthProviderUserToken) -> None:
+        self._auth_token = auth_token
+        # Precompute the monotonic deadline (buffer included) after which a proactive refresh is required,
+        # so that the hot path only compares two floats and is immune to wall clock adjustments.
+        remaining_seconds = auth_token.token_expires_at.timestamp() - time.time() - self.token_buffer_seconds
+        self._refresh_deadline = time.monotonic() + remaining_seconds
 
     async def execute(
         self,
@@ -65,76 +80,79 @@ class SpotifyOAuthSessionClient:
             SpotifyTokenExpiredError: If the token is still expired after a refresh attempt.
         """
         # Proactive refresh check: prevents unnecessary 401s if we already know it's expired
-        if self.auth_token.is_expired(buffer_seconds=self.token_buffer_seconds):
+        if self._is_token_expired():
             await self._refresh_token_safely()
 
-        current_access_token = self.auth_token.token_access
-
-        try:
-            response = await self.client.make_user_api_call(
-                method=method,
-                endpoint=endpoint,
-                token_payload=auth_token_to_token_payload(self.auth_token),
-                params=params,
-                json_data=json_data,
-            )
+        refreshed = False
+        while True:
+            current_access_token = self.auth_token.token_access
 
-        except SpotifyTokenExpiredError:
-            # Reactive refresh as we got a 401 from the provider
-            await self._refresh_token_safely(stale_access_token=current_access_token)
+            try:
+                return await self.client.make_user_api_call(
+                    method=method,
+                    endpoint=endpoint,
+                    token_payload=auth_token_to_token_payload(self.auth_token),
+                    params=params,
+                    json_data=json_data,
+                )
 
-            # Retry only ONCE with new token and if it fails again with 401, bubble up the error (session invalid)
-            return await self.client.make_user_api_call(
-                method=method,
-                endpoint=endpoint,
-                token_payload=auth_token_to_token_payload(self.auth_token),
-                params=params,
-                json_data=json_data,
-            )
+            except SpotifyTokenExpiredError:
+                # Retry only ONCE with new token and if it fails again with 401, bubble up the error (session invalid)
+                if refreshed:
+                    raise
 
-        return response
+                # Reactive refresh as we got a 401 from the provider
+                await self._refresh_token_safely(stale_access_token=current_access_token)
+                refreshed = True
 
     async def _refresh_token_safely(self, stale_access_token: str | None = None) -> None:
-        """Refreshes the access token in a thread-safe manner.
+        """Refreshes the access token in a concurrency-safe manner.
 
-        Uses a lock to ensure that only one coroutine attempts to refresh the
-        token at a time, preventing race conditions.
+        Only one refresh per user can be in flight at a time for the whole process:
+        concurrent callers (from this session or any other one) await the same task.
 
         Args:
             stale_access_token: The access token that was found to be expired.
                                 This is used to ensure the token hasn't already
                                 been refreshed by another coroutine.
         """
-        # Fast check (outside lock)
         if self._should_skip_refresh(stale_access_token):
             return
 
-        async with self._refresh_lock:
-            # Double check (inside lock)
-            if self._should_skip_refresh(stale_access_token):
-                return
-
-            token_payload = await self.client.refresh_access_token(self.auth_token.token_refresh)
-
-            # Update in DB
-            await self.auth_token_repository.update(
-                user_id=self.user.id,
-                provider=MusicProvider.SPOTIFY,
-                auth_token_data=auth_token_update_from_token_payload(token_payload),
-            )
-
-            # Update also in memory
-            self.auth_token = auth_token_from_token_payload(
-                auth_token_id=self.auth_token.id,
-                user_id=self.user.id,
-                provider=self.auth_token.provider,
-                token_payload=token_payload,
-            )
+        user_id = self.user.id
+        task = self._refresh_inflight.get(user_id)
+        if task is None:
+            task = asyncio.create_task(self._refresh_token())
+            self._refresh_inflight[user_id] = task
+            task.add_done_callback(lambda t: self._refresh_inflight.pop(user_id, None))
+
+        # Shield the shared refresh so that a cancelled waiter doesn't cancel it for the others.
+        self.auth_token = await asyncio.shield(task)
+
+    async def _refresh_token(self) -> OAuthProviderUserToken:
+        token_payload = await self.client.refresh_access_token(self.auth_token.token_refresh)
+
+        # Update in DB
+        await self.auth_token_repository.update(
+            user_id=self.user.id,
+            provider=MusicProvider.SPOTIFY,
+            auth_token_data=auth_token_update_from_token_payload(token_payload),
+        )
+
+        return auth_token_from_token_payload(
+            auth_token_id=self.auth_token.id,
+            user_id=self.user.id,
+            provider=self.auth_token.provider,
+            token_payload=token_payload,
+        )
 
     def _should_skip_refresh(self, stale_access_token: str | None) -> bool:
         if stale_access_token is None:
             # Proactive case: Skip if token is NOT expired
-            return not self.auth_token.is_expired(buffer_seconds=self.token_buffer_seconds)
+            return not self._is_token_expired()
 
         # Reactive case: Skip if token has already changed from the stale one
         return self.auth_token.token_access != stale_access_token
+
+    def _is_token_expired(self) -> bool:
+        return time.monotonic() >= self._refresh_deadline
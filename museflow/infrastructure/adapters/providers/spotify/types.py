@@ -1,4 +1,5 @@
 from enum import StrEnum
+from functools import cache
 from typing import Final
 from typing import Literal
 from typing import LiteralString
@@ -7,6 +8,12 @@ SpotifyTimeRange = Literal["short_term", "medium_term", "long_term"]
 
 LocalUnsupported: Final[LiteralString] = "local_unsupported"
 
+# Spotify only supports the `fields` filter on playlist endpoints, so only request what is mapped there.
+# See: https://developer.spotify.com/documentation/web-api/reference/get-playlists-tracks
+PLAYLIST_ITEMS_FIELDS: Final[LiteralString] = (
+    "total,limit,offset,items(item(id,name,href,popularity,is_local,artists(id,name)))"
+)
+
 
 class SpotifyScope(StrEnum):
     """Spotify OAuth scopes for user-related operations.
@@ -46,6 +53,7 @@ class SpotifyScope(StrEnum):
     USER_READ_PRIVATE = "user-read-private"
 
     @classmethod
+    @cache
     def required_scopes(cls) -> str:
         """Returns a space-separated string of required scopes for the application."""
         scopes = [
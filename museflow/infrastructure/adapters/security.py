@@ -23,8 +23,13 @@ class Argon2PasswordHasher(PasswordHasherPort):
     `argon2-cffi` library.
     """
 
-    def __init__(self) -> None:
-        self._ph = Argon2Hasher()
+    def __init__(
+        self,
+        time_cost: int = app_settings.PASSWORD_HASH_TIME_COST,
+        memory_cost: int = app_settings.PASSWORD_HASH_MEMORY_COST,
+        parallelism: int = app_settings.PASSWORD_HASH_PARALLELISM,
+    ) -> None:
+        self._ph = Argon2Hasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
 
     def hash(self, password: str) -> str:
         return self._ph.hash(password)
@@ -1,5 +1,4 @@
 import logging.config
-from copy import deepcopy
 from typing import Any
 from typing import Final
 
@@ -106,17 +105,17 @@ def configure_loggers(level: LogLevel, handlers: list[LogHandler], propagate: bo
         handlers: A list of handler names (e.g., ["console"], ["rich"]) to use.
         propagate: Whether messages should be propagated to ancestor loggers.
     """
-    conf = deepcopy(default_conf)
+    # Only copy what we change: `dictConfig` never mutates the nested dicts of the config given.
+    conf = {
+        **default_conf,
+        # Change handlers for all loggers defined to use the same.
+        "loggers": {name: {**logger, "handlers": handlers} for name, logger in default_conf["loggers"].items()},
+        # Without forgetting the root handlers.
+        "root": {**default_conf["root"], "handlers": handlers},
+    }
 
-    # Change level and propagate only for our logger for now.
+    # However, change level and propagate only for our logger for now.
     conf["loggers"][LOGGER_MUSEFLOW]["level"] = level
     conf["loggers"][LOGGER_MUSEFLOW]["propagate"] = propagate
 
-    # However, change handlers for all loggers defined to use the same.
-    for logger in conf["loggers"].keys():
-        conf["loggers"][logger]["handlers"] = handlers
-
-    # Without forgetting the root handlers.
-    conf["root"]["handlers"] = handlers
-
     logging.config.dictConfig(conf)
@@ -27,12 +27,19 @@ class AppSettings(BaseSettings):
     ACCESS_TOKEN_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Argon2 defaults to the RFC 9106 low memory profile.
+    PASSWORD_HASH_TIME_COST: int = Field(default=3, ge=1)
+    PASSWORD_HASH_MEMORY_COST: int = Field(default=65536, ge=8)  # In KiB
+    PASSWORD_HASH_PARALLELISM: int = Field(default=4, ge=1)
+
     LOG_LEVEL_API: LogLevel = "WARNING"
     LOG_HANDLERS_API: list[LogHandler] = ["console"]
 
     LOG_LEVEL_CLI: LogLevel = "WARNING"
     LOG_HANDLERS_CLI: list[LogHandler] = ["cli", "cli_alert"]
 
+    CLI_UVLOOP: bool = True
+
     SYNC_SEMAPHORE_MAX_CONCURRENCY: int = 20
 
 
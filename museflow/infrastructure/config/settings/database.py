@@ -36,6 +36,9 @@ class DatabaseSettings(BaseSettings):
     PASSWORD: str | None = None
     PATH: str | None = None
 
+    # Per-connection cache of asyncpg prepared statements, reused by repeated queries (0 to disable).
+    PREPARED_STATEMENT_CACHE_SIZE: int = 256
+
     @model_validator(mode="after")
     def build_or_validate_uri(self) -> Self:
         if self.URI is not None:
@@ -26,6 +26,12 @@ class SpotifySettings(BaseSettings):
 
     HTTP_TIMEOUT: float = 30.0
     HTTP_MAX_RETRIES: int = 5
+    # Keep the pool larger than the sync concurrency, so that tasks don't wait for a free connection.
+    HTTP_MAX_CONNECTIONS: int = 50
+    # Keep idle connections alive between sync stages (httpx defaults to 5 seconds).
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    # Requires the optional `h2` package (i.e: `httpx[http2]`).
+    HTTP2: bool = False
 
     TOKEN_BUFFER_SECONDS: int = 60 * 5
 
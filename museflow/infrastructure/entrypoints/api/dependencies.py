@@ -1,6 +1,7 @@
 import logging
 import uuid
 from collections.abc import AsyncGenerator
+from functools import cache
 
 from fastapi import Depends
 from fastapi import HTTPException
@@ -33,7 +34,9 @@ from museflow.infrastructure.config.settings.spotify import spotify_settings
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{app_settings.API_V1_PREFIX}/users/login")
 
 
+@cache
 def get_password_hasher() -> PasswordHasherPort:
+    # Stateless, so build it once for all.
     return Argon2PasswordHasher()
 
 
@@ -69,6 +72,9 @@ async def get_spotify_client() -> AsyncGenerator[ProviderOAuthClientPort]:
         redirect_uri=spotify_settings.REDIRECT_URI,
         timeout=spotify_settings.HTTP_TIMEOUT,
         token_buffer_seconds=spotify_settings.TOKEN_BUFFER_SECONDS,
+        max_connections=spotify_settings.HTTP_MAX_CONNECTIONS,
+        keepalive_expiry=spotify_settings.HTTP_KEEPALIVE_EXPIRY,
+        http2=spotify_settings.HTTP2,
     ) as spotify_client:
         yield spotify_client
 
@@ -14,6 +14,7 @@ from museflow.infrastructure.config.loggers import configure_loggers
 from museflow.infrastructure.config.settings.app import app_settings
 from museflow.infrastructure.entrypoints.api.dependencies import get_db
 from museflow.infrastructure.entrypoints.api.schemas import HealthCheckResponse
+from museflow.infrastructure.entrypoints.api.schemas import LivenessResponse
 from museflow.infrastructure.entrypoints.api.v1.endpoints.spotify import router as spotify_router
 from museflow.infrastructure.entrypoints.api.v1.endpoints.users import router as user_router
 
@@ -41,6 +42,12 @@ api_v1_router.include_router(user_router, prefix="/users", tags=["users"])
 app.include_router(api_v1_router, prefix=app_settings.API_V1_PREFIX)
 
 
+@app.get("/health/live", name="liveness_check", tags=["health"])
+async def liveness_check() -> LivenessResponse:
+    """Liveness endpoint for frequent probes, which doesn't touch the database."""
+    return LivenessResponse(status="alive")
+
+
 @app.get("/health", name="health_check", tags=["health"])
 async def health_check(db: AsyncSession = Depends(get_db)) -> HealthCheckResponse:
     """Health check endpoint to verify application and database status."""
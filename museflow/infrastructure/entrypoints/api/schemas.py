@@ -5,6 +5,10 @@ from pydantic import ConfigDict
 from pydantic import EmailStr
 
 
+class LivenessResponse(BaseModel):
+    status: str
+
+
 class HealthCheckResponse(BaseModel):
     status: str
     database: str
@@ -1,17 +1,25 @@
-import asyncio
+import dataclasses
 import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
 
 import typer
+from click.core import ParameterSource
 from rich.console import Console
+from rich.progress import Progress
+from rich.progress import SpinnerColumn
+from rich.progress import TaskID
+from rich.progress import TextColumn
 from rich.table import Table
 
 from museflow.application.use_cases.provider_sync_library import SyncConfig
 from museflow.domain.exceptions import ProviderAuthTokenNotFoundError
 from museflow.domain.exceptions import UserNotFound
 from museflow.infrastructure.adapters.providers.spotify.types import SpotifyTimeRange
-from museflow.infrastructure.entrypoints.cli.commands.spotify.connect import connect_logic
-from museflow.infrastructure.entrypoints.cli.commands.spotify.sync import sync_logic
 from museflow.infrastructure.entrypoints.cli.parsers import parse_email
+from museflow.infrastructure.entrypoints.cli.parsers import parse_toml_config
+from museflow.infrastructure.entrypoints.cli.runner import run
 
 console = Console()
 app = typer.Typer()
@@ -21,7 +29,7 @@ app = typer.Typer()
 def connect(
     email: str = typer.Option(..., help="User email address", parser=parse_email),
     timeout: float = typer.Option(60.0, help="Seconds to wait for authentication.", min=10),
-    poll_interval: float = typer.Option(2.0, help="Seconds between status checks.", min=0.5),
+    poll_interval: float = typer.Option(0.5, help="Initial seconds between status checks, then backing off.", min=0.5),
 ) -> None:
     """
     Initiates the Spotify OAuth flow for a specific user.
@@ -29,8 +37,11 @@ def connect(
     Important: the app must be run and being able to receive the Spotify's callback
     define with the setting SPOTIFY_REDIRECT_URI.
     """
+    # Import the logic (and its database and HTTP stacks) only when running the command, not on --help.
+    from museflow.infrastructure.entrypoints.cli.commands.spotify.connect import connect_logic
+
     try:
-        asyncio.run(connect_logic(email, timeout, poll_interval))
+        run(connect_logic(email, timeout, poll_interval))
     except UserNotFound as e:
         raise typer.BadParameter(f"User not found with email: {email}") from e
     except TimeoutError as e:
@@ -49,6 +60,7 @@ def connect(
 
 @app.command("sync", help="Synchronize the Spotify user's items.")
 def sync(
+    ctx: typer.Context,
     email: str = typer.Option(..., help="User email address", parser=parse_email),
     purge_all: bool = typer.Option(
         False,
@@ -119,13 +131,20 @@ def sync(
         min=1,
         max=500,
     ),
+    config_file: Path | None = typer.Option(
+        None,
+        "--config",
+        help="A TOML file providing the sync options, overridden by the ones given on the command line",
+        exists=True,
+        dir_okay=False,
+    ),
 ) -> None:
     """
     Synchronize the Spotify user's items into the database, including artists and tracks.
     """
     start_time = time.perf_counter()
 
-    config = SyncConfig(
+    options: dict[str, Any] = dict(
         purge_all=purge_all,
         purge_artist_top=purge_artist_top,
         purge_track_top=purge_track_top,
@@ -140,12 +159,25 @@ def sync(
         time_range=time_range,
         batch_size=batch_size,
     )
+    if config_file is not None:
+        options |= _read_config_file(ctx, config_file)
+
+    config = SyncConfig(**options)
     if not config.has_purge() and not config.has_sync():
         typer.secho("At least one flag must be provided.", fg=typer.colors.RED, err=True)
         raise typer.Abort()
 
+    from museflow.infrastructure.entrypoints.cli.commands.spotify.sync import sync_logic
+
     try:
-        report = asyncio.run(sync_logic(email=email, config=config))
+        # Show the fetched items along the way, then leave room for the final report.
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("Fetching {task.description}: {task.completed} items"),
+            console=console,
+            transient=True,
+        ) as progress:
+            report = run(sync_logic(email=email, config=config, progress_callback=_track_progress(progress)))
     except UserNotFound as e:
         raise typer.BadParameter(f"User not found with email: {email}") from e
     except ProviderAuthTokenNotFoundError as e:
@@ -179,3 +211,33 @@ def sync(
     table.add_row("Tracks updated", str(report.track_updated))
 
     console.print(table)
+
+
+def _track_progress(progress: Progress) -> Callable[[str, int], None]:
+    tasks: dict[str, TaskID] = {}
+
+    def callback(entity_name: str, count: int) -> None:
+        if entity_name not in tasks:
+            tasks[entity_name] = progress.add_task(entity_name, total=None)
+        progress.advance(tasks[entity_name], count)
+
+    return callback
+
+
+def _read_config_file(ctx: typer.Context, path: Path) -> dict[str, Any]:
+    """Returns the sync options of the config file not explicitly given on the command line.
+
+    The values go through the same conversion and validation as the matching flags.
+    """
+    fields = {field.name for field in dataclasses.fields(SyncConfig)}
+    params = {param.name: param for param in ctx.command.params}
+
+    options = {}
+    for name, value in parse_toml_config(path).items():
+        if name not in fields:
+            raise typer.BadParameter(f"Unknown option in config file: '{name}'", param_hint="'--config'")
+
+        if ctx.get_parameter_source(name) is not ParameterSource.COMMANDLINE:
+            options[name] = params[name].process_value(ctx, value)
+
+    return options
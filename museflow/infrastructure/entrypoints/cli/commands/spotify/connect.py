@@ -1,7 +1,9 @@
 import asyncio
-import time
+import contextlib
+import random
 import uuid
 from contextlib import AsyncExitStack
+from typing import Final
 
 from pydantic import EmailStr
 
@@ -13,12 +15,16 @@ from museflow.application.use_cases.provider_oauth_redirect import oauth_redirec
 from museflow.domain.exceptions import UserNotFound
 from museflow.domain.ports.repositories.auth import OAuthProviderStateRepository
 from museflow.domain.types import MusicProvider
+from museflow.infrastructure.adapters.database.notifications import CHANNEL_AUTH_STATE_CONSUMED
+from museflow.infrastructure.adapters.database.notifications import listen
 from museflow.infrastructure.entrypoints.cli.dependencies import get_auth_state_repository
 from museflow.infrastructure.entrypoints.cli.dependencies import get_db
 from museflow.infrastructure.entrypoints.cli.dependencies import get_spotify_client
 from museflow.infrastructure.entrypoints.cli.dependencies import get_state_token_generator
 from museflow.infrastructure.entrypoints.cli.dependencies import get_user_repository
 
+MAX_POLL_INTERVAL: Final[float] = 5.0
+
 
 async def connect_logic(email: EmailStr, timeout: float, poll_interval: float) -> None:
     async with AsyncExitStack() as stack:
@@ -61,17 +67,29 @@ async def _wait_for_authentication(
     poll_interval: float,
 ) -> None:
     typer.echo("Waiting for authentication completion", nl=False)
-    start_time = time.time()
-
-    while time.time() - start_time < timeout:
-        await asyncio.sleep(poll_interval)
-        typer.echo(".", nl=False)  # Visual feedback
-
-        # Force SQLAlchemy to forget cached data so we see external updates
-        session.expire_all()
-
-        auth_state = await auth_state_repository.get(user_id=user_id, provider=MusicProvider.SPOTIFY)
-        if auth_state is None:
-            return
-
-    raise TimeoutError()
+    max_interval = max(poll_interval, MAX_POLL_INTERVAL)
+    backoff = poll_interval
+
+    # The event loop enforces the deadline on its monotonic clock, raising TimeoutError once expired.
+    async with asyncio.timeout(timeout), listen(session, CHANNEL_AUTH_STATE_CONSUMED) as notifications:
+        while True:
+            # The user usually needs some time in the browser, so back off exponentially (with a jitter)
+            # rather than querying the DB at a constant rate.
+            interval = min(max_interval, backoff * random.uniform(0.5, 1.5))
+            # Double from the previous value so it stays capped, whatever the number of attempts.
+            backoff = min(max_interval, backoff * 2)
+
+            # Wake up as soon as the callback consumed a state, but still poll as a fallback
+            # in case notifications can't be delivered (i.e: behind a transaction pooler).
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(notifications.get(), timeout=interval)
+            typer.echo(".", nl=False)  # Visual feedback
+
+            # Refresh the state so we see external updates
+            auth_state = await auth_state_repository.get(
+                user_id=user_id,
+                provider=MusicProvider.SPOTIFY,
+                refresh=True,
+            )
+            if auth_state is None:
+                return
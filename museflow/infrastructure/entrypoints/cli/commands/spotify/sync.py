@@ -1,7 +1,9 @@
+import asyncio
 from contextlib import AsyncExitStack
 
 from pydantic import EmailStr
 
+from museflow.application.use_cases.provider_sync_library import ProgressCallback
 from museflow.application.use_cases.provider_sync_library import ProviderSyncLibraryUseCase
 from museflow.application.use_cases.provider_sync_library import SyncConfig
 from museflow.application.use_cases.provider_sync_library import SyncReport
@@ -11,17 +13,26 @@ from museflow.domain.types import MusicProvider
 from museflow.infrastructure.entrypoints.cli.dependencies import get_artist_repository
 from museflow.infrastructure.entrypoints.cli.dependencies import get_auth_token_repository
 from museflow.infrastructure.entrypoints.cli.dependencies import get_db
+from museflow.infrastructure.entrypoints.cli.dependencies import get_playlist_snapshot_repository
 from museflow.infrastructure.entrypoints.cli.dependencies import get_spotify_client
 from museflow.infrastructure.entrypoints.cli.dependencies import get_spotify_library_factory
 from museflow.infrastructure.entrypoints.cli.dependencies import get_track_repository
 from museflow.infrastructure.entrypoints.cli.dependencies import get_user_repository
 
 
-async def sync_logic(email: EmailStr, config: SyncConfig) -> SyncReport:
+async def sync_logic(
+    email: EmailStr,
+    config: SyncConfig,
+    progress_callback: ProgressCallback | None = None,
+) -> SyncReport:
     async with AsyncExitStack() as stack:
         session = await stack.enter_async_context(get_db())
 
         spotify_client = await stack.enter_async_context(get_spotify_client())
+        # Connect to Spotify in the background while we are querying the DB.
+        warm_up = asyncio.create_task(spotify_client.warm_up())
+        stack.callback(warm_up.cancel)
+
         spotify_library_factory = get_spotify_library_factory(
             session=session,
             spotify_client=spotify_client,
@@ -31,6 +42,7 @@ async def sync_logic(email: EmailStr, config: SyncConfig) -> SyncReport:
         auth_token_repository = get_auth_token_repository(session)
         artist_repository = get_artist_repository(session)
         track_repository = get_track_repository(session)
+        playlist_snapshot_repository = get_playlist_snapshot_repository(session)
 
         user = await user_repository.get_by_email(email)
         if user is None:
@@ -40,14 +52,18 @@ async def sync_logic(email: EmailStr, config: SyncConfig) -> SyncReport:
         if auth_token is None:
             raise ProviderAuthTokenNotFoundError()
 
+        await warm_up
+
         spotify_library = spotify_library_factory.create(user=user, auth_token=auth_token)
 
         use_case = ProviderSyncLibraryUseCase(
             provider_library=spotify_library,
             artist_repository=artist_repository,
             track_repository=track_repository,
+            playlist_snapshot_repository=playlist_snapshot_repository,
         )
         return await use_case.execute(
             user=user,
             config=config,
+            progress_callback=progress_callback,
         )
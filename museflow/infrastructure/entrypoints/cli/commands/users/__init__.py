@@ -1,4 +1,3 @@
-import asyncio
 import uuid
 
 from pydantic import ValidationError
@@ -8,10 +7,9 @@ import typer
 from museflow.domain.exceptions import UserAlreadyExistsException
 from museflow.domain.exceptions import UserNotFound
 from museflow.domain.schemas.user import UserUpdate
-from museflow.infrastructure.entrypoints.cli.commands.users.create import user_create_logic
-from museflow.infrastructure.entrypoints.cli.commands.users.update import user_update_logic
 from museflow.infrastructure.entrypoints.cli.parsers import parse_email
 from museflow.infrastructure.entrypoints.cli.parsers import parse_password
+from museflow.infrastructure.entrypoints.cli.runner import run
 
 app = typer.Typer()
 
@@ -21,8 +19,11 @@ def create(
     email: str = typer.Option(..., help="User email address", parser=parse_email),
     password: str = typer.Option(..., prompt=True, hide_input=True, confirmation_prompt=True, parser=parse_password),
 ) -> None:
+    # Import the logic (and its database stack) only when running the command, not on --help.
+    from museflow.infrastructure.entrypoints.cli.commands.users.create import user_create_logic
+
     try:
-        asyncio.run(user_create_logic(email, password))
+        run(user_create_logic(email, password))
     except UserAlreadyExistsException as e:
         typer.secho(f"User with email {email} already exists.", fg=typer.colors.RED, err=True)
         raise typer.Exit(code=1) from e
@@ -46,8 +47,10 @@ def update(
     except ValidationError as e:
         raise typer.BadParameter(str(e)) from e
 
+    from museflow.infrastructure.entrypoints.cli.commands.users.update import user_update_logic
+
     try:
-        asyncio.run(user_update_logic(user_id, user_data=user_data))
+        run(user_update_logic(user_id, user_data=user_data))
     except UserNotFound as e:
         typer.secho(f"User not found with ID {user_id}", fg=typer.colors.RED, err=True)
         raise typer.Exit(code=1) from e
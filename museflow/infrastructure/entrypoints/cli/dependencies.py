@@ -1,11 +1,13 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from functools import cache
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from museflow.domain.ports.repositories.auth import OAuthProviderStateRepository
 from museflow.domain.ports.repositories.auth import OAuthProviderTokenRepository
 from museflow.domain.ports.repositories.music import ArtistRepository
+from museflow.domain.ports.repositories.music import PlaylistSnapshotRepository
 from museflow.domain.ports.repositories.music import TrackRepository
 from museflow.domain.ports.repositories.users import UserRepository
 from museflow.domain.ports.security import PasswordHasherPort
@@ -13,6 +15,7 @@ from museflow.domain.ports.security import StateTokenGeneratorPort
 from museflow.infrastructure.adapters.database.repositories.auth import OAuthProviderStateSQLRepository
 from museflow.infrastructure.adapters.database.repositories.auth import OAuthProviderTokenSQLRepository
 from museflow.infrastructure.adapters.database.repositories.music import ArtistSQLRepository
+from museflow.infrastructure.adapters.database.repositories.music import PlaylistSnapshotSQLRepository
 from museflow.infrastructure.adapters.database.repositories.music import TrackSQLRepository
 from museflow.infrastructure.adapters.database.repositories.users import UserSQLRepository
 from museflow.infrastructure.adapters.database.session import session_scope
@@ -23,7 +26,9 @@ from museflow.infrastructure.adapters.security import SystemStateTokenGenerator
 from museflow.infrastructure.config.settings.spotify import spotify_settings
 
 
+@cache
 def get_password_hasher() -> PasswordHasherPort:
+    # Stateless, so build it once for all.
     return Argon2PasswordHasher()
 
 
@@ -45,6 +50,9 @@ async def get_spotify_client() -> AsyncGenerator[SpotifyOAuthClientAdapter]:
         redirect_uri=spotify_settings.REDIRECT_URI,
         timeout=spotify_settings.HTTP_TIMEOUT,
         token_buffer_seconds=spotify_settings.TOKEN_BUFFER_SECONDS,
+        max_connections=spotify_settings.HTTP_MAX_CONNECTIONS,
+        keepalive_expiry=spotify_settings.HTTP_KEEPALIVE_EXPIRY,
+        http2=spotify_settings.HTTP2,
     ) as client:
         yield client
 
@@ -69,6 +77,10 @@ def get_track_repository(session: AsyncSession) -> TrackRepository:
     return TrackSQLRepository(session)
 
 
+def get_playlist_snapshot_repository(session: AsyncSession) -> PlaylistSnapshotRepository:
+    return PlaylistSnapshotSQLRepository(session)
+
+
 def get_spotify_library_factory(
     session: AsyncSession,
     spotify_client: SpotifyOAuthClientAdapter,
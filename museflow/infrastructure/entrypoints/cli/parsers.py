@@ -1,4 +1,8 @@
+import tomllib
+from functools import lru_cache
+from pathlib import Path
 from typing import Annotated
+from typing import Any
 from typing import get_args
 
 from pydantic import EmailStr
@@ -15,21 +19,25 @@ password_field_info = UserCreate.model_fields["password"]
 EmailAdapter = TypeAdapter(EmailStr)
 PasswordAdapter: TypeAdapter[str] = TypeAdapter(Annotated[password_field_info.annotation, password_field_info])
 
+# Call the compiled validators directly, without going through the adapters each time.
+_validate_email = EmailAdapter.validator.validate_python
+_validate_password = PasswordAdapter.validator.validate_python
+
 
 def parse_password(value: str) -> str:
     try:
-        PasswordAdapter.validate_python(value)
+        _validate_password(value)
     except ValidationError as e:
-        raise typer.BadParameter(e.errors()[0]["msg"]) from e
+        raise typer.BadParameter(e.errors(include_url=False, include_context=False)[0]["msg"]) from e
 
     return value
 
 
 def parse_email(value: str) -> str:
     try:
-        EmailAdapter.validate_python(value)
+        _validate_email(value)
     except ValidationError as e:
-        raise typer.BadParameter(e.errors()[0]["msg"]) from e
+        raise typer.BadParameter(e.errors(include_url=False, include_context=False)[0]["msg"]) from e
 
     return value
 
@@ -40,3 +48,17 @@ def parse_log_handlers(values: list[str]) -> list[str]:
             raise typer.BadParameter(f"Invalid handler: '{values}'. Allowed: {', '.join(get_args(LogHandler))}")
 
     return values
+
+
+@lru_cache(maxsize=8)
+def _load_toml(path: Path, mtime_ns: int) -> dict[str, Any]:
+    with path.open("rb") as f:
+        return tomllib.load(f)
+
+
+def parse_toml_config(path: Path) -> dict[str, Any]:
+    """Loads a TOML config file, cached until the file is modified."""
+    try:
+        return dict(_load_toml(path.resolve(), path.stat().st_mtime_ns))
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        raise typer.BadParameter(f"Invalid config file '{path}': {e}", param_hint="'--config'") from e
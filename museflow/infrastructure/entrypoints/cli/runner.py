@@ -0,0 +1,28 @@
+import asyncio
+from collections.abc import Callable
+from collections.abc import Coroutine
+from typing import Any
+
+from museflow.infrastructure.config.settings.app import app_settings
+
+
+def run[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Runs a coroutine to completion from a synchronous CLI command.
+
+    The event loop is backed by uvloop when enabled and available, which speeds up
+    the HTTP and database heavy commands (i.e: the library sync).
+    """
+    with asyncio.Runner(loop_factory=get_loop_factory()) as runner:
+        return runner.run(coro)
+
+
+def get_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    if not app_settings.CLI_UVLOOP:
+        return None
+
+    try:
+        import uvloop
+    except ImportError:  # Not supported on Windows for example.
+        return None
+
+    return uvloop.new_event_loop
@@ -7,7 +7,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import pytest
 
 from museflow.application.use_cases.provider_oauth_callback import oauth_callback
-from museflow.domain.entities.auth import OAuthProviderUserToken
 from museflow.domain.entities.user import User
 from museflow.domain.ports.repositories.auth import OAuthProviderTokenRepository
 from museflow.domain.schemas.auth import OAuthProviderTokenPayload
@@ -16,84 +15,24 @@ from museflow.infrastructure.adapters.database.models import AuthProviderState a
 from museflow.infrastructure.adapters.database.models import AuthProviderToken as AuthProviderTokenModel
 from museflow.infrastructure.adapters.providers.spotify.client import SpotifyOAuthClientAdapter
 
-from tests.integration.utils.wiremock import WireMockContext
+from tests.integration.factories.models.auth import AuthProviderTokenFactory
 
 
 class TestSpotifyOauthCallbackUseCase:
-    async def test__token_payload__create(
+    @pytest.mark.parametrize("is_existing", [False, True], ids=["create", "update"])
+    @pytest.mark.usefixtures("spotify_token_response")
+    async def test__token_payload__upsert(
         self,
+        is_existing: bool,
         async_session_db: AsyncSession,
         frozen_time: datetime,
         user: User,
         token_payload: OAuthProviderTokenPayload,
         auth_token_repository: OAuthProviderTokenRepository,
         spotify_client: SpotifyOAuthClientAdapter,
-        spotify_wiremock: WireMockContext,
     ) -> None:
-        spotify_wiremock.create_mapping(
-            method="POST",
-            url_path=spotify_client.token_endpoint.path or "",
-            status=200,
-            json_body={
-                "token_type": token_payload.token_type,
-                "access_token": token_payload.access_token,
-                "refresh_token": token_payload.refresh_token,
-                "expires_in": 3600,
-            },
-        )
-
-        await oauth_callback(
-            code="test",
-            user=user,
-            provider=MusicProvider.SPOTIFY,
-            auth_token_repository=auth_token_repository,
-            provider_client=spotify_client,
-        )
-
-        stmt_state = select(AuthProviderStateModel).where(
-            AuthProviderStateModel.user_id == user.id,
-            AuthProviderStateModel.provider == MusicProvider.SPOTIFY,
-        )
-        result_state = await async_session_db.execute(stmt_state)
-        auth_state_db = result_state.scalar_one_or_none()
-        assert auth_state_db is None
-
-        stmt_token = select(AuthProviderTokenModel).where(
-            AuthProviderTokenModel.user_id == user.id,
-            AuthProviderTokenModel.provider == MusicProvider.SPOTIFY,
-        )
-        result_token = await async_session_db.execute(stmt_token)
-        auth_token_db = result_token.scalar_one_or_none()
-
-        assert auth_token_db is not None
-        assert auth_token_db.token_type == token_payload.token_type
-        assert auth_token_db.token_access == token_payload.access_token
-        assert auth_token_db.token_refresh == token_payload.refresh_token
-        assert auth_token_db.token_expires_at == frozen_time + timedelta(seconds=3600)
-
-    @pytest.mark.parametrize("auth_token", [{"provider": MusicProvider.SPOTIFY}], indirect=["auth_token"])
-    async def test__token_payload__update(
-        self,
-        async_session_db: AsyncSession,
-        frozen_time: datetime,
-        user: User,
-        token_payload: OAuthProviderTokenPayload,
-        auth_token: OAuthProviderUserToken,
-        auth_token_repository: OAuthProviderTokenRepository,
-        spotify_client: SpotifyOAuthClientAdapter,
-        spotify_wiremock: WireMockContext,
-    ) -> None:
-        spotify_wiremock.create_mapping(
-            method="POST",
-            url_path=spotify_client.token_endpoint.path or "",
-            status=200,
-            json_body={
-                "token_type": token_payload.token_type,
-                "access_token": token_payload.access_token,
-                "refresh_token": token_payload.refresh_token,
-                "expires_in": 3600,
-            },
-        )
+        if is_existing:
+            await AuthProviderTokenFactory.create_async(user_id=user.id, provider=MusicProvider.SPOTIFY)
 
         await oauth_callback(
             code="test",
@@ -1,4 +1,3 @@
-import json
 from typing import Any
 from typing import Final
 
@@ -16,15 +15,16 @@ from museflow.domain.entities.music import Artist
 from museflow.domain.entities.music import Track
 from museflow.domain.entities.user import User
 from museflow.domain.ports.repositories.music import ArtistRepository
+from museflow.domain.ports.repositories.music import PlaylistSnapshotRepository
 from museflow.domain.ports.repositories.music import TrackRepository
 from museflow.infrastructure.adapters.database.models import Artist as ArtistModel
 from museflow.infrastructure.adapters.database.models import Track as TrackModel
 from museflow.infrastructure.adapters.providers.spotify.library import SpotifyLibraryAdapter
 
-from tests import ASSETS_DIR
 from tests.integration.factories.models.music import ArtistModelFactory
 from tests.integration.factories.models.music import TrackModelFactory
 from tests.integration.utils.wiremock import WireMockContext
+from tests.integration.utils.wiremock import load_spotify_response
 
 # As defined by wiremock hardcoded templates.
 DEFAULT_PAGINATION_SIZE: Final[int] = 5
@@ -32,19 +32,14 @@ DEFAULT_PAGINATION_MAX: Final[int] = 3
 DEFAULT_PAGINATION_TOTAL: Final[int] = 15
 
 
-def wiremock_response(filename: str) -> dict[str, Any]:
-    filepath = ASSETS_DIR / "wiremock" / "spotify" / "__files" / f"{filename}.json"
-    return json.loads(filepath.read_text())
-
-
 class TestSpotifySyncMusic:
     @pytest.fixture
     def patch_playlist_tracks_response(self, spotify_wiremock: WireMockContext) -> None:
         playlist_items = []
         for page_number in range(1, 3):
-            playlist_items += wiremock_response(f"playlists_page_{page_number}")["items"]
+            playlist_items += load_spotify_response(f"playlists_page_{page_number}")["items"]
 
-        wiremock_playlist_response = wiremock_response("playlists_page_1")
+        wiremock_playlist_response = load_spotify_response("playlists_page_1")
         wiremock_playlist_response["items"] = playlist_items
         wiremock_playlist_response["total"] = len(playlist_items)
         wiremock_playlist_response["limit"] = DEFAULT_PAGINATION_SIZE
@@ -68,9 +63,9 @@ class TestSpotifySyncMusic:
         for template, playlist in playlist_track_map.items():
             playlist_track_items = []
             for page_number in range(1, 3):
-                playlist_track_items += wiremock_response(f"{template}_page_{page_number}")["items"]
+                playlist_track_items += load_spotify_response(f"{template}_page_{page_number}")["items"]
 
-            wiremock_playlist_track_response = wiremock_response(f"{template}_page_1")
+            wiremock_playlist_track_response = load_spotify_response(f"{template}_page_1")
             wiremock_playlist_track_response["items"] = playlist_track_items
             wiremock_playlist_track_response["total"] = len(playlist_track_items)
             wiremock_playlist_track_response["limit"] = DEFAULT_PAGINATION_SIZE
@@ -91,15 +86,15 @@ class TestSpotifySyncMusic:
 
     @pytest.fixture
     async def artists_update(self, request: pytest.FixtureRequest, user: User) -> list[Artist]:
-        artists: list[Artist] = []
-
         page_max = getattr(request, "param", DEFAULT_PAGINATION_MAX)
-        for page_number in range(1, page_max + 1):
-            for item in wiremock_response(f"top_artists_page_{page_number}")["items"]:
-                artist = await ArtistModelFactory.create_async(user_id=user.id, provider_id=item["id"])
-                artists.append(artist.to_entity())
+        provider_ids = [
+            item["id"]
+            for page_number in range(1, page_max + 1)
+            for item in load_spotify_response(f"top_artists_page_{page_number}")["items"]
+        ]
 
-        return artists
+        artists = await ArtistModelFactory.create_batch_from_provider_ids_async(provider_ids, user_id=user.id)
+        return [artist.to_entity() for artist in artists]
 
     @pytest.fixture
     async def artists_top_delete(self, user: User) -> list[Artist]:
@@ -107,55 +102,55 @@ class TestSpotifySyncMusic:
 
     @pytest.fixture
     async def tracks_top_update(self, request: pytest.FixtureRequest, user: User) -> list[Track]:
-        tracks: list[Track] = []
         page_max = getattr(request, "param", DEFAULT_PAGINATION_MAX)
-
-        for page_number in range(1, page_max + 1):
-            for item in wiremock_response(f"top_tracks_page_{page_number}")["items"]:
-                track = await TrackModelFactory.create_async(
-                    user_id=user.id,
-                    provider_id=item["id"],
-                    is_top=True,
-                    is_saved=False,
-                )
-                tracks.append(track.to_entity())
-
-        return tracks
+        provider_ids = [
+            item["id"]
+            for page_number in range(1, page_max + 1)
+            for item in load_spotify_response(f"top_tracks_page_{page_number}")["items"]
+        ]
+
+        tracks = await TrackModelFactory.create_batch_from_provider_ids_async(
+            provider_ids,
+            user_id=user.id,
+            is_top=True,
+            is_saved=False,
+        )
+        return [track.to_entity() for track in tracks]
 
     @pytest.fixture
     async def tracks_saved_update(self, request: pytest.FixtureRequest, user: User) -> list[Track]:
-        tracks: list[Track] = []
         page_max = getattr(request, "param", DEFAULT_PAGINATION_MAX)
-
-        for page_number in range(1, page_max + 1):
-            for item in wiremock_response(f"saved_tracks_page_{page_number}")["items"]:
-                track = await TrackModelFactory.create_async(
-                    user_id=user.id,
-                    provider_id=item["track"]["id"],
-                    is_top=False,
-                    is_saved=True,
-                )
-                tracks.append(track.to_entity())
-
-        return tracks
+        provider_ids = [
+            item["track"]["id"]
+            for page_number in range(1, page_max + 1)
+            for item in load_spotify_response(f"saved_tracks_page_{page_number}")["items"]
+        ]
+
+        tracks = await TrackModelFactory.create_batch_from_provider_ids_async(
+            provider_ids,
+            user_id=user.id,
+            is_top=False,
+            is_saved=True,
+        )
+        return [track.to_entity() for track in tracks]
 
     @pytest.fixture
     async def tracks_playlist_update(self, request: pytest.FixtureRequest, user: User) -> list[Track]:
-        tracks: list[Track] = []
         page_max = getattr(request, "param", 2)
-
-        for page_number in range(1, page_max + 1):
-            for template in ["playlist_items_0wKgiV47itigJyxBgFxAu1", "playlist_items_1xnKqEZDpMWvrts4M9I9GC"]:
-                for item in wiremock_response(f"{template}_page_{page_number}")["items"]:
-                    track = await TrackModelFactory.create_async(
-                        user_id=user.id,
-                        provider_id=item["item"]["id"],
-                        is_top=False,
-                        is_saved=False,
-                    )
-                    tracks.append(track.to_entity())
-
-        return tracks
+        provider_ids = [
+            item["item"]["id"]
+            for page_number in range(1, page_max + 1)
+            for template in ["playlist_items_0wKgiV47itigJyxBgFxAu1", "playlist_items_1xnKqEZDpMWvrts4M9I9GC"]
+            for item in load_spotify_response(f"{template}_page_{page_number}")["items"]
+        ]
+
+        tracks = await TrackModelFactory.create_batch_from_provider_ids_async(
+            provider_ids,
+            user_id=user.id,
+            is_top=False,
+            is_saved=False,
+        )
+        return [track.to_entity() for track in tracks]
 
     @pytest.fixture
     async def tracks_delete(self, user: User) -> list[Track]:
@@ -174,11 +169,13 @@ class TestSpotifySyncMusic:
         spotify_library: SpotifyLibraryAdapter,
         artist_repository: ArtistRepository,
         track_repository: TrackRepository,
+        playlist_snapshot_repository: PlaylistSnapshotRepository,
     ) -> ProviderSyncLibraryUseCase:
         return ProviderSyncLibraryUseCase(
             provider_library=spotify_library,
             artist_repository=artist_repository,
             track_repository=track_repository,
+            playlist_snapshot_repository=playlist_snapshot_repository,
         )
 
     async def test__artists__purge(
@@ -197,8 +194,7 @@ class TestSpotifySyncMusic:
         assert report == SyncReport(purge_artist=len(artists_top_delete))
 
         stmt = select(func.count()).select_from(ArtistModel).where(ArtistModel.user_id == user.id)
-        result = await async_session_db.execute(stmt)
-        assert result.scalar() == 0
+        assert await async_session_db.scalar(stmt) == 0
 
     @pytest.mark.parametrize(
         ("purge_track_top", "purge_track_saved", "purge_track_playlist", "expected_purged_track"),
@@ -236,8 +232,7 @@ class TestSpotifySyncMusic:
         assert report == SyncReport(purge_track=expected_purged_track)
 
         stmt = select(func.count()).select_from(TrackModel).where(TrackModel.user_id == user.id)
-        result = await async_session_db.execute(stmt)
-        remaining_count = result.scalar()
+        remaining_count = await async_session_db.scalar(stmt)
         assert remaining_count == total_user - expected_purged_track
 
     async def test__artists_top__sync__create(
@@ -259,8 +254,7 @@ class TestSpotifySyncMusic:
         assert report == SyncReport(artist_created=expected_count)
 
         stmt = select(func.count()).select_from(ArtistModel).where(ArtistModel.user_id == user.id)
-        result = await async_session_db.execute(stmt)
-        assert result.scalar() == expected_count
+        assert await async_session_db.scalar(stmt) == expected_count
 
     async def test__artists_top__sync__update(
         self,
@@ -281,17 +275,23 @@ class TestSpotifySyncMusic:
         )
         assert report == SyncReport(artist_updated=expected_count)
 
-        stmt = select(ArtistModel).where(ArtistModel.user_id == user.id)
-        result = await async_session_db.execute(stmt)
-        artists_db = result.scalars().all()
+        stmt = select(ArtistModel.id).where(ArtistModel.user_id == user.id)
+        artist_ids_db = (await async_session_db.scalars(stmt)).all()
 
-        assert len(artists_db) == expected_count == 15
-        assert sorted([a.id for a in artists_db]) == sorted([a.id for a in artists_update])
+        assert len(artist_ids_db) == expected_count == 15
+        assert set(artist_ids_db) == {a.id for a in artists_update}
 
-    async def test__tracks_top__sync__create(
+    @pytest.mark.parametrize(
+        ("sync_track_top", "sync_track_saved"),
+        [(True, False), (False, True)],
+        ids=["top", "saved"],
+    )
+    async def test__tracks__sync__create(
         self,
         async_session_db: AsyncSession,
         user: User,
+        sync_track_top: bool,
+        sync_track_saved: bool,
         use_case: ProviderSyncLibraryUseCase,
     ) -> None:
         page_size = DEFAULT_PAGINATION_SIZE
@@ -300,7 +300,8 @@ class TestSpotifySyncMusic:
         report = await use_case.execute(
             user=user,
             config=SyncConfig(
-                sync_track_top=True,
+                sync_track_top=sync_track_top,
+                sync_track_saved=sync_track_saved,
                 page_size=page_size,
             ),
         )
@@ -311,78 +312,34 @@ class TestSpotifySyncMusic:
         tracks_db = result.scalars().all()
 
         assert len(tracks_db) == expected_count
-        assert all([track.is_top for track in tracks_db])
-        assert not all([track.is_saved for track in tracks_db])
-
-    async def test__tracks_top__sync__update(
-        self,
-        async_session_db: AsyncSession,
-        user: User,
-        tracks_top_update: list[Track],
-        use_case: ProviderSyncLibraryUseCase,
-    ) -> None:
-        page_size = DEFAULT_PAGINATION_SIZE
-        expected_count = len(tracks_top_update)
-
-        report = await use_case.execute(
-            user=user,
-            config=SyncConfig(
-                sync_track_top=True,
-                page_size=page_size,
-            ),
-        )
-        assert report == SyncReport(track_updated=expected_count)
+        assert all(track.is_top for track in tracks_db) is sync_track_top
+        assert all(track.is_saved for track in tracks_db) is sync_track_saved
 
-        stmt = select(TrackModel).where(TrackModel.user_id == user.id)
-        result = await async_session_db.execute(stmt)
-        tracks_db = result.scalars().all()
-
-        assert len(tracks_db) == expected_count == 15
-        assert sorted([t.id for t in tracks_db]) == sorted([t.id for t in tracks_top_update])
-
-        assert all([track.is_top for track in tracks_db])
-        assert not all([track.is_saved for track in tracks_db])
-
-    async def test__tracks_saved__sync__create(
+    @pytest.mark.parametrize(
+        ("sync_track_top", "sync_track_saved", "tracks_fixture"),
+        [(True, False, "tracks_top_update"), (False, True, "tracks_saved_update")],
+        ids=["top", "saved"],
+    )
+    async def test__tracks__sync__update(
         self,
+        request: pytest.FixtureRequest,
         async_session_db: AsyncSession,
         user: User,
+        sync_track_top: bool,
+        sync_track_saved: bool,
+        tracks_fixture: str,
         use_case: ProviderSyncLibraryUseCase,
     ) -> None:
-        page_size = DEFAULT_PAGINATION_SIZE
-        expected_count = DEFAULT_PAGINATION_TOTAL
-
-        report = await use_case.execute(
-            user=user,
-            config=SyncConfig(
-                sync_track_saved=True,
-                page_size=page_size,
-            ),
-        )
-        assert report == SyncReport(track_created=expected_count)
+        tracks_update: list[Track] = request.getfixturevalue(tracks_fixture)
 
-        stmt = select(TrackModel).where(TrackModel.user_id == user.id)
-        result = await async_session_db.execute(stmt)
-        tracks_db = result.scalars().all()
-
-        assert len(tracks_db) == expected_count
-        assert not all([track.is_top for track in tracks_db])
-        assert all([track.is_saved for track in tracks_db])
-
-    async def test__tracks_saved__sync__update(
-        self,
-        async_session_db: AsyncSession,
-        user: User,
-        tracks_saved_update: list[Track],
-        use_case: ProviderSyncLibraryUseCase,
-    ) -> None:
         page_size = DEFAULT_PAGINATION_SIZE
-        expected_count = len(tracks_saved_update)
+        expected_count = len(tracks_update)
 
         report = await use_case.execute(
             user=user,
             config=SyncConfig(
-                sync_track_saved=True,
+                sync_track_top=sync_track_top,
+                sync_track_saved=sync_track_saved,
                 page_size=page_size,
             ),
         )
@@ -393,10 +350,10 @@ class TestSpotifySyncMusic:
         tracks_db = result.scalars().all()
 
         assert len(tracks_db) == expected_count == 15
-        assert sorted([t.id for t in tracks_db]) == sorted([t.id for t in tracks_saved_update])
+        assert {t.id for t in tracks_db} == {t.id for t in tracks_update}
 
-        assert not all([track.is_top for track in tracks_db])
-        assert all([track.is_saved for track in tracks_db])
+        assert all(track.is_top for track in tracks_db) is sync_track_top
+        assert all(track.is_saved for track in tracks_db) is sync_track_saved
 
     async def test__tracks_playlist__sync__create(
         self,
@@ -424,8 +381,8 @@ class TestSpotifySyncMusic:
         tracks_db = result.scalars().all()
 
         assert len(tracks_db) == expected_count
-        assert not all([track.is_top for track in tracks_db])
-        assert not all([track.is_saved for track in tracks_db])
+        assert not all(track.is_top for track in tracks_db)
+        assert not all(track.is_saved for track in tracks_db)
 
     async def test__tracks_playlist__sync__update(
         self,
@@ -451,10 +408,10 @@ class TestSpotifySyncMusic:
         tracks_db = result.scalars().all()
 
         assert len(tracks_db) == expected_count == 4
-        assert sorted([t.id for t in tracks_db]) == sorted([t.id for t in tracks_playlist_update])
+        assert {t.id for t in tracks_db} == {t.id for t in tracks_playlist_update}
 
-        assert not all([track.is_top for track in tracks_db])
-        assert not all([track.is_saved for track in tracks_db])
+        assert not all(track.is_top for track in tracks_db)
+        assert not all(track.is_saved for track in tracks_db)
 
     async def test__all__purge__sync(
         self,
@@ -487,12 +444,10 @@ class TestSpotifySyncMusic:
         )
 
         stmt = select(func.count()).select_from(ArtistModel).where(ArtistModel.user_id == user.id)
-        result = await async_session_db.execute(stmt)
-        assert result.scalar() == expect_artists
+        assert await async_session_db.scalar(stmt) == expect_artists
 
         stmt_track = select(func.count()).select_from(TrackModel).where(TrackModel.user_id == user.id)
-        result = await async_session_db.execute(stmt_track)
-        assert result.scalar() == expect_tracks
+        assert await async_session_db.scalar(stmt_track) == expect_tracks
 
         stmt = stmt_track.where(TrackModel.is_top.is_(True), TrackModel.is_saved.is_(False))
         result = await async_session_db.execute(stmt)
@@ -597,11 +552,9 @@ class TestSpotifySyncMusic:
         )
 
         stmt = select(func.count()).select_from(ArtistModel).where(ArtistModel.user_id == user.id)
-        result = await async_session_db.execute(stmt)
-        count = result.scalar()
+        count = await async_session_db.scalar(stmt)
         assert count == expect_artists_created + expect_artists_updated
 
         stmt = select(func.count()).select_from(TrackModel).where(TrackModel.user_id == user.id)
-        result = await async_session_db.execute(stmt)
-        count = result.scalar()
+        count = await async_session_db.scalar(stmt)
         assert count == expect_tracks_created + expect_tracks_updated
@@ -6,6 +6,7 @@ from pydantic import HttpUrl
 
 from sqlalchemy import make_url
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
@@ -19,6 +20,7 @@ from museflow.domain.entities.user import User
 from museflow.domain.ports.repositories.auth import OAuthProviderStateRepository
 from museflow.domain.ports.repositories.auth import OAuthProviderTokenRepository
 from museflow.domain.ports.repositories.music import ArtistRepository
+from museflow.domain.ports.repositories.music import PlaylistSnapshotRepository
 from museflow.domain.ports.repositories.music import TrackRepository
 from museflow.domain.ports.repositories.users import UserRepository
 from museflow.domain.ports.security import AccessTokenManagerPort
@@ -33,6 +35,7 @@ from museflow.infrastructure.adapters.database.models import Base
 from museflow.infrastructure.adapters.database.repositories.auth import OAuthProviderStateSQLRepository
 from museflow.infrastructure.adapters.database.repositories.auth import OAuthProviderTokenSQLRepository
 from museflow.infrastructure.adapters.database.repositories.music import ArtistSQLRepository
+from museflow.infrastructure.adapters.database.repositories.music import PlaylistSnapshotSQLRepository
 from museflow.infrastructure.adapters.database.repositories.music import TrackSQLRepository
 from museflow.infrastructure.adapters.database.repositories.users import UserSQLRepository
 from museflow.infrastructure.adapters.database.session import async_session_factory
@@ -59,7 +62,11 @@ from tests.unit.factories.schemas.user import UserUpdateFactory
 def test_db_name() -> str:
     if database_settings.URI is None or not database_settings.URI.path:
         pytest.exit("Missing DATABASE_URI env var (or composites)", 1)
-    return f"test_{database_settings.URI.path[1:]}"
+
+    # Give each pytest-xdist worker (if any) its own database, so they don't step on each other.
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    suffix = f"_{worker}" if worker else ""
+    return f"test_{database_settings.URI.path[1:]}{suffix}"
 
 
 @pytest.fixture(scope="session")
@@ -136,46 +143,49 @@ async def async_session_trans(async_engine: AsyncEngine) -> AsyncGenerator[Async
                 await conn.execute(text(f"TRUNCATE TABLE {table.name} RESTART IDENTITY CASCADE"))
 
 
+@pytest.fixture(scope="session")
+async def async_connection(async_engine: AsyncEngine) -> AsyncGenerator[AsyncConnection]:
+    """
+    Provides a single connection shared by the whole test session, to not checkout one per test.
+    """
+    async with async_engine.connect() as conn:
+        yield conn
+
+
 @pytest.fixture(scope="function", autouse=True)
 async def async_session_db(
-    async_engine: AsyncEngine,
+    async_connection: AsyncConnection,
     request: pytest.FixtureRequest,
 ) -> AsyncGenerator[AsyncSession | None]:
     """
     Provides the default async session wrapped in a transaction that rolls back.
 
-    This is the standard fixture for 99% of tests. It allows code to "commit" (flush),
+    This is the standard fixture for 99% of tests. It allows code to commit or rollback,
     but ultimately rolls back the entire transaction at the end of the test function.
 
     Behavior:
         - Faster than `async_session_trans` (no disk writes/truncate).
-        - Monkeypatches `session.commit` to `session.flush`.
+        - Session commits and rollbacks only release or rollback SAVEPOINTs.
     """
     # Check if the conflicting fixture is requested for this test
     if "async_session_trans" in request.fixturenames:
         yield None
         return
 
-    async with async_engine.connect() as conn:
-        # Begin a non-ORM transaction
-        transaction = await conn.begin()
-
-        # Create a session explicitly bound to this connection
-        async with async_session_factory(bind=conn) as async_session:
-            # Inject session into Polyfactory
-            BaseModelFactory.__async_session__ = async_session
+    # Begin a non-ORM transaction
+    transaction = await async_connection.begin()
 
-            # Monkeypatch commit to flush.
-            # This ensures that when the API or CLI calls 'await session.commit()',
-            # it only sends the SQL (flush) but DOES NOT close the transaction.
-            # The data is visible to subsequent selects in the test, but
-            # allows the rollback below to still work.
-            async_session.commit = async_session.flush
+    # Create a session explicitly bound to this connection, which runs its own transactions
+    # within SAVEPOINTs. This way, when the API or CLI calls 'await session.commit()', the data
+    # is visible to subsequent selects in the test, but the rollback below still discards it.
+    async with async_session_factory(bind=async_connection, join_transaction_mode="create_savepoint") as async_session:
+        # Inject session into Polyfactory
+        BaseModelFactory.__async_session__ = async_session
 
-            yield async_session
+        yield async_session
 
-        # Rollback the transaction
-        await transaction.rollback()
+    # Rollback the transaction
+    await transaction.rollback()
 
 
 # --- Security impl ---
@@ -224,6 +234,11 @@ def track_repository(async_session_db: AsyncSession) -> TrackRepository:
     return TrackSQLRepository(async_session_db)
 
 
+@pytest.fixture
+def playlist_snapshot_repository(async_session_db: AsyncSession) -> PlaylistSnapshotRepository:
+    return PlaylistSnapshotSQLRepository(async_session_db)
+
+
 # --- Entity factories ---
 
 
@@ -344,6 +359,26 @@ def spotify_wiremock() -> Iterable[WireMockContext]:
         yield wiremock_context
 
 
+@pytest.fixture
+def spotify_token_response(
+    spotify_client: SpotifyOAuthClientAdapter,
+    spotify_wiremock: WireMockContext,
+    token_payload: OAuthProviderTokenPayload,
+) -> None:
+    """Registers a successful response of the token endpoint, with the `token_payload` fixture."""
+    spotify_wiremock.create_mapping(
+        method="POST",
+        url_path=spotify_client.token_endpoint.path or "",
+        status=200,
+        json_body={
+            "token_type": token_payload.token_type,
+            "access_token": token_payload.access_token,
+            "refresh_token": token_payload.refresh_token,
+            "expires_in": 3600,
+        },
+    )
+
+
 # --- Security impl helper ---
 
 
@@ -47,6 +47,16 @@ class BaseMusicItemModelFactory[T: (Artist | Track)](BaseModelFactory[T]):
 
         return cast(list[T], await super().create_batch_async(size=size, **kwargs))
 
+    @classmethod
+    async def create_batch_from_provider_ids_async(cls, provider_ids: list[str], **kwargs: Any) -> list[T]:
+        """Persists one instance per provider ID, with a single flush for the whole batch."""
+        if "user_id" not in kwargs:
+            user = await UserModelFactory.create_async()
+            kwargs["user_id"] = user.id
+
+        instances = [cls.build(provider_id=provider_id, **kwargs) for provider_id in provider_ids]
+        return cast(list[T], await cls._get_async_persistence().save_many(data=instances))
+
 
 class ArtistModelFactory(BaseMusicItemModelFactory[Artist]):
     __model__ = Artist
@@ -3,6 +3,7 @@ from datetime import UTC
 from datetime import datetime
 
 from sqlalchemy import select
+from sqlalchemy import update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -77,6 +78,34 @@ class TestOAuthProviderStateSQLRepository:
         assert auth_state_duplicate.provider == auth_state.provider
         assert auth_state_duplicate.state == auth_state.state
 
+    @pytest.mark.parametrize(("refresh", "expected_state"), [(False, None), (True, "external-state")])
+    async def test_get__refresh(
+        self,
+        async_session_db: AsyncSession,
+        auth_state_repository: OAuthProviderStateRepository,
+        auth_state: OAuthProviderState,
+        refresh: bool,
+        expected_state: str | None,
+    ) -> None:
+        await auth_state_repository.get(user_id=auth_state.user_id, provider=auth_state.provider)
+
+        # Simulate an update made by another process, so not reflected in the identity map.
+        stmt = (
+            update(AuthProviderStateModel)
+            .where(AuthProviderStateModel.id == auth_state.id)
+            .values(state="external-state")
+            .execution_options(synchronize_session=False)
+        )
+        await async_session_db.execute(stmt)
+
+        auth_state_fetched = await auth_state_repository.get(
+            user_id=auth_state.user_id,
+            provider=auth_state.provider,
+            refresh=refresh,
+        )
+        assert auth_state_fetched is not None
+        assert auth_state_fetched.state == (expected_state or auth_state.state)
+
     async def test_get__invalid(
         self,
         auth_state_repository: OAuthProviderStateRepository,
@@ -9,19 +9,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import pytest
 
 from museflow.domain.entities.music import Artist
+from museflow.domain.entities.music import Playlist
 from museflow.domain.entities.music import Track
 from museflow.domain.entities.music import TrackArtist
 from museflow.domain.entities.user import User
 from museflow.domain.ports.repositories.music import ArtistRepository
+from museflow.domain.ports.repositories.music import PlaylistSnapshotRepository
 from museflow.domain.ports.repositories.music import TrackRepository
 from museflow.domain.types import SortOrder
 from museflow.domain.types import TrackOrderBy
 from museflow.infrastructure.adapters.database.models import Artist as ArtistModel
+from museflow.infrastructure.adapters.database.models import PlaylistSnapshot as PlaylistSnapshotModel
 from museflow.infrastructure.adapters.database.models import Track as TrackModel
 
 from tests.integration.factories.models.music import ArtistModelFactory
 from tests.integration.factories.models.music import TrackModelFactory
+from tests.integration.factories.models.user import UserModelFactory
 from tests.unit.factories.entities.music import ArtistFactory
+from tests.unit.factories.entities.music import PlaylistFactory
 from tests.unit.factories.entities.music import TrackFactory
 
 
@@ -176,13 +181,11 @@ class TestArtistSQLRepository:
 
         # Check if all artists have been deleted for that user.
         stmt = select(func.count()).select_from(ArtistModel).where(ArtistModel.user_id == user.id)
-        results = await async_session_db.execute(stmt)
-        assert results.scalar() == 0
+        assert await async_session_db.scalar(stmt) == 0
 
         # Be sure to keep other users items!
         stmt = select(func.count()).select_from(ArtistModel).where(ArtistModel.user_id != user.id)
-        results = await async_session_db.execute(stmt)
-        assert results.scalar() == 2
+        assert await async_session_db.scalar(stmt) == 2
 
 
 class TestTrackSQLRepository:
@@ -493,12 +496,78 @@ class TestTrackSQLRepository:
 
         # Check if all artists have been deleted for that user.
         stmt = select(func.count()).select_from(TrackModel).where(TrackModel.user_id == user.id)
-        results = await async_session_db.execute(stmt)
-        remaining_count = results.scalar()
+        remaining_count = await async_session_db.scalar(stmt)
         assert remaining_count == expected_total_user_count - expected_count
 
         # Be sure to keep other users items!
         stmt = select(func.count()).select_from(TrackModel).where(TrackModel.user_id != user.id)
-        results = await async_session_db.execute(stmt)
-        remaining_other_count = results.scalar()
+        remaining_other_count = await async_session_db.scalar(stmt)
         assert remaining_other_count == expected_other_count
+
+
+class TestPlaylistSnapshotSQLRepository:
+    @pytest.fixture
+    async def playlists(self, user: User, playlist_snapshot_repository: PlaylistSnapshotRepository) -> list[Playlist]:
+        playlists = PlaylistFactory.batch(size=3, user_id=user.id)
+        await playlist_snapshot_repository.replace(user_id=user.id, playlists=playlists)
+        return playlists
+
+    @pytest.fixture
+    async def playlists_other(self, playlist_snapshot_repository: PlaylistSnapshotRepository) -> list[Playlist]:
+        user_other = await UserModelFactory.create_async()
+        playlists = PlaylistFactory.batch(size=2, user_id=user_other.id)
+        await playlist_snapshot_repository.replace(user_id=user_other.id, playlists=playlists)
+        return playlists
+
+    async def test__get_snapshot_ids__none(
+        self,
+        user: User,
+        playlist_snapshot_repository: PlaylistSnapshotRepository,
+    ) -> None:
+        assert await playlist_snapshot_repository.get_snapshot_ids(user.id) == {}
+
+    async def test__get_snapshot_ids__nominal(
+        self,
+        user: User,
+        playlists: list[Playlist],
+        playlists_other: list[Playlist],
+        playlist_snapshot_repository: PlaylistSnapshotRepository,
+    ) -> None:
+        snapshot_ids = await playlist_snapshot_repository.get_snapshot_ids(user.id)
+        assert snapshot_ids == {playlist.provider_id: playlist.snapshot_id for playlist in playlists}
+
+    async def test__replace(
+        self,
+        user: User,
+        playlists: list[Playlist],
+        playlist_snapshot_repository: PlaylistSnapshotRepository,
+    ) -> None:
+        playlists_new = [
+            dataclasses.replace(playlists[0], snapshot_id="updated"),
+            PlaylistFactory.build(user_id=user.id),
+            PlaylistFactory.build(user_id=user.id, snapshot_id=None),
+        ]
+
+        await playlist_snapshot_repository.replace(user_id=user.id, playlists=playlists_new)
+
+        # Deleted playlists are removed, and playlists without snapshot are ignored.
+        snapshot_ids = await playlist_snapshot_repository.get_snapshot_ids(user.id)
+        assert snapshot_ids == {playlist.provider_id: playlist.snapshot_id for playlist in playlists_new[:2]}
+
+    async def test__purge(
+        self,
+        async_session_db: AsyncSession,
+        user: User,
+        playlists: list[Playlist],
+        playlists_other: list[Playlist],
+        playlist_snapshot_repository: PlaylistSnapshotRepository,
+    ) -> None:
+        count = await playlist_snapshot_repository.purge(user.id)
+        assert count == 3
+
+        stmt = select(func.count()).select_from(PlaylistSnapshotModel).where(PlaylistSnapshotModel.user_id == user.id)
+        assert await async_session_db.scalar(stmt) == 0
+
+        # Be sure to keep other users items!
+        stmt = select(func.count()).select_from(PlaylistSnapshotModel).where(PlaylistSnapshotModel.user_id != user.id)
+        assert await async_session_db.scalar(stmt) == 2
@@ -1,17 +1,17 @@
-import json
 import logging
 from typing import Any
 
 import pytest
 
+from museflow.domain.entities.music import Playlist
 from museflow.domain.entities.music import Track
 from museflow.domain.exceptions import ProviderPageValidationError
 from museflow.domain.types import MusicProvider
 from museflow.infrastructure.adapters.providers.spotify.library import SpotifyLibraryAdapter
 
-from tests import ASSETS_DIR
 from tests.integration.factories.models.music import TrackModelFactory
 from tests.integration.utils.wiremock import WireMockContext
+from tests.integration.utils.wiremock import load_spotify_response
 
 
 class TestSpotifyLibrary:
@@ -33,9 +33,7 @@ class TestSpotifyLibrary:
 
     @pytest.fixture
     def wiremock_response(self, request: pytest.FixtureRequest) -> dict[str, Any]:
-        filename = getattr(request, "param", "")
-        filepath = ASSETS_DIR / "wiremock" / "spotify" / "__files" / f"{filename}.json"
-        return json.loads(filepath.read_text())
+        return load_spotify_response(getattr(request, "param", ""))
 
     @pytest.fixture
     async def playlist_tracks(self) -> list[Track]:
@@ -345,11 +343,17 @@ class TestSpotifyLibrary:
             json_body=wiremock_response,
         )
 
+        skipped_playlists: list[Playlist] = []
         with caplog.at_level(logging.ERROR):
-            await spotify_library.get_playlist_tracks(page_size=page_size)
+            async for _ in spotify_library.iter_playlist_tracks(
+                page_size=page_size,
+                skipped_playlists=skipped_playlists,
+            ):
+                pass
 
         assert "Skip playlist Salsa with error" in caplog.text
         assert "Unsupported local files" in caplog.text
+        assert [playlist.name.strip() for playlist in skipped_playlists] == ["Salsa"]
 
     async def test__search__nominal(
         self,
@@ -11,7 +11,6 @@ from museflow.domain.entities.auth import OAuthProviderUserToken
 from museflow.domain.schemas.auth import OAuthProviderTokenPayload
 from museflow.domain.types import MusicProvider
 from museflow.infrastructure.adapters.database.models import AuthProviderToken as AuthProviderTokenModel
-from museflow.infrastructure.adapters.providers.spotify.client import SpotifyOAuthClientAdapter
 from museflow.infrastructure.adapters.providers.spotify.session import SpotifyOAuthSessionClient
 
 from tests.integration.utils.wiremock import WireMockContext
@@ -33,28 +32,17 @@ class TestSpotifyOAuthSessionClient:
             token_expires_at=frozen_time - timedelta(seconds=spotify_session_client.token_buffer_seconds + 20),
         )
 
+    @pytest.mark.usefixtures("spotify_token_response")
     async def test__execute__proactive_refresh(
         self,
         async_session_db: AsyncSession,
         frozen_time: datetime,
-        spotify_client: SpotifyOAuthClientAdapter,
         spotify_session_client: SpotifyOAuthSessionClient,
         auth_token_repository: mock.AsyncMock,
         token_payload: OAuthProviderTokenPayload,
         auth_token_expired: OAuthProviderUserToken,
         spotify_wiremock: WireMockContext,
     ) -> None:
-        spotify_wiremock.create_mapping(
-            method="POST",
-            url_path=spotify_client.token_endpoint.path or "",
-            status=200,
-            json_body={
-                "token_type": token_payload.token_type,
-                "access_token": token_payload.access_token,
-                "refresh_token": token_payload.refresh_token,
-                "expires_in": 3600,
-            },
-        )
         spotify_wiremock.create_mapping(
             method="GET",
             url_path="/test",
@@ -85,11 +73,10 @@ class TestSpotifyOAuthSessionClient:
         assert auth_token_db.token_refresh == token_payload.refresh_token
         assert auth_token_db.token_expires_at == frozen_time + timedelta(seconds=3600)
 
+    @pytest.mark.usefixtures("spotify_token_response")
     async def test__execute__reactive_refresh_on_401(
         self,
-        async_session_db: AsyncSession,
         frozen_time: datetime,
-        spotify_client: SpotifyOAuthClientAdapter,
         spotify_session_client: SpotifyOAuthSessionClient,
         auth_token_repository: mock.AsyncMock,
         token_payload: OAuthProviderTokenPayload,
@@ -105,17 +92,6 @@ class TestSpotifyOAuthSessionClient:
             required_state="Started",
             new_state="Authorized",
         )
-        spotify_wiremock.create_mapping(
-            method="POST",
-            url_path=spotify_client.token_endpoint.path or "",
-            status=200,
-            json_body={
-                "token_type": token_payload.token_type,
-                "access_token": token_payload.access_token,
-                "refresh_token": token_payload.refresh_token,
-                "expires_in": 3600,
-            },
-        )
         spotify_wiremock.create_mapping(
             method="GET",
             url_path="/test",
@@ -133,16 +109,4 @@ class TestSpotifyOAuthSessionClient:
         assert spotify_session_client.auth_token.token_refresh == token_payload.refresh_token
         assert spotify_session_client.auth_token.token_expires_at == frozen_time + timedelta(seconds=3600)
 
-        # Check that user token is refresh in DB.
-        stmt = select(AuthProviderTokenModel).where(
-            AuthProviderTokenModel.user_id == spotify_session_client.user.id,
-            AuthProviderTokenModel.provider == MusicProvider.SPOTIFY,
-        )
-        result = await async_session_db.execute(stmt)
-        auth_token_db = result.scalar_one()
-
-        assert auth_token_db is not None
-        assert auth_token_db.token_type == token_payload.token_type
-        assert auth_token_db.token_access == token_payload.access_token
-        assert auth_token_db.token_refresh == token_payload.refresh_token
-        assert auth_token_db.token_expires_at == frozen_time + timedelta(seconds=3600)
+        # Persistence of the refreshed token is the same as for the proactive refresh, checked above.
@@ -5,6 +5,7 @@ import pytest
 from museflow.domain.ports.security import AccessTokenManagerPort
 from museflow.domain.ports.security import PasswordHasherPort
 from museflow.domain.ports.security import StateTokenGeneratorPort
+from museflow.infrastructure.adapters.security import Argon2PasswordHasher
 
 
 class TestArgon2PasswordHasher:
@@ -17,6 +18,13 @@ class TestArgon2PasswordHasher:
         hashed_password = password_hasher.hash("blahblah")
         assert password_hasher.verify("testtest", hashed_password) is False
 
+    def test__hash__cost_parameters(self) -> None:
+        password_hasher = Argon2PasswordHasher(time_cost=1, memory_cost=8, parallelism=1)
+
+        hashed_password = password_hasher.hash("testtest")
+        assert "$m=8,t=1,p=1$" in hashed_password
+        assert password_hasher.verify("testtest", hashed_password) is True
+
 
 class TestJwtAccessTokenManager:
     @pytest.mark.parametrize("user_id", [uuid.uuid4()])
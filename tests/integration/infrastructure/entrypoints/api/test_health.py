@@ -6,6 +6,16 @@ from httpx import AsyncClient
 from museflow.infrastructure.entrypoints.api.main import app
 
 
+class TestLivenessCheck:
+    async def test_alive(self, mock_db_session: AsyncMock, async_client: AsyncClient) -> None:
+        url = app.url_path_for("liveness_check")
+        response = await async_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+
+        assert response.json() == {"status": "alive"}
+        mock_db_session.execute.assert_not_called()
+
+
 class TestHealthCheck:
     async def test_healthy(self, async_client: AsyncClient) -> None:
         url = app.url_path_for("health_check")
@@ -15,7 +15,7 @@ from museflow.domain.schemas.auth import OAuthProviderUserTokenCreate
 from museflow.domain.types import MusicProvider
 from museflow.infrastructure.adapters.database.models import AuthProviderState as AuthProviderStateModel
 from museflow.infrastructure.adapters.database.models import AuthProviderToken as AuthProviderTokenModel
-from museflow.infrastructure.entrypoints.cli.commands.spotify import connect_logic
+from museflow.infrastructure.entrypoints.cli.commands.spotify.connect import connect_logic
 
 
 class TestSpotifyConnectLogic:
@@ -7,7 +7,7 @@ from museflow.domain.entities.user import User
 from museflow.domain.ports.security import PasswordHasherPort
 from museflow.domain.schemas.user import UserUpdate
 from museflow.infrastructure.adapters.database.models import User as UserModel
-from museflow.infrastructure.entrypoints.cli.commands.users import user_update_logic
+from museflow.infrastructure.entrypoints.cli.commands.users.update import user_update_logic
 
 
 class TestUserUpdateLogic:
@@ -1,4 +1,8 @@
+import json
+from functools import cache
+from pathlib import Path
 from typing import Any
+from typing import Final
 from typing import Self
 
 import httpx
@@ -9,6 +13,23 @@ from wiremock.client import MappingResponse
 from wiremock.client import Mappings
 from wiremock.constants import Config
 
+from tests import ASSETS_DIR
+
+SPOTIFY_FILES_DIR: Final[Path] = ASSETS_DIR / "wiremock" / "spotify" / "__files"
+
+
+@cache
+def _read_spotify_file(filename: str) -> str:
+    return (SPOTIFY_FILES_DIR / f"{filename}.json").read_text()
+
+
+def load_spotify_response(filename: str) -> dict[str, Any]:
+    """Returns a fresh copy of a WireMock Spotify response, so that callers can mutate it.
+
+    Files are only read once, and decoding them again is cheaper than a deep copy.
+    """
+    return json.loads(_read_spotify_file(filename))
+
 
 class WireMockContext:
     def __init__(self, base_url: str) -> None:
@@ -1,6 +1,9 @@
+import asyncio
 import dataclasses
 import itertools
 import logging
+from collections.abc import AsyncIterator
+from collections.abc import Callable
 from typing import Any
 from typing import Final
 from unittest import mock
@@ -20,11 +23,13 @@ from museflow.application.use_cases.provider_sync_library import SyncConfig
 from museflow.application.use_cases.provider_sync_library import SyncReport
 from museflow.domain.entities.auth import OAuthProviderUserToken
 from museflow.domain.entities.music import Artist
+from museflow.domain.entities.music import Playlist
 from museflow.domain.entities.music import Track
 from museflow.domain.entities.user import User
 from museflow.domain.ports.providers.library import ProviderLibraryPort
 
 from tests.unit.factories.entities.music import ArtistFactory
+from tests.unit.factories.entities.music import PlaylistFactory
 from tests.unit.factories.entities.music import TrackFactory
 
 PURGE_FIELDS: Final[list[str]] = [f.name for f in dataclasses.fields(SyncConfig) if f.name.startswith("purge_")]
@@ -39,6 +44,15 @@ SYNC_ARGS_COMBINATIONS: Final[list[tuple[dict[str, bool], bool]]] = [({}, False)
 ]
 
 
+async def iter_chunks[T](chunks: list[list[T]] | Exception) -> AsyncIterator[list[T]]:
+    """Mimic a provider library stream, which may blow up while iterating."""
+    if isinstance(chunks, Exception):
+        raise chunks
+
+    for chunk in chunks:
+        yield chunk
+
+
 def validation_error() -> ValidationError:
     """
     Mimic a dummy Pydantic ValidationError with a KISS approach.
@@ -82,12 +96,20 @@ class TestSyncMusic:
         return TrackFactory.batch(size=10)
 
     @pytest.fixture
-    def mock_provider_library(self, artists: list[Artist], tracks: list[Track]) -> mock.Mock:
+    def playlists(self) -> list[Playlist]:
+        return PlaylistFactory.batch(size=3)
+
+    @pytest.fixture
+    def mock_provider_library(
+        self, artists: list[Artist], tracks: list[Track], playlists: list[Playlist]
+    ) -> mock.Mock:
         return mock.Mock(
             spec=ProviderLibraryPort,
-            get_top_artists=mock.AsyncMock(return_value=artists),
-            get_top_tracks=mock.AsyncMock(return_value=tracks),
-            get_saved_tracks=mock.AsyncMock(return_value=tracks),
+            get_playlists=mock.AsyncMock(return_value=playlists),
+            iter_top_artists=mock.Mock(side_effect=lambda **kwargs: iter_chunks([artists])),
+            iter_top_tracks=mock.Mock(side_effect=lambda **kwargs: iter_chunks([tracks])),
+            iter_saved_tracks=mock.Mock(side_effect=lambda **kwargs: iter_chunks([tracks])),
+            iter_playlist_tracks=mock.Mock(side_effect=lambda **kwargs: iter_chunks([tracks])),
         )
 
     @pytest.fixture
@@ -96,11 +118,13 @@ class TestSyncMusic:
         mock_provider_library: mock.Mock,
         mock_artist_repository: mock.AsyncMock,
         mock_track_repository: mock.AsyncMock,
+        mock_playlist_snapshot_repository: mock.AsyncMock,
     ) -> ProviderSyncLibraryUseCase:
         return ProviderSyncLibraryUseCase(
             provider_library=mock_provider_library,
             artist_repository=mock_artist_repository,
             track_repository=mock_track_repository,
+            playlist_snapshot_repository=mock_playlist_snapshot_repository,
         )
 
     async def test__do_nothing(
@@ -198,7 +222,7 @@ class TestSyncMusic:
         exception_raised: Exception,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
-        mock_provider_library.get_top_artists.side_effect = exception_raised
+        mock_provider_library.iter_top_artists.side_effect = lambda **kwargs: iter_chunks(exception_raised)
 
         with caplog.at_level(logging.ERROR):
             report = await use_case.execute(
@@ -268,7 +292,7 @@ class TestSyncMusic:
         exception_raised: Exception,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
-        mock_provider_library.get_top_tracks.side_effect = exception_raised
+        mock_provider_library.iter_top_tracks.side_effect = lambda **kwargs: iter_chunks(exception_raised)
 
         with caplog.at_level(logging.ERROR):
             report = await use_case.execute(
@@ -338,7 +362,7 @@ class TestSyncMusic:
         exception_raised: Exception,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
-        mock_provider_library.get_saved_tracks.side_effect = exception_raised
+        mock_provider_library.iter_saved_tracks.side_effect = lambda **kwargs: iter_chunks(exception_raised)
 
         with caplog.at_level(logging.ERROR):
             report = await use_case.execute(
@@ -408,7 +432,7 @@ class TestSyncMusic:
         exception_raised: Exception,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
-        mock_provider_library.get_playlist_tracks.side_effect = exception_raised
+        mock_provider_library.iter_playlist_tracks.side_effect = lambda **kwargs: iter_chunks(exception_raised)
 
         with caplog.at_level(logging.ERROR):
             report = await use_case.execute(
@@ -457,3 +481,202 @@ class TestSyncMusic:
         assert report == SyncReport(errors=mock.ANY)
         assert "An error occurred while saving playlist tracks." in report.errors
         assert f"An error occurred while upserting playlist tracks for user {user.id}" in caplog.text
+
+    async def test__fetch__concurrent(
+        self,
+        user: User,
+        use_case: ProviderSyncLibraryUseCase,
+        mock_provider_library: mock.Mock,
+        mock_artist_repository: mock.AsyncMock,
+        mock_track_repository: mock.AsyncMock,
+        tracks: list[Track],
+    ) -> None:
+        started: list[str] = []
+        all_started = asyncio.Event()
+
+        def fetch(name: str, result: list[Any]) -> Callable[..., AsyncIterator[list[Any]]]:
+            async def _fetch(**kwargs: Any) -> AsyncIterator[list[Any]]:
+                started.append(name)
+                if len(started) == 4:
+                    all_started.set()
+                # Would hang forever if stages were run one after the other.
+                await all_started.wait()
+                yield result
+
+            return _fetch
+
+        mock_provider_library.iter_top_artists.side_effect = fetch("top_artists", [])
+        mock_provider_library.iter_top_tracks.side_effect = fetch("top_tracks", [])
+        mock_provider_library.iter_saved_tracks.side_effect = fetch("saved_tracks", [])
+        mock_provider_library.iter_playlist_tracks.side_effect = fetch("playlist_tracks", tracks)
+        mock_track_repository.bulk_upsert.return_value = ([track.id for track in tracks], 4)
+
+        async with asyncio.timeout(1):
+            report = await use_case.execute(user=user, config=SyncConfig(sync_all=True))
+
+        assert report == SyncReport(track_created=4, track_updated=len(tracks) - 4)
+        assert sorted(started) == ["playlist_tracks", "saved_tracks", "top_artists", "top_tracks"]
+        mock_artist_repository.bulk_upsert.assert_not_called()
+        mock_track_repository.bulk_upsert.assert_called_once_with(tracks=tracks, batch_size=300)
+
+    async def test__upsert__by_batches(
+        self,
+        user: User,
+        use_case: ProviderSyncLibraryUseCase,
+        mock_provider_library: mock.Mock,
+        mock_track_repository: mock.AsyncMock,
+        tracks: list[Track],
+    ) -> None:
+        chunks = [tracks[0:3], tracks[3:6], tracks[6:9], tracks[9:]]
+        mock_provider_library.iter_saved_tracks.side_effect = lambda **kwargs: iter_chunks(chunks)
+        mock_track_repository.bulk_upsert.side_effect = lambda tracks, batch_size: ([t.id for t in tracks], 1)
+
+        report = await use_case.execute(user=user, config=SyncConfig(sync_track_saved=True, batch_size=5))
+
+        assert report == SyncReport(track_created=2, track_updated=len(tracks) - 2)
+        assert [call.kwargs["tracks"] for call in mock_track_repository.bulk_upsert.call_args_list] == [
+            tracks[0:6],
+            tracks[6:],
+        ]
+
+    async def test__progress_callback(
+        self,
+        user: User,
+        use_case: ProviderSyncLibraryUseCase,
+        mock_provider_library: mock.Mock,
+        tracks: list[Track],
+    ) -> None:
+        chunks = [tracks[0:3], tracks[3:]]
+        mock_provider_library.iter_saved_tracks.side_effect = lambda **kwargs: iter_chunks(chunks)
+        progress_callback = mock.Mock()
+
+        await use_case.execute(
+            user=user,
+            config=SyncConfig(sync_track_saved=True),
+            progress_callback=progress_callback,
+        )
+
+        assert progress_callback.call_args_list == [
+            mock.call("saved tracks", 3),
+            mock.call("saved tracks", len(tracks) - 3),
+        ]
+
+    async def test__playlists__skip_unchanged(
+        self,
+        user: User,
+        use_case: ProviderSyncLibraryUseCase,
+        mock_provider_library: mock.Mock,
+        mock_track_repository: mock.AsyncMock,
+        mock_playlist_snapshot_repository: mock.AsyncMock,
+        playlists: list[Playlist],
+        tracks: list[Track],
+    ) -> None:
+        playlist_unchanged, playlist_changed, playlist_new = playlists
+        mock_playlist_snapshot_repository.get_snapshot_ids.return_value = {
+            playlist_unchanged.provider_id: playlist_unchanged.snapshot_id,
+            playlist_changed.provider_id: "outdated",
+        }
+        mock_track_repository.bulk_upsert.return_value = ([track.id for track in tracks], 0)
+
+        report = await use_case.execute(user=user, config=SyncConfig(sync_track_playlist=True))
+
+        assert report == SyncReport(track_updated=len(tracks))
+        mock_provider_library.iter_playlist_tracks.assert_called_once_with(
+            page_size=50,
+            playlists=[playlist_changed, playlist_new],
+            skipped_playlists=[],
+        )
+        mock_playlist_snapshot_repository.replace.assert_awaited_once_with(user_id=user.id, playlists=playlists)
+
+    async def test__playlists__snapshots_not_saved_on_skip(
+        self,
+        user: User,
+        use_case: ProviderSyncLibraryUseCase,
+        mock_provider_library: mock.Mock,
+        mock_track_repository: mock.AsyncMock,
+        mock_playlist_snapshot_repository: mock.AsyncMock,
+        playlists: list[Playlist],
+        tracks: list[Track],
+    ) -> None:
+        playlist_skipped = playlists[0]
+
+        async def iter_playlist_tracks(**kwargs: Any) -> AsyncIterator[list[Track]]:
+            kwargs["skipped_playlists"].append(playlist_skipped)
+            yield tracks
+
+        mock_provider_library.iter_playlist_tracks.side_effect = iter_playlist_tracks
+        mock_track_repository.bulk_upsert.return_value = ([track.id for track in tracks], 0)
+
+        report = await use_case.execute(user=user, config=SyncConfig(sync_track_playlist=True))
+
+        # The tracks of the skipped playlist must be fetched again on the next sync.
+        assert report == SyncReport(track_updated=len(tracks))
+        mock_playlist_snapshot_repository.replace.assert_awaited_once_with(user_id=user.id, playlists=playlists[1:])
+
+    async def test__playlists__snapshots_not_saved_on_error(
+        self,
+        user: User,
+        use_case: ProviderSyncLibraryUseCase,
+        mock_track_repository: mock.AsyncMock,
+        mock_playlist_snapshot_repository: mock.AsyncMock,
+    ) -> None:
+        mock_track_repository.bulk_upsert.side_effect = SQLAlchemyError("Boom")
+
+        report = await use_case.execute(user=user, config=SyncConfig(sync_track_playlist=True))
+
+        assert report.errors == ["An error occurred while saving playlist tracks."]
+        mock_playlist_snapshot_repository.replace.assert_not_called()
+
+    async def test__playlists__snapshots_error(
+        self,
+        user: User,
+        use_case: ProviderSyncLibraryUseCase,
+        mock_provider_library: mock.Mock,
+        mock_track_repository: mock.AsyncMock,
+        mock_playlist_snapshot_repository: mock.AsyncMock,
+        playlists: list[Playlist],
+        tracks: list[Track],
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        mock_playlist_snapshot_repository.get_snapshot_ids.side_effect = SQLAlchemyError("Boom")
+        mock_playlist_snapshot_repository.replace.side_effect = SQLAlchemyError("Boom")
+        mock_track_repository.bulk_upsert.return_value = ([track.id for track in tracks], 0)
+
+        with caplog.at_level(logging.ERROR):
+            report = await use_case.execute(user=user, config=SyncConfig(sync_track_playlist=True))
+
+        # Snapshots are just an optimization, so the sync goes on by fetching all playlists.
+        assert report == SyncReport(track_updated=len(tracks))
+        mock_provider_library.iter_playlist_tracks.assert_called_once_with(
+            page_size=50,
+            playlists=playlists,
+            skipped_playlists=[],
+        )
+        assert f"An error occurred while retrieving playlist snapshots for user {user.id}" in caplog.text
+        assert f"An error occurred while completing playlist tracks for user {user.id}" in caplog.text
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            SyncConfig(purge_all=True),
+            SyncConfig(purge_track_top=True),
+            SyncConfig(purge_track_saved=True),
+            SyncConfig(purge_track_playlist=True),
+        ],
+    )
+    async def test__purge__track__playlist_snapshots(
+        self,
+        user: User,
+        config: SyncConfig,
+        use_case: ProviderSyncLibraryUseCase,
+        mock_artist_repository: mock.AsyncMock,
+        mock_track_repository: mock.AsyncMock,
+        mock_playlist_snapshot_repository: mock.AsyncMock,
+    ) -> None:
+        mock_artist_repository.purge.return_value = 0
+        mock_track_repository.purge.return_value = 3
+
+        report = await use_case.execute(user=user, config=config)
+
+        assert report == SyncReport(purge_track=3)
+        mock_playlist_snapshot_repository.purge.assert_awaited_once_with(user_id=user.id)
@@ -12,6 +12,7 @@ from museflow.domain.ports.providers.client import ProviderOAuthClientPort
 from museflow.domain.ports.repositories.auth import OAuthProviderStateRepository
 from museflow.domain.ports.repositories.auth import OAuthProviderTokenRepository
 from museflow.domain.ports.repositories.music import ArtistRepository
+from museflow.domain.ports.repositories.music import PlaylistSnapshotRepository
 from museflow.domain.ports.repositories.music import TrackRepository
 from museflow.domain.ports.repositories.users import UserRepository
 from museflow.domain.ports.security import AccessTokenManagerPort
@@ -73,6 +74,11 @@ def mock_track_repository() -> mock.AsyncMock:
     return mock.AsyncMock(spec=TrackRepository)
 
 
+@pytest.fixture
+def mock_playlist_snapshot_repository() -> mock.AsyncMock:
+    return mock.AsyncMock(spec=PlaylistSnapshotRepository, get_snapshot_ids=mock.AsyncMock(return_value={}))
+
+
 # --- Entity Mocks ---
 
 
@@ -15,9 +15,9 @@ class TestOAuthProviderUserToken:
         ],
         indirect=["auth_token"],
     )
+    @pytest.mark.usefixtures("frozen_time")
     def test__is_expired(
         self,
-        frozen_time: datetime,
         auth_token: OAuthProviderUserToken,
         expected_bool: bool,
     ) -> None:
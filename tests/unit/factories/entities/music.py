@@ -2,6 +2,7 @@ from polyfactory import Use
 from polyfactory.factories.dataclass_factory import DataclassFactory
 
 from museflow.domain.entities.music import Artist
+from museflow.domain.entities.music import Playlist
 from museflow.domain.entities.music import Track
 
 
@@ -20,3 +21,12 @@ class ArtistFactory(BaseMusicItemFactory[Artist]):
 
 class TrackFactory(BaseMusicItemFactory[Track]):
     __model__ = Track
+
+
+class PlaylistFactory(DataclassFactory[Playlist]):
+    __model__ = Playlist
+
+    name = Use(DataclassFactory.__faker__.name)
+    snapshot_id = Use(DataclassFactory.__faker__.sha1)
+
+    tracks = Use(list[Track])
@@ -1,3 +1,5 @@
+import base64
+import contextlib
 from collections.abc import Iterable
 from datetime import datetime
 from datetime import timedelta
@@ -10,6 +12,8 @@ from urllib.parse import urlparse
 import httpx
 from httpx import codes
 
+from pydantic import HttpUrl
+
 import pytest
 from pytest_httpx import HTTPXMock
 
@@ -20,14 +24,31 @@ from museflow.infrastructure.adapters.providers.spotify.exceptions import Spotif
 
 class TestSpotifyOAuthClientAdapter:
     @pytest.fixture
-    def mock_tenacity_sleep(self) -> Iterable[None]:
+    def mock_tenacity_sleep(self) -> Iterable[mock.AsyncMock]:
         retry_controller = SpotifyOAuthClientAdapter.make_user_api_call.retry  # type: ignore[attr-defined]
         original_sleep = retry_controller.sleep
 
         retry_controller.sleep = mock.AsyncMock(return_value=None)
-        yield
+        yield retry_controller.sleep
         retry_controller.sleep = original_sleep
 
+    @pytest.mark.parametrize(("h2_installed", "expected_http2"), [(True, True), (False, False)])
+    def test__http2(self, h2_installed: bool, expected_http2: bool) -> None:
+        with mock.patch("importlib.util.find_spec", return_value=mock.Mock() if h2_installed else None):
+            with mock.patch("httpx.AsyncClient") as mock_async_client:
+                SpotifyOAuthClientAdapter(
+                    client_id="dummy-client-id",
+                    client_secret="dummy-client-secret",
+                    redirect_uri=HttpUrl("http://127.0.0.1:8000/api/v1/spotify/callback"),
+                    http2=True,
+                )
+
+        assert mock_async_client.call_args.kwargs["http2"] is expected_http2
+
+    def test__basic_auth_header(self, spotify_client: SpotifyOAuthClientAdapter) -> None:
+        credentials = base64.b64decode(spotify_client._basic_auth_header.removeprefix("Basic "))
+        assert credentials == b"dummy-client-id:dummy-client-secret"
+
     def test__get_authorization_url(self, spotify_client: SpotifyOAuthClientAdapter) -> None:
         spotify_token_payload = "dummy-token-payload"
 
@@ -70,7 +91,7 @@ class TestSpotifyOAuthClientAdapter:
             url=str(spotify_client.token_endpoint),
             method="POST",
             match_headers={
-                "Authorization": spotify_client._get_basic_auth_header(),
+                "Authorization": spotify_client._basic_auth_header,
                 "Content-Type": "application/x-www-form-urlencoded",
             },
             match_content=urlencode(form_data).encode("utf-8"),
@@ -119,7 +140,7 @@ class TestSpotifyOAuthClientAdapter:
             url=str(spotify_client.token_endpoint),
             method="POST",
             match_headers={
-                "Authorization": spotify_client._get_basic_auth_header(),
+                "Authorization": spotify_client._basic_auth_header,
                 "Content-Type": "application/x-www-form-urlencoded",
             },
             match_content=urlencode(form_data).encode("utf-8"),
@@ -143,6 +164,18 @@ class TestSpotifyOAuthClientAdapter:
         with pytest.raises(httpx.HTTPStatusError, match="Bad Request"):
             await spotify_client.refresh_access_token("dummy-refresh-token")
 
+    async def test__warm_up__nominal(self, spotify_client: SpotifyOAuthClientAdapter, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(url=str(spotify_client.base_url), method="HEAD", status_code=codes.UNAUTHORIZED)
+
+        await spotify_client.warm_up()
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test__warm_up__error(self, spotify_client: SpotifyOAuthClientAdapter, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_exception(httpx.ConnectError("Network down"))
+
+        # Must never fail, the real calls will deal with the errors.
+        await spotify_client.warm_up()
+
     @pytest.mark.parametrize("method", ["get", "post", "put", "patch", "delete", "head"])
     async def test__make_user_api_call__nominal(
         self,
@@ -226,6 +259,37 @@ class TestSpotifyOAuthClientAdapter:
         assert exc_info.value.response.status_code == codes.NOT_FOUND
         assert len(httpx_mock.get_requests()) == 1
 
+    @pytest.mark.parametrize(
+        ("status_code", "expected_level", "expected_traceback"),
+        [
+            pytest.param(codes.TOO_MANY_REQUESTS, "WARNING", False, id="rate_limit"),
+            pytest.param(codes.SERVICE_UNAVAILABLE, "WARNING", False, id="server_error"),
+            pytest.param(codes.NOT_FOUND, "ERROR", True, id="client_error"),
+        ],
+    )
+    async def test__make_user_api_call__log_level(
+        self,
+        spotify_client: SpotifyOAuthClientAdapter,
+        token_payload: OAuthProviderTokenPayload,
+        httpx_mock: HTTPXMock,
+        mock_tenacity_sleep: mock.AsyncMock,
+        caplog: pytest.LogCaptureFixture,
+        status_code: int,
+        expected_level: str,
+        expected_traceback: bool,
+    ) -> None:
+        httpx_mock.add_response(url=f"{spotify_client.base_url}/foo/bar", method="GET", status_code=status_code)
+        if not expected_traceback:  # Retried
+            httpx_mock.add_response(url=f"{spotify_client.base_url}/foo/bar", method="GET", json={"success": True})
+
+        with caplog.at_level("WARNING"):
+            with contextlib.suppress(httpx.HTTPStatusError):
+                await spotify_client.make_user_api_call(method="GET", endpoint="/foo/bar", token_payload=token_payload)
+
+        assert caplog.records[0].levelname == expected_level
+        assert (caplog.records[0].exc_info is not None) is expected_traceback
+        assert caplog.records[0].status_code == status_code  # type: ignore[attr-defined]
+
     async def test__make_user_api_call__retry__not_on_generic_error(
         self,
         spotify_client: SpotifyOAuthClientAdapter,
@@ -247,7 +311,7 @@ class TestSpotifyOAuthClientAdapter:
         spotify_client: SpotifyOAuthClientAdapter,
         token_payload: OAuthProviderTokenPayload,
         httpx_mock: HTTPXMock,
-        mock_tenacity_sleep: None,
+        mock_tenacity_sleep: mock.AsyncMock,
     ) -> None:
         httpx_mock.add_response(
             url=f"{spotify_client.base_url}/foo/bar",
@@ -279,7 +343,7 @@ class TestSpotifyOAuthClientAdapter:
         spotify_client: SpotifyOAuthClientAdapter,
         token_payload: OAuthProviderTokenPayload,
         httpx_mock: HTTPXMock,
-        mock_tenacity_sleep: None,
+        mock_tenacity_sleep: mock.AsyncMock,
     ) -> None:
         httpx_mock.add_exception(httpx.ConnectError("Network down"))
         httpx_mock.add_response(
@@ -302,7 +366,7 @@ class TestSpotifyOAuthClientAdapter:
         spotify_client: SpotifyOAuthClientAdapter,
         token_payload: OAuthProviderTokenPayload,
         httpx_mock: HTTPXMock,
-        mock_tenacity_sleep: None,
+        mock_tenacity_sleep: mock.AsyncMock,
     ) -> None:
         for _ in range(5):
             httpx_mock.add_response(
@@ -326,7 +390,7 @@ class TestSpotifyOAuthClientAdapter:
         spotify_client: SpotifyOAuthClientAdapter,
         token_payload: OAuthProviderTokenPayload,
         httpx_mock: HTTPXMock,
-        mock_tenacity_sleep: None,
+        mock_tenacity_sleep: mock.AsyncMock,
     ) -> None:
         retry_after: int = 1
         expected_attempt: int = 2  # One 429 then one 200
@@ -345,24 +409,110 @@ class TestSpotifyOAuthClientAdapter:
             json={"success": True},
         )
 
-        # We patch asyncio.sleep to check that OUR code called it (no tenacity's sleep handled by fixture).
-        with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock) as mock_sleep:
-            response = await spotify_client.make_user_api_call(
+        response = await spotify_client.make_user_api_call(
+            method="GET",
+            endpoint="/foo/bar",
+            token_payload=token_payload,
+        )
+        # Tenacity slept as Spotify asked us, instead of its own backoff.
+        mock_tenacity_sleep.assert_awaited_once_with(expected_wait)
+
+        assert response == {"success": True}
+        assert len(httpx_mock.get_requests()) == expected_attempt
+
+    async def test__make_user_api_call__retry__rate_limit__max_attempts_exceeded(
+        self,
+        spotify_client: SpotifyOAuthClientAdapter,
+        token_payload: OAuthProviderTokenPayload,
+        httpx_mock: HTTPXMock,
+        mock_tenacity_sleep: mock.AsyncMock,
+    ) -> None:
+        for _ in range(5):
+            httpx_mock.add_response(
+                url=f"{spotify_client.base_url}/foo/bar",
+                method="GET",
+                status_code=codes.TOO_MANY_REQUESTS,
+                headers={"Retry-After": "1"},
+            )
+
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            await spotify_client.make_user_api_call(
                 method="GET",
                 endpoint="/foo/bar",
                 token_payload=token_payload,
             )
-        mock_sleep.assert_any_call(expected_wait)
+
+        assert exc_info.value.response.status_code == codes.TOO_MANY_REQUESTS
+        assert len(httpx_mock.get_requests()) == 5
+
+    async def test__make_user_api_call__retry__server_error__with_header(
+        self,
+        spotify_client: SpotifyOAuthClientAdapter,
+        token_payload: OAuthProviderTokenPayload,
+        httpx_mock: HTTPXMock,
+        mock_tenacity_sleep: mock.AsyncMock,
+    ) -> None:
+        httpx_mock.add_response(
+            url=f"{spotify_client.base_url}/foo/bar",
+            method="GET",
+            status_code=codes.SERVICE_UNAVAILABLE,
+            headers={"Retry-After": "3"},
+        )
+        httpx_mock.add_response(
+            url=f"{spotify_client.base_url}/foo/bar",
+            method="GET",
+            status_code=codes.OK,
+            json={"success": True},
+        )
+
+        response = await spotify_client.make_user_api_call(
+            method="GET",
+            endpoint="/foo/bar",
+            token_payload=token_payload,
+        )
+        mock_tenacity_sleep.assert_awaited_once_with(4)
 
         assert response == {"success": True}
-        assert len(httpx_mock.get_requests()) == expected_attempt
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test__make_user_api_call__retry__rate_limit__header_too_long(
+        self,
+        spotify_client: SpotifyOAuthClientAdapter,
+        token_payload: OAuthProviderTokenPayload,
+        httpx_mock: HTTPXMock,
+        mock_tenacity_sleep: mock.AsyncMock,
+    ) -> None:
+        httpx_mock.add_response(
+            url=f"{spotify_client.base_url}/foo/bar",
+            method="GET",
+            status_code=codes.TOO_MANY_REQUESTS,
+            headers={"Retry-After": "86400"},
+        )
+        httpx_mock.add_response(
+            url=f"{spotify_client.base_url}/foo/bar",
+            method="GET",
+            status_code=codes.OK,
+            json={"success": True},
+        )
+
+        response = await spotify_client.make_user_api_call(
+            method="GET",
+            endpoint="/foo/bar",
+            token_payload=token_payload,
+        )
+        # Fell back to the capped backoff instead of sleeping for a whole day.
+        mock_tenacity_sleep.assert_awaited_once()
+        assert mock_tenacity_sleep.call_args.args[0] <= 30 + 0.5
+
+        assert response == {"success": True}
+        assert len(httpx_mock.get_requests()) == 2
 
     async def test__make_user_api_call__retry__rate_limit__without_header(
         self,
         spotify_client: SpotifyOAuthClientAdapter,
         token_payload: OAuthProviderTokenPayload,
         httpx_mock: HTTPXMock,
-        mock_tenacity_sleep: None,
+        mock_tenacity_sleep: mock.AsyncMock,
     ) -> None:
         httpx_mock.add_response(
             url=f"{spotify_client.base_url}/foo/bar",
@@ -1,11 +1,17 @@
+import asyncio
+from collections.abc import Iterable
+from typing import Any
 from unittest import mock
 
+import httpx
+
 import pytest
 
 from museflow.domain.entities.auth import OAuthProviderUserToken
 from museflow.domain.entities.user import User
 from museflow.infrastructure.adapters.providers.spotify.library import SpotifyLibraryAdapter
 from museflow.infrastructure.adapters.providers.spotify.library import SpotifyLibraryFactory
+from museflow.infrastructure.adapters.providers.spotify.limiter import AdaptiveLimiter
 
 
 class TestSpotifyLibraryFactory:
@@ -30,3 +36,135 @@ class TestSpotifyLibraryFactory:
         assert isinstance(spotify_library, SpotifyLibraryAdapter)
         assert spotify_library.user == user
         assert spotify_library.session_client.auth_token == auth_token
+
+
+class TestSpotifyLibraryAdapter:
+    @staticmethod
+    def _build_page(offset: int, limit: int, total: int) -> dict[str, Any]:
+        return {
+            "items": [
+                {
+                    "id": f"artist-{i}",
+                    "name": f"Artist {i}",
+                    "href": f"https://api.spotify.com/v1/artists/artist-{i}",
+                    "popularity": 50,
+                    "genres": [],
+                }
+                for i in range(offset, min(offset + limit, total))
+            ],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+        }
+
+    @pytest.fixture
+    def mock_execute(self, spotify_library: SpotifyLibraryAdapter) -> Iterable[mock.AsyncMock]:
+        async def execute(method: str, endpoint: str, params: dict[str, Any], json_data: Any = None) -> dict[str, Any]:
+            return self._build_page(offset=params["offset"], limit=params["limit"], total=12)
+
+        with mock.patch.object(spotify_library.session_client, "execute", side_effect=execute) as mock_execute:
+            yield mock_execute
+
+    async def test__fetch_pages__concurrent(
+        self,
+        spotify_library: SpotifyLibraryAdapter,
+        mock_execute: mock.AsyncMock,
+    ) -> None:
+        artists = await spotify_library.get_top_artists(page_size=5)
+
+        assert mock_execute.call_count == 3
+        assert [call.kwargs["params"]["offset"] for call in mock_execute.call_args_list] == [0, 5, 10]
+        assert [artist.provider_id for artist in artists] == [f"artist-{i}" for i in range(12)]
+        assert [artist.top_position for artist in artists] == list(range(1, 13))
+
+    @pytest.mark.parametrize(("max_pages", "expected_calls"), [(0, 0), (1, 1), (2, 2)])
+    async def test__fetch_pages__max_pages(
+        self,
+        spotify_library: SpotifyLibraryAdapter,
+        mock_execute: mock.AsyncMock,
+        max_pages: int,
+        expected_calls: int,
+    ) -> None:
+        artists = await spotify_library.get_top_artists(page_size=5, max_pages=max_pages)
+
+        assert mock_execute.call_count == expected_calls
+        assert len(artists) == 5 * expected_calls
+
+    async def test__fetch_pages__error(self, spotify_library: SpotifyLibraryAdapter) -> None:
+        response = httpx.Response(status_code=404, request=httpx.Request("GET", "https://api.spotify.com"))
+
+        with mock.patch.object(
+            spotify_library.session_client,
+            "execute",
+            side_effect=[
+                self._build_page(offset=0, limit=5, total=12),
+                self._build_page(offset=5, limit=5, total=12),
+                httpx.HTTPStatusError("Boom", request=response.request, response=response),
+            ],
+        ):
+            with pytest.raises(httpx.HTTPStatusError, match="Boom"):
+                await spotify_library.get_top_artists(page_size=5)
+
+    @pytest.mark.parametrize(("status_code", "expected_shrink"), [(429, True), (500, True), (404, False)])
+    async def test__get_playlist_tracks__rate_limited(
+        self,
+        spotify_library: SpotifyLibraryAdapter,
+        status_code: int,
+        expected_shrink: bool,
+    ) -> None:
+        playlists_page = {
+            "items": [
+                {
+                    "id": "playlist-1",
+                    "name": "Playlist 1",
+                    "href": "https://api.spotify.com/v1/playlists/playlist-1",
+                    "snapshot_id": "snapshot",
+                    "public": False,
+                    "collaborative": False,
+                },
+            ],
+            "total": 1,
+            "limit": 50,
+            "offset": 0,
+        }
+        response = httpx.Response(status_code=status_code, request=httpx.Request("GET", "https://api.spotify.com"))
+
+        with (
+            mock.patch.object(
+                spotify_library.session_client,
+                "execute",
+                side_effect=[
+                    playlists_page,
+                    httpx.HTTPStatusError("Boom", request=response.request, response=response),
+                ],
+            ),
+            mock.patch.object(AdaptiveLimiter, "shrink", new_callable=mock.AsyncMock) as mock_shrink,
+        ):
+            with pytest.raises(httpx.HTTPStatusError, match="Boom"):
+                await spotify_library.get_playlist_tracks()
+
+        assert mock_shrink.called is expected_shrink
+
+    async def test__execute_request__limiter_shared(
+        self,
+        spotify_library: SpotifyLibraryAdapter,
+        mock_execute: mock.AsyncMock,
+    ) -> None:
+        spotify_library._limiter = AdaptiveLimiter(max_concurrency=2)
+        peak = 0
+
+        async def execute(**kwargs: Any) -> dict[str, Any]:
+            nonlocal peak
+            peak = max(peak, spotify_library._limiter.active)
+            await asyncio.sleep(0.01)
+            return self._build_page(offset=kwargs["params"]["offset"], limit=5, total=20)
+
+        mock_execute.side_effect = execute
+
+        # Run several endpoints at once, like the sync stages do.
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(spotify_library.get_top_artists(page_size=5))
+            tg.create_task(spotify_library.get_top_artists(page_size=5))
+
+        assert mock_execute.call_count == 8
+        assert peak == 2
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from museflow.infrastructure.adapters.providers.spotify.limiter import AdaptiveLimiter
+
+
+class TestAdaptiveLimiter:
+    @pytest.mark.parametrize(("max_concurrency", "min_concurrency"), [(0, 0), (1, 2)])
+    def test__init__invalid(self, max_concurrency: int, min_concurrency: int) -> None:
+        with pytest.raises(ValueError, match="Expected 1 <= min_concurrency <= max_concurrency."):
+            AdaptiveLimiter(max_concurrency=max_concurrency, min_concurrency=min_concurrency)
+
+    async def test__bounded(self) -> None:
+        limiter = AdaptiveLimiter(max_concurrency=3)
+        peak = 0
+
+        async def worker() -> None:
+            nonlocal peak
+            async with limiter:
+                peak = max(peak, limiter.active)
+                await asyncio.sleep(0.01)
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(10):
+                tg.create_task(worker())
+
+        assert peak == 3
+        assert limiter.active == 0
+
+    async def test__shrink(self) -> None:
+        limiter = AdaptiveLimiter(max_concurrency=8, min_concurrency=3)
+
+        await limiter.shrink()
+        assert limiter.limit == 4
+
+        await limiter.shrink()
+        assert limiter.limit == 3
+
+    async def test__grow(self) -> None:
+        limiter = AdaptiveLimiter(max_concurrency=2)
+        await limiter.shrink()
+        assert limiter.limit == 1
+
+        await limiter.grow()
+        assert limiter.limit == 2
+
+        await limiter.grow()
+        assert limiter.limit == 2
+
+    async def test__grow__window(self) -> None:
+        limiter = AdaptiveLimiter(max_concurrency=8)
+        await limiter.shrink()
+        await limiter.shrink()
+        assert limiter.limit == 2
+
+        # Additive increase: a whole window must succeed before growing by one.
+        await limiter.grow()
+        assert limiter.limit == 2
+
+        await limiter.grow()
+        assert limiter.limit == 3
+
+    async def test__grow__window_reset_on_shrink(self) -> None:
+        limiter = AdaptiveLimiter(max_concurrency=8)
+        await limiter.shrink()
+        assert limiter.limit == 4
+
+        for _ in range(3):
+            await limiter.grow()
+        await limiter.shrink()
+        assert limiter.limit == 2
+
+        # Successes before the failure don't count anymore.
+        await limiter.grow()
+        assert limiter.limit == 2
+
+    async def test__grow__wakes_up_waiter(self) -> None:
+        limiter = AdaptiveLimiter(max_concurrency=2)
+        await limiter.shrink()
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await limiter.grow()
+        await asyncio.wait_for(waiter, timeout=1)
+        assert limiter.active == 2
@@ -1,5 +1,6 @@
 import pytest
 
+from museflow.infrastructure.adapters.providers.spotify.mappers import _slugify
 from museflow.infrastructure.adapters.providers.spotify.mappers import to_domain_token_payload
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyToken
 
@@ -15,3 +16,15 @@ class TestToDomainTokenPayload:
 
         with pytest.raises(ValueError, match="Refresh token is missing from both response and existing state."):
             to_domain_token_payload(spotify_token)
+
+
+class TestSlugify:
+    def test__cached(self) -> None:
+        _slugify.cache_clear()
+
+        assert _slugify("Daft Punk") == "daft-punk"
+        assert _slugify("Daft Punk") == "daft-punk"
+
+        cache_info = _slugify.cache_info()
+        assert cache_info.hits == 1
+        assert cache_info.misses == 1
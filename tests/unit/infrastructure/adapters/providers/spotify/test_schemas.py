@@ -2,6 +2,7 @@ from datetime import datetime
 from datetime import timedelta
 from typing import Any
 
+from pydantic import BaseModel
 from pydantic import HttpUrl
 from pydantic import ValidationError
 
@@ -9,9 +10,14 @@ import pytest
 
 from museflow.domain.entities.user import User
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyArtist
+from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyArtistPage
+from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyPlaylistPage
+from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyPlaylistTrackPage
+from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifySavedTrackPage
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyToken
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyTrack
 from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyTrackArtist
+from museflow.infrastructure.adapters.providers.spotify.schemas import SpotifyTrackPage
 from museflow.infrastructure.adapters.providers.spotify.types import LocalUnsupported
 from museflow.infrastructure.adapters.providers.spotify.types import SpotifyScope
 
@@ -29,6 +35,23 @@ class TestSpotifyScope:
         )
 
 
+class TestSpotifySchemas:
+    @pytest.mark.parametrize(
+        "model",
+        [
+            SpotifyToken,
+            SpotifyArtistPage,
+            SpotifyTrackPage,
+            SpotifySavedTrackPage,
+            SpotifyPlaylistPage,
+            SpotifyPlaylistTrackPage,
+        ],
+    )
+    def test__built_at_import(self, model: type[BaseModel]) -> None:
+        # Validators must be ready before the first request, not lazily built during a sync.
+        assert model.__pydantic_complete__ is True
+
+
 class TestSpotifyArtist:
     def test__id__validation_error(self, user: User) -> None:
         with pytest.raises(ValidationError) as exc_info:
@@ -75,6 +98,18 @@ class TestSpotifyArtist:
 
 
 class TestSpotifyTrack:
+    def test__frozen(self) -> None:
+        track = SpotifyTrack(
+            id="foo",
+            name="Yé hô",
+            href=HttpUrl("https://spotify.com/foo"),
+            popularity=50,
+            is_local=False,
+            artists=[SpotifyTrackArtist(id="foo", name="foo")],
+        )
+        with pytest.raises(ValidationError, match="Instance is frozen"):
+            track.name = "bar"  # type: ignore[misc]
+
     def test__id__validation_error(self, user: User) -> None:
         with pytest.raises(ValidationError) as exc_info:
             SpotifyTrack(
@@ -137,7 +172,7 @@ class TestSpotifyTrack:
 
 
 class TestSpotifyToken:
-    def test_expires_in__invalid(self, frozen_time: datetime) -> None:
+    def test_expires_in__invalid(self) -> None:
         payload: dict[str, Any] = {
             "token_type": "bearer",
             "access_token": "dummy-access-token",
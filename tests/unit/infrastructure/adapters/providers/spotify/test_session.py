@@ -7,7 +7,9 @@ import pytest
 
 from museflow.domain.entities.auth import OAuthProviderUserToken
 from museflow.domain.entities.user import User
+from museflow.domain.mappers.auth import auth_token_update_from_token_payload
 from museflow.domain.schemas.auth import OAuthProviderTokenPayload
+from museflow.domain.types import MusicProvider
 from museflow.infrastructure.adapters.providers.spotify.exceptions import SpotifyTokenExpiredError
 from museflow.infrastructure.adapters.providers.spotify.session import SpotifyOAuthSessionClient
 
@@ -60,6 +62,27 @@ class TestSpotifyOAuthSessionClient:
 
         assert mock_provider_client.make_user_api_call.call_count == 2
 
+    async def test__execute__reactive_refresh(
+        self,
+        user: User,
+        session_client: SpotifyOAuthSessionClient,
+        mock_provider_client: mock.AsyncMock,
+        mock_auth_token_repository: mock.AsyncMock,
+        token_payload: OAuthProviderTokenPayload,
+    ) -> None:
+        mock_provider_client.make_user_api_call.side_effect = [SpotifyTokenExpiredError(), {}]
+        mock_provider_client.refresh_access_token.return_value = token_payload
+
+        await session_client.execute("GET", "/test")
+
+        assert session_client.auth_token.token_access == token_payload.access_token
+        assert session_client.auth_token.token_refresh == token_payload.refresh_token
+        mock_auth_token_repository.update.assert_awaited_once_with(
+            user_id=user.id,
+            provider=MusicProvider.SPOTIFY,
+            auth_token_data=auth_token_update_from_token_payload(token_payload),
+        )
+
     async def test__refresh_token_safely__reactive_skip(
         self,
         session_client: SpotifyOAuthSessionClient,
@@ -103,9 +126,9 @@ class TestSpotifyOAuthSessionClient:
         for i, call in enumerate(mock_provider_client.make_user_api_call.call_args_list):
             assert call.kwargs["token_payload"].access_token == token_payload.access_token, i
 
+    @pytest.mark.usefixtures("frozen_time")
     async def test__concurrency__reactive_refresh_locking(
         self,
-        frozen_time: datetime,
         session_client: SpotifyOAuthSessionClient,
         mock_provider_client: mock.AsyncMock,
         mock_auth_token_repository: mock.AsyncMock,
@@ -141,3 +164,57 @@ class TestSpotifyOAuthSessionClient:
 
         mock_provider_client.refresh_access_token.assert_called_once()
         assert mock_provider_client.make_user_api_call.call_count == 20  # 10 (initial failures) + 10 (retries)
+
+    @pytest.mark.parametrize(("expires_delta", "expected_refresh"), [(1, False), (0, True), (-1, True)])
+    async def test__execute__proactive_refresh_deadline(
+        self,
+        frozen_time: datetime,
+        session_client: SpotifyOAuthSessionClient,
+        mock_provider_client: mock.AsyncMock,
+        expires_delta: int,
+        expected_refresh: bool,
+    ) -> None:
+        session_client.auth_token = OAuthProviderUserTokenFactory.build(
+            token_expires_at=frozen_time + timedelta(seconds=session_client.token_buffer_seconds + expires_delta),
+        )
+        mock_provider_client.make_user_api_call.return_value = {}
+
+        await session_client.execute("GET", "/test")
+
+        assert mock_provider_client.refresh_access_token.called is expected_refresh
+
+    async def test__concurrency__refresh_shared_across_sessions(
+        self,
+        user: User,
+        session_client: SpotifyOAuthSessionClient,
+        mock_provider_client: mock.AsyncMock,
+        mock_auth_token_repository: mock.AsyncMock,
+        auth_token_expired: OAuthProviderUserToken,
+        token_payload: OAuthProviderTokenPayload,
+    ) -> None:
+        session_client.auth_token = auth_token_expired
+        other_session_client = SpotifyOAuthSessionClient(
+            user=user,
+            auth_token=auth_token_expired,
+            auth_token_repository=mock_auth_token_repository,
+            client=mock_provider_client,
+        )
+
+        async def slow_refresh(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return token_payload
+
+        mock_provider_client.refresh_access_token.side_effect = slow_refresh
+        mock_provider_client.make_user_api_call.return_value = {}
+
+        async with asyncio.TaskGroup() as tg:
+            for client in (session_client, other_session_client):
+                for _ in range(5):
+                    tg.create_task(client.execute("GET", "/test"))
+
+        mock_provider_client.refresh_access_token.assert_called_once()
+        mock_auth_token_repository.update.assert_called_once()
+
+        assert session_client.auth_token.token_access == token_payload.access_token
+        assert other_session_client.auth_token.token_access == token_payload.access_token
+        assert user.id not in SpotifyOAuthSessionClient._refresh_inflight
@@ -0,0 +1,23 @@
+import copy
+from unittest import mock
+
+from museflow.infrastructure.config.loggers import LOGGER_MUSEFLOW
+from museflow.infrastructure.config.loggers import configure_loggers
+from museflow.infrastructure.config.loggers import default_conf
+
+
+class TestConfigureLoggers:
+    def test__nominal(self) -> None:
+        default_conf_before = copy.deepcopy(default_conf)
+
+        with mock.patch("logging.config.dictConfig") as mock_dict_config:
+            configure_loggers(level="DEBUG", handlers=["null"], propagate=True)
+
+        conf = mock_dict_config.call_args.args[0]
+        assert conf["loggers"][LOGGER_MUSEFLOW]["level"] == "DEBUG"
+        assert conf["loggers"][LOGGER_MUSEFLOW]["propagate"] is True
+        assert {tuple(logger["handlers"]) for logger in conf["loggers"].values()} == {("null",)}
+        assert conf["root"]["handlers"] == ["null"]
+
+        # The default configuration is left untouched.
+        assert default_conf == default_conf_before
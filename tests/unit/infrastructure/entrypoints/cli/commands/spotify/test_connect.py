@@ -1,4 +1,7 @@
+import asyncio
+from collections.abc import AsyncGenerator
 from collections.abc import Iterable
+from contextlib import asynccontextmanager
 from typing import Any
 from typing import Final
 from unittest import mock
@@ -9,7 +12,7 @@ from typer.testing import CliRunner
 from museflow.domain.entities.auth import OAuthProviderState
 from museflow.domain.entities.user import User
 from museflow.domain.exceptions import UserNotFound
-from museflow.infrastructure.entrypoints.cli.commands.spotify import connect_logic
+from museflow.infrastructure.entrypoints.cli.commands.spotify.connect import connect_logic
 from museflow.infrastructure.entrypoints.cli.main import app
 
 from tests.unit.infrastructure.entrypoints.cli.conftest import TextCleaner
@@ -18,7 +21,7 @@ from tests.unit.infrastructure.entrypoints.cli.conftest import TextCleaner
 class TestSpotifyConnectParserCommand:
     @pytest.fixture(autouse=True)
     def mock_connect_logic(self) -> Iterable[mock.AsyncMock]:
-        target_path = "museflow.infrastructure.entrypoints.cli.commands.spotify.connect_logic"
+        target_path = "museflow.infrastructure.entrypoints.cli.commands.spotify.connect.connect_logic"
         with mock.patch(target_path, new_callable=mock.AsyncMock) as patched:
             yield patched
 
@@ -112,7 +115,7 @@ class TestSpotifyConnectParserCommand:
 class TestSpotifyConnectCommand:
     @pytest.fixture(autouse=True)
     def mock_connect_logic(self) -> Iterable[mock.AsyncMock]:
-        target_path = "museflow.infrastructure.entrypoints.cli.commands.spotify.connect_logic"
+        target_path = "museflow.infrastructure.entrypoints.cli.commands.spotify.connect.connect_logic"
         with mock.patch(target_path, new_callable=mock.AsyncMock) as patched:
             yield patched
 
@@ -180,6 +183,17 @@ class TestSpotifyConnectLogic:
         with mock.patch(f"{self.TARGET_PATH}.typer.launch") as patched:
             yield patched
 
+    @pytest.fixture(autouse=True)
+    def notifications(self) -> Iterable[asyncio.Queue[str]]:
+        queue: asyncio.Queue[str] = asyncio.Queue()
+
+        @asynccontextmanager
+        async def listen(*args: Any, **kwargs: Any) -> AsyncGenerator[asyncio.Queue[str]]:
+            yield queue
+
+        with mock.patch(f"{self.TARGET_PATH}.listen", listen):
+            yield queue
+
     async def test__user_not_found(self, mock_user_repository: mock.AsyncMock) -> None:
         mock_user_repository.get_by_email.return_value = None
 
@@ -202,3 +216,77 @@ class TestSpotifyConnectLogic:
         timeout = 0.1
         with pytest.raises(TimeoutError):
             await connect_logic(user.email, timeout=timeout, poll_interval=0.05)
+
+    async def test__notified(
+        self,
+        mock_user_repository: mock.AsyncMock,
+        mock_auth_state_repository: mock.AsyncMock,
+        mock_spotify_client: mock.Mock,
+        user: User,
+        notifications: asyncio.Queue[str],
+    ) -> None:
+        mock_user_repository.get_by_email.return_value = user
+        mock_auth_state_repository.get.return_value = None
+        mock_spotify_client.get_authorization_url.return_value = "http://example.com", "dummy-token-state"
+
+        # The state is checked as soon as notified, without waiting for the next poll.
+        notifications.put_nowait(str(user.id))
+        await asyncio.wait_for(connect_logic(user.email, timeout=60, poll_interval=30), timeout=1)
+
+        mock_auth_state_repository.get.assert_awaited_once()
+
+    async def test__poll__backoff(
+        self,
+        mock_user_repository: mock.AsyncMock,
+        mock_auth_state_repository: mock.AsyncMock,
+        mock_spotify_client: mock.Mock,
+        user: User,
+        auth_state: OAuthProviderState,
+    ) -> None:
+        mock_user_repository.get_by_email.return_value = user
+        mock_auth_state_repository.get.side_effect = [auth_state, auth_state, auth_state, auth_state, auth_state, None]
+        mock_spotify_client.get_authorization_url.return_value = "http://example.com", "dummy-token-state"
+
+        intervals: list[float] = []
+
+        async def wait_for(aw: Any, timeout: float) -> None:
+            aw.close()
+            intervals.append(timeout)
+            raise TimeoutError()
+
+        with (
+            mock.patch(f"{self.TARGET_PATH}.asyncio.wait_for", side_effect=wait_for),
+            mock.patch(f"{self.TARGET_PATH}.random.uniform", return_value=1.0),
+        ):
+            await connect_logic(user.email, timeout=60, poll_interval=0.5)
+
+        assert intervals == [0.5, 1.0, 2.0, 4.0, 5.0, 5.0]
+
+    async def test__poll__backoff__capped(
+        self,
+        mock_user_repository: mock.AsyncMock,
+        mock_auth_state_repository: mock.AsyncMock,
+        mock_spotify_client: mock.Mock,
+        user: User,
+        auth_state: OAuthProviderState,
+    ) -> None:
+        mock_user_repository.get_by_email.return_value = user
+        # Long enough to overflow a float if the backoff was still growing once capped.
+        mock_auth_state_repository.get.side_effect = [auth_state] * 1100 + [None]
+        mock_spotify_client.get_authorization_url.return_value = "http://example.com", "dummy-token-state"
+
+        intervals: list[float] = []
+
+        async def wait_for(aw: Any, timeout: float) -> None:
+            aw.close()
+            intervals.append(timeout)
+            raise TimeoutError()
+
+        with (
+            mock.patch(f"{self.TARGET_PATH}.asyncio.wait_for", side_effect=wait_for),
+            mock.patch(f"{self.TARGET_PATH}.random.uniform", return_value=1.0),
+        ):
+            await connect_logic(user.email, timeout=60, poll_interval=0.5)
+
+        assert len(intervals) == 1101
+        assert intervals[-1] == 5.0
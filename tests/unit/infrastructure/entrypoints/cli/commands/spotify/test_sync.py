@@ -1,5 +1,6 @@
 from collections.abc import Iterable
 from itertools import combinations
+from pathlib import Path
 from typing import Any
 from typing import Final
 from typing import get_args
@@ -14,7 +15,7 @@ from museflow.domain.entities.user import User
 from museflow.domain.exceptions import ProviderAuthTokenNotFoundError
 from museflow.domain.exceptions import UserNotFound
 from museflow.infrastructure.adapters.providers.spotify.types import SpotifyTimeRange
-from museflow.infrastructure.entrypoints.cli.commands.spotify import sync_logic
+from museflow.infrastructure.entrypoints.cli.commands.spotify.sync import sync_logic
 from museflow.infrastructure.entrypoints.cli.main import app
 
 from tests.unit.infrastructure.entrypoints.cli.conftest import TextCleaner
@@ -45,7 +46,7 @@ SYNC_ARGS_COMBINATIONS: Final[list[list[str]]] = [
 class TestSpotifySyncParserCommand:
     @pytest.fixture(autouse=True)
     def mock_sync_logic(self) -> Iterable[mock.AsyncMock]:
-        target_path = "museflow.infrastructure.entrypoints.cli.commands.spotify.sync_logic"
+        target_path = "museflow.infrastructure.entrypoints.cli.commands.spotify.sync.sync_logic"
         with mock.patch(target_path, new_callable=mock.AsyncMock) as patched:
             patched.return_value = SyncReport()
             yield patched
@@ -180,11 +181,74 @@ class TestSpotifySyncParserCommand:
         output = clean_typer_text(result.output)
         assert expected_msg in output
 
+    def test__config__nominal(self, runner: CliRunner, tmp_path: Path, mock_sync_logic: mock.AsyncMock) -> None:
+        config_file = tmp_path / "sync.toml"
+        config_file.write_text('sync_all = true\npage_size = 20\ntime_range = "short_term"\nbatch_size = 100\n')
+
+        # fmt: off
+        result = runner.invoke(
+            app,
+            [
+                "spotify",
+                "sync",
+                "--email", "test@example.com",
+                "--config", str(config_file),
+                "--batch-size", "200",
+            ],
+        )
+        # fmt: on
+        assert result.exit_code == 0
+
+        mock_sync_logic.assert_called_once_with(
+            email="test@example.com",
+            config=SyncConfig(sync_all=True, page_size=20, time_range="short_term", batch_size=200),
+            progress_callback=mock.ANY,
+        )
+
+    @pytest.mark.parametrize(
+        ("content", "expected_msg"),
+        [
+            pytest.param("sync_all = ", "Invalid config file", id="toml"),
+            pytest.param("email = 'foo@example.com'", "Unknown option in config file: 'email'", id="unknown"),
+            pytest.param("page_size = 55", "55 is not in the range", id="page_size"),
+            pytest.param("time_range = 'foo'", f"'foo' is not one of {TIME_RANGE_OPTIONS_OUTPUT}", id="time_range"),
+        ],
+    )
+    def test__config__invalid(
+        self,
+        runner: CliRunner,
+        tmp_path: Path,
+        content: str,
+        expected_msg: str,
+        clean_typer_text: TextCleaner,
+    ) -> None:
+        config_file = tmp_path / "sync.toml"
+        config_file.write_text(content)
+
+        result = runner.invoke(
+            app,
+            ["spotify", "sync", "--email", "test@example.com", "--config", str(config_file)],
+        )
+        assert result.exit_code != 0
+
+        output = clean_typer_text(result.output)
+        assert expected_msg in output
+
+    def test__config__not_found(self, runner: CliRunner, tmp_path: Path, clean_typer_text: TextCleaner) -> None:
+        result = runner.invoke(
+            app,
+            ["spotify", "sync", "--email", "test@example.com", "--config", str(tmp_path / "missing.toml")],
+        )
+        assert result.exit_code != 0
+
+        output = clean_typer_text(result.output)
+        assert "Invalid value for '--config'" in output
+
 
 class TestSpotifySyncCommand:
     @pytest.fixture(autouse=True)
     def mock_sync_logic(self) -> Iterable[mock.AsyncMock]:
-        target_path = "museflow.infrastructure.entrypoints.cli.commands.spotify.sync_logic"
+        target_path = "museflow.infrastructure.entrypoints.cli.commands.spotify.sync.sync_logic"
         with mock.patch(target_path, new_callable=mock.AsyncMock) as patched:
             yield patched
 
@@ -282,6 +346,27 @@ class TestSpotifySyncCommand:
         assert "Synchronization successful in " in output
         assert "Artists purged 330" in output
 
+    def test__output__progress(
+        self,
+        mock_sync_logic: mock.AsyncMock,
+        runner: CliRunner,
+    ) -> None:
+        async def sync_logic(email: str, config: SyncConfig, progress_callback: Any) -> SyncReport:
+            progress_callback("top tracks", 50)
+            progress_callback("top tracks", 20)
+            progress_callback("saved tracks", 10)
+            return SyncReport(track_created=80)
+
+        mock_sync_logic.side_effect = sync_logic
+
+        with mock.patch("museflow.infrastructure.entrypoints.cli.commands.spotify.Progress.advance") as advance:
+            result = runner.invoke(app, ["spotify", "sync", "--email", "test@example.com", "--sync-all"])
+        assert result.exit_code == 0
+
+        assert [call.args[1] for call in advance.call_args_list] == [50, 20, 10]
+        assert advance.call_args_list[0].args[0] == advance.call_args_list[1].args[0]
+        assert advance.call_args_list[0].args[0] != advance.call_args_list[2].args[0]
+
     @pytest.mark.parametrize("cmd_args", PURGE_ARGS_COMBINATIONS)
     def test__output__purge_tracks(
         self,
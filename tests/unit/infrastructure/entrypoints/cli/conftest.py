@@ -12,12 +12,12 @@ from unittest import mock
 import pytest
 from typer.testing import CliRunner
 
-from museflow.domain.ports.providers.client import ProviderOAuthClientPort
 from museflow.domain.ports.repositories.auth import OAuthProviderStateRepository
 from museflow.domain.ports.repositories.auth import OAuthProviderTokenRepository
 from museflow.domain.ports.repositories.music import ArtistRepository
 from museflow.domain.ports.repositories.music import TrackRepository
 from museflow.domain.ports.repositories.users import UserRepository
+from museflow.infrastructure.adapters.providers.spotify.client import SpotifyOAuthClientAdapter
 
 type ContextPatcher = AbstractContextManager[mock.Mock]
 
@@ -180,7 +180,7 @@ def mock_spotify_client(
     target_path: str,
     mock_async_context_dependency_factory: AsyncDependencyPatcherFactory,
 ) -> Iterable[mock.Mock]:
-    client = mock.Mock(spec=ProviderOAuthClientPort)
+    client = mock.Mock(spec=SpotifyOAuthClientAdapter)
     with mock_async_context_dependency_factory(f"{target_path}.get_spotify_client", client) as mock_client:
         yield mock_client
 
@@ -0,0 +1,24 @@
+import asyncio
+from unittest import mock
+
+import pytest
+import uvloop
+
+from museflow.infrastructure.entrypoints.cli.runner import get_loop_factory
+from museflow.infrastructure.entrypoints.cli.runner import run
+
+
+class TestRunner:
+    @pytest.mark.parametrize(("enabled", "expected_loop_type"), [(True, uvloop.Loop), (False, asyncio.BaseEventLoop)])
+    def test__run(self, enabled: bool, expected_loop_type: type[asyncio.AbstractEventLoop]) -> None:
+        async def coro() -> asyncio.AbstractEventLoop:
+            return asyncio.get_running_loop()
+
+        with mock.patch("museflow.infrastructure.entrypoints.cli.runner.app_settings.CLI_UVLOOP", enabled):
+            loop = run(coro())
+
+        assert isinstance(loop, expected_loop_type)
+
+    def test__get_loop_factory__not_installed(self) -> None:
+        with mock.patch.dict("sys.modules", {"uvloop": None}):
+            assert get_loop_factory() is None